@@ -0,0 +1,69 @@
+"""
+Benchmark du temps d'import : coût de démarrage d'OpenRainflow
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+print("""
+╔═══════════════════════════════════════════════════════════════════╗
+║          BENCHMARK IMPORT - Temps de démarrage                    ║
+╚═══════════════════════════════════════════════════════════════════╝
+""")
+
+ROOT = Path(__file__).parent.parent
+N_REPEATS = 7
+
+# Chaque scénario est exécuté dans un nouvel interpréteur
+scenarios = [
+    ("python (référence)", "pass"),
+    ("import numpy", "import numpy"),
+    ("import openrainflow", "import openrainflow"),
+    ("from openrainflow import EurocodeCategory",
+     "from openrainflow import EurocodeCategory"),
+    ("from openrainflow import rainflow_count",
+     "from openrainflow import rainflow_count"),
+    ("import openrainflow.visualization",
+     "import openrainflow.visualization"),
+    ("1er appel rainflow_count",
+     "import openrainflow; openrainflow.rainflow_count([0.0, 1.0, 0.0, 2.0])"),
+]
+
+
+def measure(code: str) -> float:
+    """Temps médian (s) d'un interpréteur exécutant code."""
+    times = []
+    for _ in range(N_REPEATS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+print(f"Médiane sur {N_REPEATS} interpréteurs\n")
+print(f"{'Scénario':<45} {'Temps':>10}")
+print("-" * 57)
+
+baseline = None
+for label, code in scenarios:
+    elapsed = measure(code)
+    if baseline is None:
+        baseline = elapsed
+        print(f"{label:<45} {elapsed * 1000:8.1f} ms")
+    else:
+        print(f"{label:<45} {elapsed * 1000:8.1f} ms  (+{(elapsed - baseline) * 1000:.1f} ms)")
+
+print("""
+Les sous-modules (et numba, matplotlib, joblib) sont chargés à la première
+utilisation : `import openrainflow` ne coûte que quelques millisecondes.
+""")
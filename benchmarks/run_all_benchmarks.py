@@ -18,6 +18,11 @@ benchmarks = [
     ('benchmark_speed.py', 'Vitesse d\'exécution'),
     ('benchmark_accuracy.py', 'Précision des résultats'),
     ('benchmark_memory.py', 'Utilisation mémoire'),
+    ('benchmark_import.py', 'Temps d\'import'),
+    ('benchmark_float32.py', 'Mode float32'),
+    ('benchmark_spectral.py', 'Estimateurs spectraux'),
+    ('benchmark_reliability.py', 'Fiabilité Monte Carlo'),
+    ('benchmark_reversals.py', 'Détection des rebroussements'),
 ]
 
 print("Benchmarks à exécuter:")
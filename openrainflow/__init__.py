@@ -11,17 +11,56 @@ __version__ = "1.0.0"
 __author__ = "OpenRainflow Contributors"
 __license__ = "MIT"
 
-from .rainflow import rainflow_count, rainflow_count_parallel
-from .damage import calculate_damage, calculate_life
-from .eurocode import EurocodeCategory, FatigueCurve
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING
 
-# Try to import visualization (optional dependency)
-try:
+# Submodules and their dependencies (numba, matplotlib, ...) are imported on
+# first attribute access, so `import openrainflow` stays cheap.
+_SUBMODULES = {
+    'rainflow', 'damage', 'eurocode', 'parallel', 'monitor', 'aio', 'jit',
+    'multiaxial', 'superposition', 'spectral', 'extrapolation', 'reliability',
+    'design', 'utils', 'visualization',
+}
+
+_ATTRIBUTES = {
+    'rainflow_count': 'rainflow',
+    'rainflow_count_parallel': 'rainflow',
+    'calculate_damage': 'damage',
+    'calculate_life': 'damage',
+    'EurocodeCategory': 'eurocode',
+    'FatigueCurve': 'eurocode',
+    'warmup': 'jit',
+}
+
+# Visualization is available when matplotlib is installed; without it,
+# openrainflow.visualization is None
+_HAS_VISUALIZATION = importlib.util.find_spec('matplotlib') is not None
+
+if TYPE_CHECKING:
+    from .rainflow import rainflow_count, rainflow_count_parallel
+    from .damage import calculate_damage, calculate_life
+    from .eurocode import EurocodeCategory, FatigueCurve
+    from .jit import warmup
     from . import visualization
-    _HAS_VISUALIZATION = True
-except ImportError:
-    _HAS_VISUALIZATION = False
-    visualization = None
+
+
+def __getattr__(name):
+    if name in _ATTRIBUTES:
+        module = importlib.import_module('.' + _ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    elif name == 'visualization' and not _HAS_VISUALIZATION:
+        value = None
+    elif name in _SUBMODULES:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTES) | _SUBMODULES)
 
 __all__ = [
     "rainflow_count",
@@ -30,9 +69,9 @@ __all__ = [
     "calculate_life",
     "EurocodeCategory",
     "FatigueCurve",
+    "warmup",
     "__version__",
 ]
 
 if _HAS_VISUALIZATION:
     __all__.append("visualization")
-
@@ -0,0 +1,171 @@
+"""
+Asyncio-friendly wrappers for rainflow counting and fatigue analysis.
+
+The Numba kernels release the GIL, so running them in a thread pool keeps
+the event loop responsive while several channels are counted concurrently.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Iterable, List, Optional, Union
+
+import numpy as np
+
+from .rainflow import rainflow_count
+from .monitor import FatigueMonitor
+
+
+async def _run(executor: Optional[Executor], func, *args, **kwargs) -> Any:
+    """Run a blocking function in an executor from the running loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+async def rainflow_count_async(
+    signal: np.ndarray,
+    remove_zeros: bool = True,
+    gate: Optional[float] = None,
+    gate_mode: str = 'hysteresis',
+    executor: Optional[Executor] = None,
+    **count_kwargs
+) -> np.ndarray:
+    """
+    Perform rainflow counting without blocking the event loop.
+    
+    Args:
+        signal: Input time series data
+        remove_zeros: If True, remove zero-range cycles from results
+        gate: Optional minimum range threshold
+        gate_mode: 'hysteresis' or 'post' (see rainflow_count)
+        executor: Executor to run in (None for the loop's default thread pool)
+        **count_kwargs: Further rainflow_count options (dtype, scale, offset,
+                        return_indices, periodic)
+    
+    Returns:
+        cycles: Structured array as returned by rainflow_count
+    
+    Example:
+        >>> cycles = await rainflow_count_async(frame)
+    """
+    return await _run(
+        executor, rainflow_count, signal, remove_zeros, gate, gate_mode, **count_kwargs
+    )
+
+
+async def rainflow_count_many_async(
+    signals: List[np.ndarray],
+    remove_zeros: bool = True,
+    gate: Optional[float] = None,
+    gate_mode: str = 'hysteresis',
+    executor: Optional[Executor] = None,
+    max_concurrency: Optional[int] = None,
+    **count_kwargs
+) -> List[np.ndarray]:
+    """
+    Count many channels concurrently without blocking the event loop.
+    
+    Args:
+        signals: List of time series arrays
+        remove_zeros: If True, remove zero-range cycles from results
+        gate: Optional minimum range threshold
+        gate_mode: 'hysteresis' or 'post' (see rainflow_count)
+        executor: Executor to run in (None for the loop's default thread pool)
+        max_concurrency: Maximum number of channels in flight (None for no limit)
+        **count_kwargs: Further rainflow_count options (dtype, scale, offset,
+                        return_indices, periodic)
+    
+    Returns:
+        cycles_list: List of cycle arrays, one per input signal
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    
+    async def count_one(signal):
+        if semaphore is None:
+            return await rainflow_count_async(
+                signal, remove_zeros, gate, gate_mode, executor, **count_kwargs
+            )
+        async with semaphore:
+            return await rainflow_count_async(
+                signal, remove_zeros, gate, gate_mode, executor, **count_kwargs
+            )
+    
+    return list(await asyncio.gather(*(count_one(sig) for sig in signals)))
+
+
+async def analyze_async(
+    analyzer,
+    design_life: float = 1.0,
+    executor: Optional[Executor] = None,
+    **kwargs
+) -> dict:
+    """
+    Run ParallelFatigueAnalyzer.analyze without blocking the event loop.
+    
+    Args:
+        analyzer: Configured ParallelFatigueAnalyzer
+        design_life: Design life for assessment
+        executor: Executor to run in (None for the loop's default thread pool)
+        **kwargs: Additional arguments passed to analyze
+    
+    Returns:
+        Dictionary with results (see ParallelFatigueAnalyzer.analyze)
+    """
+    return await _run(executor, analyzer.analyze, design_life, **kwargs)
+
+
+async def stream_damage(
+    source: Union[AsyncIterator[np.ndarray], Iterable[np.ndarray]],
+    curves,
+    buffer_size: int = 4096,
+    partial_safety_factor: float = 1.0,
+    use_cutoff: bool = True,
+    executor: Optional[Executor] = None
+) -> AsyncIterator[dict]:
+    """
+    Accumulate damage over a chunked source, yielding a snapshot per chunk.
+    
+    Each chunk is pushed into a FatigueMonitor in the executor, so the
+    damage after every chunk equals counting the concatenated history.
+    Chunks of a regular iterable are also pulled in the executor, so a
+    blocking iterator does not stall the event loop.
+    
+    Args:
+        source: Async or regular iterable of sample chunks
+        curves: FatigueCurve, Eurocode category name, or a list of them
+        buffer_size: Ring buffer size of the monitor
+        partial_safety_factor: Partial safety factor for fatigue
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        executor: Executor to run in (None for the loop's default thread pool)
+    
+    Yields:
+        Snapshot dictionaries (see FatigueMonitor.snapshot)
+    
+    Example:
+        >>> async for state in stream_damage(read_frames(sock), '71'):
+        ...     print(state['damage'])
+    """
+    monitor = FatigueMonitor(
+        curves,
+        buffer_size=buffer_size,
+        partial_safety_factor=partial_safety_factor,
+        use_cutoff=use_cutoff
+    )
+    
+    def update(chunk):
+        monitor.push(chunk)
+        return monitor.snapshot()
+    
+    if hasattr(source, '__aiter__'):
+        async for chunk in source:
+            yield await _run(executor, update, chunk)
+    else:
+        # A regular iterator may block (file or socket reads), so each chunk
+        # is pulled in the executor rather than on the event loop thread
+        iterator = iter(source)
+        done = object()
+        while True:
+            chunk = await _run(executor, next, iterator, done)
+            if chunk is done:
+                break
+            yield await _run(executor, update, chunk)
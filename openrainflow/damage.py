@@ -12,10 +12,11 @@ where:
 
 import numpy as np
 from typing import Union, Optional, Tuple
-from numba import njit
+from numba import njit, prange
 import warnings
 
 from .eurocode import FatigueCurve
+from .rainflow import count_block_sequence
 
 
 def calculate_damage(
@@ -51,25 +52,14 @@ def calculate_damage(
     if len(cycles) == 0:
         return 0.0
     
-    # Extract stress ranges and cycle counts
-    stress_ranges = cycles['range'] * partial_safety_factor
-    cycle_counts = cycles['count']
-    
-    # Get number of cycles to failure for each stress range
-    N_f = fatigue_curve.get_cycles_to_failure(stress_ranges, use_cutoff=use_cutoff)
+    # float32 and float64 cycles are read in place by the kernel, which
+    # accumulates in float64 with compensated summation
+    C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L = _curve_parameters(fatigue_curve)
     
-    # Calculate damage contribution from each cycle
-    # Handle infinite life (below CAFL)
-    damage_increments = np.where(
-        np.isinf(N_f),
-        0.0,
-        cycle_counts / N_f
+    return _damage_sum(
+        cycles['range'], cycles['count'], partial_safety_factor,
+        C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff
     )
-    
-    # Sum total damage
-    total_damage = np.sum(damage_increments)
-    
-    return total_damage
 
 
 def calculate_life(
@@ -93,6 +83,11 @@ def calculate_life(
         life: Number of repetitions of the load history until failure
               Returns inf if damage per cycle is zero
               
+    Note:
+        Count the history with rainflow_count(..., periodic=True) so the
+        residue is closed across repetitions instead of being counted as
+        half-cycles in every repetition.
+              
     Example:
         >>> life = calculate_life(cycles, curve)
         >>> print(f"Expected life: {life:.2e} repetitions")
@@ -110,7 +105,264 @@ def calculate_life(
     return failure_damage / damage_per_cycle
 
 
-@njit(cache=True)
+def calculate_sequence_damage(
+    blocks: list,
+    repetitions: list,
+    fatigue_curve: FatigueCurve,
+    use_cutoff: bool = True,
+    partial_safety_factor: float = 1.0,
+    periodic: bool = False
+) -> float:
+    """
+    Damage of a sequence of repeated load blocks.
+    
+    Equivalent to counting the concatenated history (e.g. 1000 x flight A
+    followed by 200 x flight B) without building it; see
+    count_block_sequence.
+    
+    Args:
+        blocks: List of load blocks (1D arrays)
+        repetitions: Number of consecutive repetitions of each block
+        fatigue_curve: FatigueCurve object
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        partial_safety_factor: Partial safety factor for fatigue
+        periodic: If True, return the damage of one sequence when the whole
+                  sequence repeats endlessly (residue closed across repeats)
+        
+    Returns:
+        D: Damage of the sequence
+        
+    Example:
+        >>> D = calculate_sequence_damage([flight_a, flight_b], [1000, 200], curve)
+    """
+    cycles = count_block_sequence(blocks, repetitions, periodic=periodic)
+    
+    return calculate_damage(cycles, fatigue_curve, use_cutoff, partial_safety_factor)
+
+
+def _curve_parameters(fatigue_curve: FatigueCurve) -> np.ndarray:
+    """
+    Pack the constants of an S-N curve for the JIT kernels.
+    
+    Args:
+        fatigue_curve: FatigueCurve object
+        
+    Returns:
+        Array [C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L]
+    """
+    return np.array([
+        fatigue_curve.C1,
+        fatigue_curve.m1,
+        fatigue_curve.C2,
+        fatigue_curve.m2,
+        fatigue_curve.delta_sigma_knee,
+        fatigue_curve.delta_sigma_L,
+    ], dtype=np.float64)
+
+
+def _per_item(value, n: int, name: str) -> np.ndarray:
+    """Broadcast a scalar, or check a per-item array, to n float64 values."""
+    value = np.asarray(value, dtype=np.float64)
+    if value.ndim == 0:
+        return np.full(n, float(value))
+    if value.shape != (n,):
+        raise ValueError(f"{name} must be a scalar or have shape ({n},)")
+    return np.ascontiguousarray(value)
+
+
+def _batch_curves(
+    fatigue_curves,
+    curve_index: Optional[np.ndarray],
+    partial_safety_factor: Union[float, np.ndarray],
+    n: int,
+    item: str = 'location'
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Curve inputs of the batch kernels for n locations (or nodes).
+    
+    Args:
+        fatigue_curves: FatigueCurve, or sequence of FatigueCurve objects
+        curve_index: Index into fatigue_curves per item (default: curve k
+                     for item k, or the single curve)
+        partial_safety_factor: Scalar or one value per item
+        n: Number of items
+        item: Item name used in error messages
+        
+    Returns:
+        curve_parameters: One row of _curve_parameters per curve
+        curve_index: int64 curve index per item
+        partial_safety_factor: float64 factor per item
+    """
+    if isinstance(fatigue_curves, FatigueCurve):
+        fatigue_curves = [fatigue_curves]
+    curve_parameters = np.array([_curve_parameters(c) for c in fatigue_curves])
+    
+    if curve_index is None:
+        if len(fatigue_curves) == 1:
+            curve_index = np.zeros(n, dtype=np.int64)
+        elif len(fatigue_curves) == n:
+            curve_index = np.arange(n)
+        else:
+            raise ValueError(
+                f"curve_index is required unless there is one curve or one per {item}"
+            )
+    curve_index = np.ascontiguousarray(curve_index, dtype=np.int64)
+    if curve_index.shape != (n,):
+        raise ValueError(f"curve_index must have shape ({n},)")
+    if np.any(curve_index < 0) or np.any(curve_index >= len(curve_parameters)):
+        raise ValueError("curve_index out of range")
+    
+    return (curve_parameters, curve_index,
+            _per_item(partial_safety_factor, n, 'partial_safety_factor'))
+
+
+@njit(cache=True, nogil=True)
+def _power(x: float, m: float) -> float:
+    """
+    JIT-compiled x ** m, with multiplications for the usual slopes 3 and 5.
+    
+    A general power costs about ten times more than a few multiplications
+    and dominates the damage kernels for the Eurocode slopes.
+    """
+    if m == 3.0:
+        return x * x * x
+    if m == 5.0:
+        x2 = x * x
+        return x2 * x2 * x
+    return x ** m
+
+
+@njit(cache=True, nogil=True)
+def _cycle_damage(
+    delta_sigma: float,
+    C1: float,
+    m1: float,
+    C2: float,
+    m2: float,
+    delta_sigma_knee: float,
+    delta_sigma_L: float,
+    use_cutoff: bool
+) -> float:
+    """
+    JIT-compiled damage of one full cycle (1 / N) on a bilinear S-N curve.
+    
+    Mirrors FatigueCurve.get_cycles_to_failure. Without cutoff, the m2
+    slope is extended below the CAFL.
+    
+    Args:
+        delta_sigma: Stress range (already factored)
+        C1, m1: Coefficient and slope above the knee point
+        C2, m2: Coefficient and slope below the knee point
+        delta_sigma_knee: Stress range at the knee point
+        delta_sigma_L: Constant amplitude fatigue limit
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        
+    Returns:
+        Damage of one full cycle
+    """
+    if delta_sigma <= 0.0:
+        return 0.0
+    if use_cutoff and delta_sigma < delta_sigma_L:
+        return 0.0
+    if delta_sigma >= delta_sigma_knee:
+        return _power(delta_sigma, m1) / C1
+    return _power(delta_sigma, m2) / C2
+
+
+@njit(cache=True, nogil=True)
+def _neumaier_add(total: float, compensation: float, value: float) -> Tuple[float, float]:
+    """
+    JIT-compiled compensated (Neumaier) addition of one value.
+    
+    A sum is carried as a (total, compensation) pair; total + compensation
+    is the accurate result. Pairs from independent partial sums can be
+    merged by adding one total (and both compensations) to the other.
+    
+    Returns:
+        Updated (total, compensation)
+    """
+    t = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - t) + value
+    else:
+        compensation += (value - t) + total
+    return t, compensation
+
+
+@njit(cache=True, nogil=True)
+def _damage_accumulate(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    partial_safety_factor: float,
+    C1: float,
+    m1: float,
+    C2: float,
+    m2: float,
+    delta_sigma_knee: float,
+    delta_sigma_L: float,
+    use_cutoff: bool,
+    state: np.ndarray
+):
+    """
+    JIT-compiled Miner sum over cycles into a compensated partial sum.
+    
+    Ranges and counts may be float32 or float64; each value is promoted to
+    float64 on the fly, so float32 cycles are never copied or upcast as a
+    whole. No sorting is needed: the compensation keeps the sum accurate
+    over very many increments of different magnitudes.
+    
+    Args:
+        stress_ranges: Cycle stress ranges
+        cycle_counts: Cycle counts (0.5 or 1.0)
+        partial_safety_factor: Factor applied to stress ranges
+        C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L: S-N curve constants
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        state: Partial sum [total, compensation], updated in place
+    """
+    total = state[0]
+    compensation = state[1]
+    
+    for i in range(len(stress_ranges)):
+        increment = cycle_counts[i] * _cycle_damage(
+            stress_ranges[i] * partial_safety_factor,
+            C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff
+        )
+        total, compensation = _neumaier_add(total, compensation, increment)
+    
+    state[0] = total
+    state[1] = compensation
+
+
+@njit(cache=True, nogil=True)
+def _damage_sum(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    partial_safety_factor: float,
+    C1: float,
+    m1: float,
+    C2: float,
+    m2: float,
+    delta_sigma_knee: float,
+    delta_sigma_L: float,
+    use_cutoff: bool
+) -> float:
+    """
+    JIT-compiled Miner sum over cycles with compensated summation.
+    
+    See _damage_accumulate for the arguments.
+    
+    Returns:
+        Total damage
+    """
+    state = np.zeros(2)
+    _damage_accumulate(
+        stress_ranges, cycle_counts, partial_safety_factor,
+        C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff, state
+    )
+    return state[0] + state[1]
+
+
+@njit(cache=True, nogil=True)
 def _damage_from_histogram(
     stress_ranges: np.ndarray,
     cycle_counts: np.ndarray,
@@ -128,12 +380,15 @@ def _damage_from_histogram(
         Total damage
     """
     total_damage = 0.0
+    compensation = 0.0
     
     for i in range(len(stress_ranges)):
         if cycle_counts[i] > 0 and not np.isinf(N_f[i]):
-            total_damage += cycle_counts[i] / N_f[i]
+            total_damage, compensation = _neumaier_add(
+                total_damage, compensation, cycle_counts[i] / N_f[i]
+            )
     
-    return total_damage
+    return total_damage + compensation
 
 
 def calculate_damage_from_histogram(
@@ -181,6 +436,214 @@ def calculate_damage_from_histogram(
     return _damage_from_histogram(stress_ranges_factored, cycle_counts, N_f)
 
 
+@njit(cache=True, nogil=True)
+def _damage_per_bucket(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    buckets: np.ndarray,
+    n_buckets: int,
+    partial_safety_factor: float,
+    C1: float,
+    m1: float,
+    C2: float,
+    m2: float,
+    delta_sigma_knee: float,
+    delta_sigma_L: float,
+    use_cutoff: bool
+) -> np.ndarray:
+    """
+    JIT-compiled Miner sums per bucket, one compensated sum per bucket.
+    
+    Args:
+        stress_ranges: Cycle stress ranges
+        cycle_counts: Cycle counts (0.5 or 1.0)
+        buckets: Bucket of each cycle (0 to n_buckets - 1)
+        n_buckets: Number of buckets
+        partial_safety_factor: Factor applied to stress ranges
+        C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L: S-N curve constants
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        
+    Returns:
+        Damage per bucket
+    """
+    state = np.zeros((n_buckets, 2))
+    
+    for i in range(len(stress_ranges)):
+        increment = cycle_counts[i] * _cycle_damage(
+            stress_ranges[i] * partial_safety_factor,
+            C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff
+        )
+        b = buckets[i]
+        state[b, 0], state[b, 1] = _neumaier_add(state[b, 0], state[b, 1], increment)
+    
+    return state[:, 0] + state[:, 1]
+
+
+def calculate_damage_per_bucket(
+    cycles: np.ndarray,
+    fatigue_curve: FatigueCurve,
+    bucket_size: Optional[int] = None,
+    bucket_ids: Optional[np.ndarray] = None,
+    n_buckets: Optional[int] = None,
+    use_cutoff: bool = True,
+    partial_safety_factor: float = 1.0
+) -> np.ndarray:
+    """
+    Attribute the damage of a counted history to time buckets.
+    
+    The history is counted once (cycles crossing bucket boundaries are
+    kept) and each cycle is attributed to the bucket of its closing
+    turning point, i.e. its 'end' sample index. The buckets sum to the
+    damage of the whole history.
+    
+    Args:
+        cycles: Structured array from rainflow_count(..., return_indices=True)
+        fatigue_curve: FatigueCurve object
+        bucket_size: Samples per bucket (e.g. 3600 * fs for hourly damage)
+        bucket_ids: Bucket of every sample of the signal (e.g. operating
+                    day), as non-negative integers. Alternative to bucket_size.
+        n_buckets: Number of buckets (default: up to the last bucket that
+                   holds a cycle). Pass ceil(len(signal) / bucket_size) to
+                   include trailing buckets without cycles.
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        partial_safety_factor: Partial safety factor for fatigue
+        
+    Returns:
+        Damage per bucket
+        
+    Raises:
+        ValueError: If the cycles carry no indices or the buckets are invalid
+        
+    Example:
+        >>> cycles = rainflow_count(signal, return_indices=True)
+        >>> hourly = calculate_damage_per_bucket(cycles, curve, bucket_size=int(3600 * fs))
+    """
+    if cycles.dtype.names is None or 'end' not in cycles.dtype.names:
+        raise ValueError(
+            "cycles have no sample indices. Count with rainflow_count(..., return_indices=True)"
+        )
+    if (bucket_size is None) == (bucket_ids is None):
+        raise ValueError("Give exactly one of bucket_size and bucket_ids")
+    
+    ends = cycles['end']
+    if bucket_size is not None:
+        if bucket_size < 1:
+            raise ValueError("bucket_size must be at least 1")
+        buckets = ends // int(bucket_size)
+    else:
+        bucket_ids = np.asarray(bucket_ids)
+        if bucket_ids.dtype.kind not in 'iu':
+            raise ValueError("bucket_ids must be integers")
+        if len(ends) > 0 and ends.max() >= len(bucket_ids):
+            raise ValueError("bucket_ids must have one entry per signal sample")
+        buckets = bucket_ids[ends]
+        if len(buckets) > 0 and buckets.min() < 0:
+            raise ValueError("bucket_ids must be non-negative")
+    
+    buckets = buckets.astype(np.int64)
+    needed = int(buckets.max()) + 1 if len(buckets) > 0 else 0
+    if n_buckets is None:
+        n_buckets = needed
+    elif n_buckets < needed:
+        raise ValueError(f"n_buckets={n_buckets} but the cycles reach bucket {needed - 1}")
+    
+    C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L = _curve_parameters(fatigue_curve)
+    
+    return _damage_per_bucket(
+        cycles['range'], cycles['count'], buckets, int(n_buckets), partial_safety_factor,
+        C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff
+    )
+
+
+class DamageAccumulator:
+    """
+    Running Miner damage sum over cycles arriving in chunks.
+    
+    The sum is kept as a compensated (total, compensation) pair, so
+    accumulating 10^9 tiny increments stays accurate without sorting.
+    Accumulators filled independently (per chunk, per worker) can be
+    merged; the result equals accumulating all cycles in one.
+    
+    Example:
+        >>> acc = DamageAccumulator(curve)
+        >>> for chunk in chunks:
+        ...     acc.add(rainflow_count(chunk))
+        >>> total = acc.merge(other_worker_acc).damage
+    """
+    
+    def __init__(
+        self,
+        fatigue_curve: FatigueCurve,
+        use_cutoff: bool = True,
+        partial_safety_factor: float = 1.0
+    ):
+        """
+        Initialize accumulator.
+        
+        Args:
+            fatigue_curve: FatigueCurve object
+            use_cutoff: If True, stress ranges below CAFL cause no damage
+            partial_safety_factor: Partial safety factor for fatigue
+        """
+        self.fatigue_curve = fatigue_curve
+        self.use_cutoff = use_cutoff
+        self.partial_safety_factor = partial_safety_factor
+        self._params = _curve_parameters(fatigue_curve)
+        # [total, compensation]
+        self._state = np.zeros(2)
+    
+    def add(self, cycles: np.ndarray) -> 'DamageAccumulator':
+        """
+        Add the damage of cycles.
+        
+        Args:
+            cycles: Structured array from rainflow_count
+            
+        Returns:
+            self
+        """
+        if len(cycles) > 0:
+            C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L = self._params
+            _damage_accumulate(
+                cycles['range'], cycles['count'], self.partial_safety_factor,
+                C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, self.use_cutoff,
+                self._state
+            )
+        return self
+    
+    def merge(self, other: 'DamageAccumulator') -> 'DamageAccumulator':
+        """
+        Add the partial sum of another accumulator.
+        
+        Args:
+            other: Accumulator with the same curve and settings
+            
+        Returns:
+            self
+        """
+        if (not np.array_equal(self._params, other._params)
+                or self.use_cutoff != other.use_cutoff
+                or self.partial_safety_factor != other.partial_safety_factor):
+            raise ValueError("Cannot merge accumulators with different curves or settings")
+        
+        total, compensation = _neumaier_add(
+            self._state[0], self._state[1] + other._state[1], other._state[0]
+        )
+        self._state[0] = total
+        self._state[1] = compensation
+        return self
+    
+    @property
+    def partial_sum(self) -> Tuple[float, float]:
+        """Compensated partial sum (total, compensation)."""
+        return float(self._state[0]), float(self._state[1])
+    
+    @property
+    def damage(self) -> float:
+        """Accumulated damage."""
+        return float(self._state[0] + self._state[1])
+
+
 def calculate_equivalent_stress(
     cycles: np.ndarray,
     fatigue_curve: FatigueCurve,
@@ -300,6 +763,159 @@ def assess_fatigue_safety(
     return utilization, assessment, details
 
 
+# Status codes of assess_fatigue_safety_batch, indexed by code
+ASSESSMENT_STATUS = ('PASS', 'WARNING', 'FAIL')
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _assess_batch(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    offsets: np.ndarray,
+    curve_parameters: np.ndarray,
+    curve_index: np.ndarray,
+    partial_safety_factor: np.ndarray,
+    design_life: np.ndarray,
+    use_cutoff: bool,
+    N_eq: float
+):
+    """
+    JIT-compiled fatigue assessment of many locations in parallel.
+    
+    Location k owns stress_ranges[offsets[k]:offsets[k + 1]] and uses the
+    curve curve_parameters[curve_index[k]]. Mirrors assess_fatigue_safety.
+    
+    Args:
+        stress_ranges: Stress ranges of all locations, concatenated
+        cycle_counts: Cycle counts of all locations, concatenated
+        offsets: Start of each location, plus the total length
+        curve_parameters: Rows of _curve_parameters, shape (n_curves, 6)
+        curve_index: Curve row per location
+        partial_safety_factor: Partial safety factor per location
+        design_life: Design life per location
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        N_eq: Cycle count of the equivalent stress range
+        
+    Returns:
+        damage, utilization, status, life, equivalent_stress, reserve_factor
+    """
+    n_locations = len(offsets) - 1
+    damage = np.zeros(n_locations)
+    utilization = np.zeros(n_locations)
+    status = np.zeros(n_locations, dtype=np.int8)
+    life = np.empty(n_locations)
+    equivalent_stress = np.zeros(n_locations)
+    reserve_factor = np.empty(n_locations)
+    
+    for k in prange(n_locations):
+        start = offsets[k]
+        end = offsets[k + 1]
+        C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L = curve_parameters[curve_index[k]]
+        
+        state = np.zeros(2)
+        _damage_accumulate(
+            stress_ranges[start:end], cycle_counts[start:end], partial_safety_factor[k],
+            C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff, state
+        )
+        d = state[0] + state[1]
+        damage[k] = d
+        
+        if d > 0.0:
+            life[k] = 1.0 / d
+            utilization[k] = design_life[k] / life[k]
+            reserve_factor[k] = 1.0 / utilization[k] if utilization[k] > 0.0 else np.inf
+        else:
+            life[k] = np.inf
+            reserve_factor[k] = np.inf
+        
+        if utilization[k] >= 1.0:
+            status[k] = 2
+        elif utilization[k] >= 0.8:
+            status[k] = 1
+        
+        # Equivalent stress with slope m1, as calculate_equivalent_stress
+        if end > start:
+            total = 0.0
+            for i in range(start, end):
+                total += cycle_counts[i] * _power(stress_ranges[i], m1)
+            equivalent_stress[k] = (total / N_eq) ** (1.0 / m1)
+    
+    return damage, utilization, status, life, equivalent_stress, reserve_factor
+
+
+def assess_fatigue_safety_batch(
+    cycles: np.ndarray,
+    offsets: np.ndarray,
+    fatigue_curves,
+    design_life: Union[float, np.ndarray] = 1.0,
+    partial_safety_factor: Union[float, np.ndarray] = 1.0,
+    use_cutoff: bool = True,
+    curve_index: Optional[np.ndarray] = None
+) -> dict:
+    """
+    Assess fatigue safety of many locations at once.
+    
+    Columnar counterpart of assess_fatigue_safety for FE post-processing:
+    the cycles of all locations are concatenated and located by offsets,
+    all locations are assessed in one parallel JIT kernel, and the results
+    are arrays instead of per-location strings and dictionaries.
+    
+    Args:
+        cycles: Cycles of all locations, concatenated (structured array
+                from rainflow_count)
+        offsets: Start index of each location in cycles, followed by
+                 len(cycles); shape (n_locations + 1,)
+        fatigue_curves: FatigueCurve, or sequence of FatigueCurve objects
+        design_life: Required number of repetitions of load history
+                     (scalar or one per location)
+        partial_safety_factor: Partial safety factor for fatigue (scalar
+                               or one per location)
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        curve_index: Index into fatigue_curves per location (default:
+                     curve k for location k, or the single curve)
+        
+    Returns:
+        Dictionary of arrays, one value per location:
+        damage, utilization, status (0 PASS, 1 WARNING, 2 FAIL, see
+        ASSESSMENT_STATUS), life, equivalent_stress, reserve_factor
+        
+    Example:
+        >>> per_location = [rainflow_count(s) for s in signals]
+        >>> offsets = np.concatenate([[0], np.cumsum([len(c) for c in per_location])])
+        >>> result = assess_fatigue_safety_batch(
+        ...     np.concatenate(per_location), offsets, curve, design_life=50
+        ... )
+        >>> n_failed = np.count_nonzero(result['status'] == 2)
+    """
+    offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+    if offsets.ndim != 1 or len(offsets) < 2:
+        raise ValueError("offsets must have n_locations + 1 entries")
+    if offsets[0] != 0 or offsets[-1] != len(cycles) or np.any(np.diff(offsets) < 0):
+        raise ValueError(
+            "offsets must start at 0, be non-decreasing and end at len(cycles)"
+        )
+    n_locations = len(offsets) - 1
+    
+    curve_parameters, curve_index, partial_safety_factor = _batch_curves(
+        fatigue_curves, curve_index, partial_safety_factor, n_locations
+    )
+    
+    damage, utilization, status, life, equivalent_stress, reserve_factor = _assess_batch(
+        cycles['range'], cycles['count'], offsets, curve_parameters, curve_index,
+        partial_safety_factor, _per_item(design_life, n_locations, 'design_life'),
+        use_cutoff, 2e6
+    )
+    
+    return {
+        'damage': damage,
+        'utilization': utilization,
+        'status': status,
+        'life': life,
+        'equivalent_stress': equivalent_stress,
+        'reserve_factor': reserve_factor,
+    }
+
+
 def damage_contribution_analysis(
     cycles: np.ndarray,
     fatigue_curve: FatigueCurve,
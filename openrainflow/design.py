@@ -0,0 +1,323 @@
+"""
+Inverse fatigue design: allowable load scale and minimum detail category.
+
+The Miner damage of a fixed set of cycles under a load scale factor s is a
+sum of power laws of s (slope m1 above the knee point, m2 below it), so
+it increases monotonically with s. The critical scale factor, where the
+utilization reaches 1.0, is found by Newton iterations on log(damage)
+against log(s), safeguarded by bisection; on each segment the damage is
+almost a single power law and a handful of damage evaluations suffice.
+
+Scaling delta_sigma_c of an S-N curve by a moves C1, C2, the knee point
+and the CAFL together, which is the same as scaling the loads by 1 / a.
+One critical scale factor per location therefore gives the required
+fatigue strength, and with it the minimum Eurocode detail category.
+"""
+
+import numpy as np
+from numba import njit, prange
+from typing import List, Optional, Union
+
+from .damage import _curve_parameters, _cycle_damage
+from .eurocode import EUROCODE_CATEGORIES, FatigueCurve
+
+
+@njit(cache=True, nogil=True)
+def _damage_and_exponent(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    scale: float,
+    C1: float,
+    m1: float,
+    C2: float,
+    m2: float,
+    delta_sigma_knee: float,
+    delta_sigma_L: float,
+    use_cutoff: bool
+):
+    """
+    Damage under a load scale factor and its local power-law exponent.
+    
+    Returns:
+        damage: Miner damage of the scaled cycles
+        exponent: d log(damage) / d log(scale), between m1 and m2
+    """
+    damage = 0.0
+    weighted = 0.0
+    for i in range(len(stress_ranges)):
+        delta_sigma = stress_ranges[i] * scale
+        d = cycle_counts[i] * _cycle_damage(
+            delta_sigma, C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff
+        )
+        damage += d
+        weighted += d * (m1 if delta_sigma >= delta_sigma_knee else m2)
+    
+    exponent = weighted / damage if damage > 0.0 else m1
+    return damage, exponent
+
+
+@njit(cache=True, nogil=True)
+def _critical_scale(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    target: float,
+    C1: float,
+    m1: float,
+    C2: float,
+    m2: float,
+    delta_sigma_knee: float,
+    delta_sigma_L: float,
+    use_cutoff: bool,
+    rtol: float,
+    max_iter: int
+) -> float:
+    """
+    Smallest load scale factor whose damage reaches target.
+    
+    Newton steps on log(damage) against log(scale) with a bracket
+    [lower, upper]; steps leaving the bracket are replaced by its
+    geometric mean. With the cut-off the damage jumps when a range
+    crosses the CAFL, and the jump point is returned.
+    
+    Returns:
+        Critical scale factor (inf if no cycle has a positive range)
+    """
+    s_max = 0.0
+    for i in range(len(stress_ranges)):
+        if cycle_counts[i] > 0.0 and stress_ranges[i] > s_max:
+            s_max = stress_ranges[i]
+    if s_max <= 0.0:
+        return np.inf
+    
+    lower = 0.0
+    upper = np.inf
+    scale = 1.0
+    if use_cutoff:
+        # No damage below the scale at which the largest range reaches the CAFL
+        scale = max(scale, delta_sigma_L / s_max)
+        lower = delta_sigma_L / s_max * (1.0 - rtol)
+    
+    for _ in range(max_iter):
+        damage, exponent = _damage_and_exponent(
+            stress_ranges, cycle_counts, scale,
+            C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff
+        )
+        if damage >= target:
+            upper = scale
+        else:
+            lower = scale
+        
+        if damage > 0.0 and abs(np.log(damage / target)) <= rtol:
+            return scale
+        if upper <= lower * (1.0 + rtol):
+            break
+        
+        if damage > 0.0:
+            step = scale * np.exp(np.log(target / damage) / exponent)
+        else:
+            step = 2.0 * scale
+        if not (lower < step < upper):
+            if upper == np.inf:
+                step = 2.0 * lower
+            elif lower == 0.0:
+                step = 0.5 * upper
+            else:
+                step = np.sqrt(lower * upper)
+        scale = step
+    
+    return upper
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _critical_scale_batch(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    offsets: np.ndarray,
+    target: float,
+    C1: float,
+    m1: float,
+    C2: float,
+    m2: float,
+    delta_sigma_knee: float,
+    delta_sigma_L: float,
+    use_cutoff: bool,
+    rtol: float,
+    max_iter: int
+) -> np.ndarray:
+    """
+    Critical scale factor of every location, in parallel.
+    
+    Location k owns stress_ranges[offsets[k]:offsets[k + 1]].
+    """
+    n_locations = len(offsets) - 1
+    scales = np.empty(n_locations)
+    for k in prange(n_locations):
+        start = offsets[k]
+        end = offsets[k + 1]
+        scales[k] = _critical_scale(
+            stress_ranges[start:end], cycle_counts[start:end], target,
+            C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff,
+            rtol, max_iter
+        )
+    return scales
+
+
+def _pack_locations(locations):
+    """
+    Flatten one or many locations into ranges, counts and offsets.
+    
+    A location is a cycle array from rainflow_count or a
+    (stress_ranges, cycle_counts) histogram. A single location is a cycle
+    array or a histogram tuple; many locations are given as a list.
+    
+    Returns:
+        stress_ranges, cycle_counts, offsets, is_single
+    """
+    def as_histogram(location):
+        if isinstance(location, np.ndarray) and location.dtype.names is not None:
+            return location['range'], location['count']
+        ranges, counts = location
+        ranges = np.asarray(ranges, dtype=np.float64).ravel()
+        counts = np.asarray(counts, dtype=np.float64).ravel()
+        if len(ranges) != len(counts):
+            raise ValueError("stress_ranges and cycle_counts must have same length")
+        return ranges, counts
+    
+    is_single = isinstance(locations, (np.ndarray, tuple))
+    histograms = [as_histogram(locations)] if is_single else [
+        as_histogram(location) for location in locations
+    ]
+    if not histograms:
+        raise ValueError("At least one location is required")
+    
+    offsets = np.zeros(len(histograms) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(ranges) for ranges, _ in histograms])
+    stress_ranges = np.concatenate([r for r, _ in histograms]).astype(np.float64)
+    cycle_counts = np.concatenate([c for _, c in histograms]).astype(np.float64)
+    return stress_ranges, cycle_counts, offsets, is_single
+
+
+def critical_load_factor(
+    locations,
+    fatigue_curve: FatigueCurve,
+    design_life: float = 1.0,
+    partial_safety_factor: float = 1.0,
+    use_cutoff: bool = True,
+    rtol: float = 1e-10,
+    max_iter: int = 100
+) -> Union[float, np.ndarray]:
+    """
+    Load scale factor at which the fatigue utilization reaches 1.0.
+    
+    Answers "by what factor can the loads grow before failure?". With
+    the factor applied to the stress ranges, assess_fatigue_safety gives
+    a utilization of 1.0 (up to rtol).
+    
+    Args:
+        locations: Cycle array or (stress_ranges, cycle_counts) histogram,
+                   or a list of them for a batch of locations
+        fatigue_curve: FatigueCurve object
+        design_life: Required number of repetitions of load history
+        partial_safety_factor: Partial safety factor for fatigue
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        rtol: Relative tolerance on the factor
+        max_iter: Maximum number of damage evaluations per location
+    
+    Returns:
+        Critical factor (inf without damaging cycles), or one per location
+    
+    Example:
+        >>> factor = critical_load_factor(cycles, curve, design_life=50)
+        >>> print(f"Loads may grow by {factor:.2f}x")
+    """
+    if design_life <= 0:
+        raise ValueError(f"design_life must be positive, got {design_life}")
+    
+    stress_ranges, cycle_counts, offsets, is_single = _pack_locations(locations)
+    C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L = _curve_parameters(fatigue_curve)
+    
+    scales = _critical_scale_batch(
+        stress_ranges * partial_safety_factor, cycle_counts, offsets,
+        1.0 / design_life, C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L,
+        use_cutoff, rtol, max_iter
+    )
+    return float(scales[0]) if is_single else scales
+
+
+def required_fatigue_strength(
+    locations,
+    design_life: float = 1.0,
+    partial_safety_factor: float = 1.0,
+    use_cutoff: bool = True,
+    m1: float = 3.0,
+    m2: float = 5.0,
+    N_knee: float = 5e6,
+    N_cutoff: float = 1e8
+) -> Union[float, np.ndarray]:
+    """
+    Smallest delta_sigma_c giving a utilization of 1.0.
+    
+    Curves with a larger delta_sigma_c (same slopes, knee and cut-off
+    points) have a utilization below 1.0.
+    
+    Args:
+        locations: Cycle array or histogram, or a list of them
+        design_life: Required number of repetitions of load history
+        partial_safety_factor: Partial safety factor for fatigue
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        m1, m2, N_knee, N_cutoff: S-N curve shape, as in
+                                  EurocodeCategory.get_curve
+    
+    Returns:
+        Required characteristic fatigue strength [MPa], or one per location
+    """
+    reference = FatigueCurve('reference', 100.0, m1=m1, m2=m2,
+                             N_knee=N_knee, N_cutoff=N_cutoff)
+    factor = critical_load_factor(
+        locations, reference, design_life=design_life,
+        partial_safety_factor=partial_safety_factor, use_cutoff=use_cutoff
+    )
+    return reference.delta_sigma_c / factor
+
+
+def minimum_category(
+    locations,
+    design_life: float = 1.0,
+    partial_safety_factor: float = 1.0,
+    use_cutoff: bool = True,
+    m1: float = 3.0,
+    m2: float = 5.0,
+    N_knee: float = 5e6,
+    N_cutoff: float = 1e8
+) -> Union[Optional[str], List[Optional[str]]]:
+    """
+    Lowest Eurocode detail category with a utilization below 1.0.
+    
+    Args:
+        locations: Cycle array or histogram, or a list of them
+        design_life: Required number of repetitions of load history
+        partial_safety_factor: Partial safety factor for fatigue
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        m1, m2, N_knee, N_cutoff: S-N curve shape, as in
+                                  EurocodeCategory.get_curve
+    
+    Returns:
+        Category name (None if even '160' fails), or one per location
+    
+    Example:
+        >>> minimum_category([cycles_a, cycles_b], design_life=100)
+        ['71', '112']
+    """
+    required = np.atleast_1d(required_fatigue_strength(
+        locations, design_life=design_life,
+        partial_safety_factor=partial_safety_factor, use_cutoff=use_cutoff,
+        m1=m1, m2=m2, N_knee=N_knee, N_cutoff=N_cutoff
+    ))
+    
+    names = sorted(EUROCODE_CATEGORIES, key=EUROCODE_CATEGORIES.get)
+    strengths = np.array([EUROCODE_CATEGORIES[name] for name in names])
+    index = np.searchsorted(strengths, required, side='right')
+    categories = [names[i] if i < len(names) else None for i in index]
+    
+    single = isinstance(locations, (np.ndarray, tuple))
+    return categories[0] if single else categories
@@ -111,10 +111,10 @@ class FatigueCurve:
         in_region1 = above_cafl & (delta_sigma >= self.delta_sigma_knee)
         N[in_region1] = self.C1 / (delta_sigma[in_region1] ** self.m1)
         
-        # Region 2: Low stress, slope m2
-        in_region2 = above_cafl & (delta_sigma < self.delta_sigma_knee) & \
-                     (delta_sigma >= self.delta_sigma_L)
-        N[in_region2] = self.C2 / (delta_sigma[in_region2] ** self.m2)
+        # Region 2: Low stress, slope m2 (extended below CAFL without cutoff)
+        in_region2 = above_cafl & (delta_sigma < self.delta_sigma_knee)
+        with np.errstate(divide='ignore'):
+            N[in_region2] = self.C2 / (delta_sigma[in_region2] ** self.m2)
         
         return N[0] if is_scalar else N
     
@@ -0,0 +1,388 @@
+"""
+Load spectrum extrapolation and synthesis.
+
+A measured cycle spectrum is projected to the design life by scaling its
+body and replacing its upper tail with a fitted range distribution, so the
+largest ranges expected over the design life (which the measurement is too
+short to contain) are included:
+
+- weibull: P(S > s) = exp(-(s / scale)^shape), fitted on the tail
+- exponential: P(S > s | S > u) = exp(-(s - u) / scale) above the threshold u
+
+Extrapolated spectra are returned as histograms (bin centers and float
+counts) in the layout of bin_cycles, and feed
+calculate_damage_from_histogram directly. Counts are expected numbers of
+cycles, so a 25 year spectrum of 10^10 cycles costs no more than the
+measured one. Synthetic turning-point sequences are drawn from a spectrum
+chunk by chunk for time-domain simulations and tests.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple, Union
+
+
+MODELS = ('weibull', 'exponential')
+
+
+@dataclass
+class SpectrumModel:
+    """
+    Measured range spectrum with a fitted tail model.
+    
+    Attributes:
+        model: 'weibull' or 'exponential'
+        threshold: Range u above which the tail model is used [MPa]
+        shape: Weibull shape (1.0 for the exponential model)
+        scale: Weibull or exponential scale [MPa]
+        ranges: Measured ranges (bin centers), increasing
+        counts: Measured counts, shape (n_ranges,) or (n_ranges, n_means)
+        mean_centers: Mean bin centers of a rainflow matrix, or None
+    """
+    model: str
+    threshold: float
+    shape: float
+    scale: float
+    ranges: np.ndarray
+    counts: np.ndarray
+    mean_centers: Optional[np.ndarray] = None
+    
+    @property
+    def range_counts(self) -> np.ndarray:
+        """Counts per range, summed over the means."""
+        if self.counts.ndim == 2:
+            return self.counts.sum(axis=1)
+        return self.counts
+    
+    @property
+    def n_cycles(self) -> float:
+        """Number of measured cycles."""
+        return float(self.range_counts.sum())
+    
+    @property
+    def n_tail(self) -> float:
+        """Number of measured cycles above the threshold."""
+        return float(self.range_counts[self.ranges > self.threshold].sum())
+    
+    def tail_exceedance(self, stress_range) -> np.ndarray:
+        """
+        Conditional exceedance probability P(S > s | S > threshold).
+        
+        Args:
+            stress_range: Ranges at or above the threshold [MPa]
+        
+        Returns:
+            Probabilities, same shape as stress_range
+        """
+        s = np.maximum(np.asarray(stress_range, dtype=np.float64), self.threshold)
+        if self.model == 'exponential':
+            return np.exp(-(s - self.threshold) / self.scale)
+        return np.exp(-((s / self.scale) ** self.shape
+                        - (self.threshold / self.scale) ** self.shape))
+    
+    def max_range(self, factor: float) -> float:
+        """
+        Range exceeded once on average over the extrapolated duration.
+        
+        Solves factor * n_tail * P(S > s | S > threshold) = 1.
+        
+        Args:
+            factor: Extrapolation factor (design duration / measured duration)
+        
+        Returns:
+            Extrapolated maximum range [MPa]
+        """
+        log_exceed = np.log(max(factor * self.n_tail, 1.0))
+        if self.model == 'exponential':
+            return float(self.threshold + self.scale * log_exceed)
+        return float(self.scale * ((self.threshold / self.scale) ** self.shape
+                                   + log_exceed) ** (1.0 / self.shape))
+    
+    def extrapolate(
+        self,
+        factor: float,
+        n_bins: int = 50,
+        max_range: Optional[float] = None
+    ) -> Union[Tuple[np.ndarray, np.ndarray],
+               Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Extrapolated spectrum over factor times the measured duration.
+        
+        The body (ranges up to the threshold) is scaled by factor. The tail
+        is split into n_bins bins between the threshold and max_range,
+        holding factor * n_tail cycles distributed by the fitted model;
+        the cycles expected beyond max_range are assigned to max_range.
+        For a rainflow matrix, tail cycles keep the mean distribution of
+        the measured tail.
+        
+        Args:
+            factor: Extrapolation factor (design duration / measured duration)
+            n_bins: Number of tail bins
+            max_range: Upper tail range (default: self.max_range(factor))
+        
+        Returns:
+            Same layout as bin_cycles:
+            (range_centers, counts) for a range spectrum, or
+            (range_centers, mean_centers, counts_2d) for a rainflow matrix
+        
+        Example:
+            >>> model = fit_spectrum(rainflow_count(signal))
+            >>> ranges, counts = model.extrapolate(25 * 365.25 * 24)
+            >>> D = calculate_damage_from_histogram(ranges, counts, curve)
+        """
+        if factor <= 0:
+            raise ValueError(f"factor must be positive, got {factor}")
+        if n_bins < 1:
+            raise ValueError(f"n_bins must be >= 1, got {n_bins}")
+        if max_range is None:
+            max_range = self.max_range(factor)
+        max_range = max(float(max_range), self.threshold)
+        
+        edges = np.linspace(self.threshold, max_range, n_bins + 1)
+        exceedance = self.tail_exceedance(edges)
+        # Tail bins, plus the cycles beyond max_range counted at max_range
+        tail = factor * self.n_tail * np.append(-np.diff(exceedance), exceedance[-1])
+        tail_ranges = np.append(0.5 * (edges[:-1] + edges[1:]), max_range)
+        
+        body = self.ranges <= self.threshold
+        ranges = np.concatenate([self.ranges[body], tail_ranges])
+        
+        if self.counts.ndim == 1:
+            return ranges, np.concatenate([self.counts[body] * factor, tail])
+        
+        measured_tail = self.counts[~body].sum(axis=0)
+        weights = measured_tail / measured_tail.sum()
+        counts = np.concatenate([self.counts[body] * factor, np.outer(tail, weights)])
+        return ranges, self.mean_centers, counts
+
+
+def _range_spectrum(data):
+    """
+    Ranges, counts and mean centers from cycles or bin_cycles output.
+    
+    Returns:
+        ranges: Increasing ranges
+        counts: Counts, shape (n_ranges,) or (n_ranges, n_means)
+        mean_centers: Mean bin centers or None
+    """
+    if isinstance(data, np.ndarray) and data.dtype.names is not None:
+        ranges, inverse = np.unique(data['range'], return_inverse=True)
+        counts = np.bincount(inverse, weights=data['count'], minlength=len(ranges))
+        return ranges, counts, None
+    
+    if len(data) == 3 and data[2] is not None:
+        ranges, mean_centers, counts = (np.asarray(a, dtype=np.float64) for a in data)
+        if counts.shape != (len(ranges), len(mean_centers)):
+            raise ValueError("counts_2d must have shape (n_ranges, n_means)")
+    else:
+        ranges, counts = (np.asarray(a, dtype=np.float64) for a in data[:2])
+        mean_centers = None
+        if counts.shape != ranges.shape:
+            raise ValueError("ranges and counts must have the same length")
+    
+    order = np.argsort(ranges, kind='stable')
+    return ranges[order], counts[order], mean_centers
+
+
+def fit_spectrum(
+    data,
+    threshold_quantile: float = 0.9,
+    model: str = 'weibull'
+) -> SpectrumModel:
+    """
+    Fit a tail model to a measured range spectrum.
+    
+    The threshold is the count-weighted quantile of the ranges. The model
+    is fitted by weighted least squares on the empirical exceedance of the
+    ranges above it, with the mid-count plotting position.
+    
+    Args:
+        data: Cycle array from rainflow_count, or bin_cycles output:
+              (range_centers, counts, None) or
+              (range_centers, mean_centers, counts_2d)
+        threshold_quantile: Fraction of the cycles in the body (0 to 1)
+        model: 'weibull' or 'exponential'
+    
+    Returns:
+        SpectrumModel
+    
+    Example:
+        >>> model = fit_spectrum(bin_cycles(cycles, range_bins=64))
+        >>> ranges, counts = model.extrapolate(1000.0)
+    """
+    if model not in MODELS:
+        raise ValueError(
+            f"Invalid model '{model}'. Valid models: {', '.join(MODELS)}"
+        )
+    if not 0.0 <= threshold_quantile < 1.0:
+        raise ValueError(
+            f"threshold_quantile must be in [0, 1), got {threshold_quantile}"
+        )
+    
+    ranges, counts, mean_centers = _range_spectrum(data)
+    range_counts = counts.sum(axis=1) if counts.ndim == 2 else counts
+    
+    keep = range_counts > 0
+    n_cycles = range_counts[keep].sum()
+    if n_cycles <= 0:
+        raise ValueError("The spectrum contains no cycles")
+    
+    cumulative = np.cumsum(range_counts[keep])
+    position = np.searchsorted(cumulative, threshold_quantile * n_cycles, side='left')
+    threshold = float(ranges[keep][min(position, keep.sum() - 1)])
+    
+    tail = keep & (ranges > threshold)
+    s = ranges[tail]
+    w = range_counts[tail]
+    if len(s) < 2:
+        raise ValueError(
+            "At least two distinct ranges above the threshold are required; "
+            "lower threshold_quantile or use more bins"
+        )
+    
+    # Cycles above each range, counting half of its own bin
+    exceed = np.cumsum(w[::-1])[::-1] - 0.5 * w
+    n_tail = w.sum()
+    
+    if model == 'exponential':
+        x = s - threshold
+        y = np.log(exceed / n_tail)
+        slope = np.sum(w * x * y) / np.sum(w * x * x)
+        shape, scale = 1.0, -1.0 / slope if slope < 0 else np.inf
+    else:
+        x = np.log(s)
+        y = np.log(-np.log(exceed / n_cycles))
+        x_mean = np.average(x, weights=w)
+        y_mean = np.average(y, weights=w)
+        shape = np.sum(w * (x - x_mean) * (y - y_mean)) / np.sum(w * (x - x_mean) ** 2)
+        scale = np.exp(x_mean - y_mean / shape) if shape > 0 else np.inf
+    
+    if not (shape > 0 and np.isfinite(scale)):
+        raise ValueError("The tail is not decreasing; cannot fit the model")
+    
+    return SpectrumModel(
+        model=model,
+        threshold=threshold,
+        shape=float(shape),
+        scale=float(scale),
+        ranges=ranges,
+        counts=counts,
+        mean_centers=mean_centers,
+    )
+
+
+def extrapolate_spectrum(
+    data,
+    factor: float,
+    threshold_quantile: float = 0.9,
+    model: str = 'weibull',
+    n_bins: int = 50,
+    max_range: Optional[float] = None
+):
+    """
+    Fit a tail model and extrapolate a measured spectrum in one call.
+    
+    Args:
+        data: Cycle array from rainflow_count or bin_cycles output
+        factor: Extrapolation factor (design duration / measured duration)
+        threshold_quantile: Fraction of the cycles in the body (0 to 1)
+        model: 'weibull' or 'exponential'
+        n_bins: Number of tail bins
+        max_range: Upper tail range (default: range exceeded once)
+    
+    Returns:
+        Extrapolated spectrum, see SpectrumModel.extrapolate
+    
+    Example:
+        >>> ranges, counts = extrapolate_spectrum(cycles, factor=1e6)
+        >>> D = calculate_damage_from_histogram(ranges, counts, curve)
+    """
+    return fit_spectrum(data, threshold_quantile, model).extrapolate(
+        factor, n_bins=n_bins, max_range=max_range
+    )
+
+
+def iter_turning_points(
+    ranges: np.ndarray,
+    counts: np.ndarray,
+    n_cycles: int,
+    chunk_cycles: int = 1_000_000,
+    mean: float = 0.0,
+    seed=None
+) -> Iterator[np.ndarray]:
+    """
+    Synthetic turning points drawn from a range spectrum, chunk by chunk.
+    
+    Cycle ranges are drawn independently with probabilities proportional
+    to counts, in random order, and each becomes a valley-peak pair
+    centred on mean. Because all cycles share the mean, rainflow counting
+    the concatenated sequence returns the drawn cycles, apart from the
+    residue.
+    
+    Args:
+        ranges: Range values (bin centers)
+        counts: Counts per range (any non-negative weights)
+        n_cycles: Total number of cycles to draw
+        chunk_cycles: Cycles per yielded chunk
+        mean: Mean stress of every cycle
+        seed: Seed or numpy Generator for reproducible sequences
+    
+    Yields:
+        Turning points, 2 per cycle
+    
+    Example:
+        >>> for chunk in iter_turning_points(ranges, counts, 10**9, seed=1):
+        ...     rig.play(chunk)
+    """
+    ranges = np.asarray(ranges, dtype=np.float64).ravel()
+    counts = np.asarray(counts, dtype=np.float64).ravel()
+    if ranges.shape != counts.shape:
+        raise ValueError("ranges and counts must have the same length")
+    if np.any(counts < 0) or counts.sum() <= 0:
+        raise ValueError("counts must be non-negative with a positive sum")
+    if chunk_cycles < 1:
+        raise ValueError(f"chunk_cycles must be >= 1, got {chunk_cycles}")
+    
+    rng = np.random.default_rng(seed)
+    probabilities = counts / counts.sum()
+    half = 0.5 * ranges
+    
+    remaining = int(n_cycles)
+    while remaining > 0:
+        size = min(chunk_cycles, remaining)
+        drawn = half[rng.choice(len(ranges), size=size, p=probabilities)]
+        chunk = np.empty(2 * size)
+        chunk[0::2] = mean - drawn
+        chunk[1::2] = mean + drawn
+        yield chunk
+        remaining -= size
+
+
+def synthesize_turning_points(
+    ranges: np.ndarray,
+    counts: np.ndarray,
+    n_cycles: int,
+    mean: float = 0.0,
+    seed=None
+) -> np.ndarray:
+    """
+    Synthetic turning-point sequence drawn from a range spectrum.
+    
+    Single-array version of iter_turning_points; use the iterator for
+    sequences that do not fit in memory.
+    
+    Args:
+        ranges: Range values (bin centers)
+        counts: Counts per range
+        n_cycles: Number of cycles to draw
+        mean: Mean stress of every cycle
+        seed: Seed or numpy Generator for reproducible sequences
+    
+    Returns:
+        Turning points, shape (2 * n_cycles,)
+    """
+    chunks = list(iter_turning_points(
+        ranges, counts, n_cycles, chunk_cycles=max(int(n_cycles), 1),
+        mean=mean, seed=seed
+    ))
+    return chunks[0] if chunks else np.empty(0)
@@ -0,0 +1,193 @@
+"""
+Eager and ahead-of-time compilation of the Numba kernels.
+
+By default the kernels are compiled on first call (or loaded from the
+Numba cache). Fresh worker processes and containers with a read-only or
+empty cache pay that cost on their first analysis; warmup() moves it to a
+chosen moment and build_aot() removes it with a compiled extension module.
+"""
+
+import os
+import time
+from typing import Dict, Iterable, Optional
+
+from .rainflow import (
+    _find_reversals, _hysteresis_filter, _rainflow_core, _rainflow_core_int, _rainflow_feed,
+    _kernel_fingerprint
+)
+from .damage import _cycle_damage, _damage_accumulate, _damage_sum, _damage_from_histogram
+
+
+# Explicit signatures per kernel and signal dtype. Arrays are C-contiguous,
+# which is what the Python wrappers pass to the kernels.
+SIGNATURES = {
+    'find_reversals': {
+        'float64': 'Tuple((f8[::1], i8[::1]))(f8[::1])',
+        'float32': 'Tuple((f4[::1], i8[::1]))(f4[::1])',
+        'int16': 'Tuple((i2[::1], i8[::1]))(i2[::1])',
+        'int32': 'Tuple((i4[::1], i8[::1]))(i4[::1])',
+    },
+    'hysteresis_filter': {
+        'float64': 'Tuple((f8[::1], i8[::1]))(f8[::1], i8[::1], f8)',
+        'float32': 'Tuple((f4[::1], i8[::1]))(f4[::1], i8[::1], f8)',
+        'int16': 'Tuple((i2[::1], i8[::1]))(i2[::1], i8[::1], f8)',
+        'int32': 'Tuple((i4[::1], i8[::1]))(i4[::1], i8[::1], f8)',
+    },
+    'rainflow_feed': {
+        'float64': 'Tuple((i8, i8))(f8[::1], f8[::1], i8, f8[::1], f8[::1], f8[::1], i8)',
+        'float32': 'Tuple((i8, i8))(f4[::1], f4[::1], i8, f4[::1], f4[::1], f8[::1], i8)',
+    },
+    'rainflow_core': {
+        'float64': 'Tuple((f8[::1], f8[::1], f8[::1]))(f8[::1])',
+        'float32': 'Tuple((f4[::1], f4[::1], f8[::1]))(f4[::1])',
+    },
+    'rainflow_core_int': {
+        'int16': 'Tuple((i8[::1], f8[::1], f8[::1]))(i2[::1])',
+        'int32': 'Tuple((i8[::1], f8[::1], f8[::1]))(i4[::1])',
+    },
+    'cycle_damage': {
+        'float64': 'f8(f8, f8, f8, f8, f8, f8, f8, b1)',
+    },
+    # Field views of structured cycle arrays are strided (any layout)
+    'damage_accumulate': {
+        'float64': 'none(f8[:], f8[:], f8, f8, f8, f8, f8, f8, f8, b1, f8[::1])',
+        'float32': 'none(f4[:], f4[:], f8, f8, f8, f8, f8, f8, f8, b1, f8[::1])',
+    },
+    'damage_sum': {
+        'float64': 'f8(f8[:], f8[:], f8, f8, f8, f8, f8, f8, f8, b1)',
+        'float32': 'f8(f4[:], f4[:], f8, f8, f8, f8, f8, f8, f8, b1)',
+    },
+    'damage_from_histogram': {
+        'float64': 'f8(f8[::1], f8[::1], f8[::1])',
+    },
+}
+
+_KERNELS = {
+    'find_reversals': _find_reversals,
+    'hysteresis_filter': _hysteresis_filter,
+    'rainflow_feed': _rainflow_feed,
+    'rainflow_core': _rainflow_core,
+    'rainflow_core_int': _rainflow_core_int,
+    'cycle_damage': _cycle_damage,
+    'damage_accumulate': _damage_accumulate,
+    'damage_sum': _damage_sum,
+    'damage_from_histogram': _damage_from_histogram,
+}
+
+# Kernels called directly by the counting functions (see rainflow._kernel)
+_AOT_KERNELS = ('find_reversals', 'hysteresis_filter', 'rainflow_core')
+
+_DTYPES = ('float64', 'float32', 'int16', 'int32')
+
+
+def warmup(dtypes: Iterable[str] = ('float64', 'float32')) -> Dict[str, float]:
+    """
+    Compile the kernels for explicit signatures now instead of on first call.
+    
+    Signatures already in the Numba cache are loaded instead of compiled.
+    Calling warmup() at worker start-up (or while building a container
+    image with NUMBA_CACHE_DIR pointing to a writable folder) keeps the
+    compilation out of the first analysis.
+    
+    Args:
+        dtypes: Signal dtypes to compile for ('float64', 'float32',
+                'int16', 'int32')
+        
+    Returns:
+        Seconds spent per kernel
+        
+    Example:
+        >>> from openrainflow import warmup
+        >>> timings = warmup()
+        >>> print(sum(timings.values()))
+    """
+    dtypes = list(dtypes)
+    for dtype in dtypes:
+        if dtype not in _DTYPES:
+            raise ValueError(f"Unsupported dtype '{dtype}'. Valid dtypes: {_DTYPES}")
+    
+    timings = {}
+    for name, kernel in _KERNELS.items():
+        start = time.perf_counter()
+        for dtype in dtypes:
+            signature = SIGNATURES[name].get(dtype)
+            if signature is not None:
+                kernel.compile(signature)
+        timings[name] = time.perf_counter() - start
+    
+    return timings
+
+
+def _constant(value: int):
+    """Function returning value, for export into the AOT extension."""
+    def constant():
+        return value
+    return constant
+
+
+def build_aot(
+    output_dir: Optional[str] = None,
+    dtypes: Iterable[str] = ('float64', 'float32'),
+    verbose: bool = False
+) -> str:
+    """
+    Build an ahead-of-time compiled extension with the counting kernels.
+    
+    Requires numba.pycc and a C compiler. Built into the package folder
+    (the default), the extension is imported as openrainflow._aot and
+    rainflow_count uses it instead of the JIT kernels, so a fresh process
+    counts without any compilation. The extension records a fingerprint
+    of the kernel sources: after an upgrade that changes the kernels it is
+    ignored with a warning until it is rebuilt. Dtypes it was not built
+    for use the JIT kernels.
+    
+    Args:
+        output_dir: Folder for the extension (None for the package folder)
+        dtypes: Signal dtypes to export ('float64', 'float32')
+        verbose: If True, print the compiler output
+        
+    Returns:
+        Path of the compiled extension
+        
+    Example:
+        >>> from openrainflow.jit import build_aot
+        >>> build_aot()  # e.g. while building a container image
+    """
+    try:
+        from numba.pycc import CC
+    except ImportError:
+        raise ImportError(
+            "numba.pycc is required for ahead-of-time compilation. "
+            "Use warmup() instead."
+        )
+    
+    dtypes = list(dtypes)
+    for dtype in dtypes:
+        if dtype not in ('float64', 'float32'):
+            raise ValueError(
+                f"Unsupported dtype '{dtype}'. Integer signals use the JIT kernels; "
+                f"valid dtypes: 'float64', 'float32'"
+            )
+    
+    if output_dir is None:
+        output_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    cc = CC('_aot')
+    cc.output_dir = output_dir
+    cc.verbose = verbose
+    
+    for name in _AOT_KERNELS:
+        for dtype in dtypes:
+            # Any-layout arrays: strided signals are accepted as well
+            signature = SIGNATURES[name][dtype].replace('[::1]', '[:]')
+            cc.export(f'{name}_{dtype}', signature)(_KERNELS[name].py_func)
+    
+    # Checked on import: an extension built from other kernels is ignored
+    cc.export('kernel_fingerprint', 'i8()')(_constant(_kernel_fingerprint()))
+    
+    cc.compile()
+    
+    for filename in os.listdir(output_dir):
+        if filename.startswith('_aot.') and filename.endswith(('.so', '.pyd')):
+            return os.path.join(output_dir, filename)
+    return output_dir
@@ -0,0 +1,354 @@
+"""
+Real-time fatigue monitoring for streaming sensor data.
+
+Samples are staged in a fixed-size ring buffer and counted in batches with
+the incremental rainflow residue logic, so the work per sample is O(1)
+amortised and the latency of a damage snapshot is bounded by the buffer size.
+"""
+
+import numpy as np
+from numba import njit
+from typing import List, Union
+
+from .rainflow import _rainflow_feed
+from .damage import _curve_parameters, _cycle_damage, _neumaier_add
+from .eurocode import FatigueCurve, EurocodeCategory
+
+
+@njit(cache=True, nogil=True)
+def _monitor_consume(
+    samples: np.ndarray,
+    last: np.ndarray,
+    state: np.ndarray,
+    stack: np.ndarray,
+    reversals: np.ndarray,
+    ranges: np.ndarray,
+    means: np.ndarray,
+    counts: np.ndarray,
+    params: np.ndarray,
+    partial_safety_factor: float,
+    use_cutoff: bool,
+    damage: np.ndarray
+):
+    """
+    JIT-compiled streaming step: detect reversals, count and accumulate damage.
+    
+    Reversals are detected with the same rule as _find_reversals; a sample is
+    only confirmed once its successor is known, so the two latest samples are
+    carried in ``last``.
+    
+    Args:
+        samples: New samples
+        last: Two latest samples [x(n-2), x(n-1)], modified in place
+        state: [stack_ptr, n_samples, n_cycles], modified in place
+        stack: Counting stack (residue), modified in place
+        reversals: Scratch array for detected reversals
+        ranges, means, counts: Scratch arrays for extracted cycles
+        params: S-N curve constants, one row per curve
+        partial_safety_factor: Factor applied to stress ranges
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        damage: Closed-cycle damage per curve as compensated sums
+                [total, compensation], modified in place
+    """
+    stack_ptr = state[0]
+    n_seen = state[1]
+    n_rev = 0
+    
+    for x in samples:
+        if n_seen == 0:
+            # First point is always a reversal
+            reversals[n_rev] = x
+            n_rev += 1
+            last[1] = x
+        elif n_seen == 1:
+            last[0] = last[1]
+            last[1] = x
+        else:
+            a = last[0]
+            b = last[1]
+            if (b >= a and b > x) or (b <= a and b < x):
+                reversals[n_rev] = b
+                n_rev += 1
+            last[0] = b
+            last[1] = x
+        n_seen += 1
+    
+    stack_ptr, n_cycles = _rainflow_feed(
+        reversals[:n_rev], stack, stack_ptr, ranges, means, counts, 0
+    )
+    
+    for i in range(n_cycles):
+        delta_sigma = ranges[i] * partial_safety_factor
+        for k in range(params.shape[0]):
+            damage[k, 0], damage[k, 1] = _neumaier_add(
+                damage[k, 0], damage[k, 1],
+                _cycle_damage(
+                    delta_sigma, params[k, 0], params[k, 1], params[k, 2],
+                    params[k, 3], params[k, 4], params[k, 5], use_cutoff
+                )
+            )
+    
+    state[0] = stack_ptr
+    state[1] = n_seen
+    state[2] += n_cycles
+
+
+@njit(cache=True, nogil=True)
+def _monitor_residue(
+    last: np.ndarray,
+    state: np.ndarray,
+    stack: np.ndarray,
+    work: np.ndarray,
+    ranges: np.ndarray,
+    means: np.ndarray,
+    counts: np.ndarray,
+    params: np.ndarray,
+    partial_safety_factor: float,
+    use_cutoff: bool,
+    damage: np.ndarray
+):
+    """
+    JIT-compiled damage of the residue if the history ended now.
+    
+    The latest sample is closed as the final reversal on a copy of the
+    stack, then the remaining points are counted as half-cycles, exactly
+    as _rainflow_core does at the end of a signal.
+    
+    Args:
+        last: Two latest samples
+        state: [stack_ptr, n_samples, n_cycles]
+        stack: Counting stack (residue), left untouched
+        work: Scratch copy of the stack (one point larger)
+        ranges, means, counts: Scratch arrays for extracted cycles
+        params: S-N curve constants, one row per curve
+        partial_safety_factor: Factor applied to stress ranges
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        damage: Residue damage per curve as compensated sums
+                [total, compensation], overwritten
+    """
+    damage[:] = 0.0
+    stack_ptr = state[0]
+    
+    for i in range(stack_ptr):
+        work[i] = stack[i]
+    
+    n_cycles = 0
+    if state[1] >= 2:
+        # Last point is always a reversal
+        stack_ptr, n_cycles = _rainflow_feed(
+            last[1:], work, stack_ptr, ranges, means, counts, 0
+        )
+    
+    for i in range(n_cycles):
+        delta_sigma = ranges[i] * partial_safety_factor
+        for k in range(params.shape[0]):
+            damage[k, 0], damage[k, 1] = _neumaier_add(
+                damage[k, 0], damage[k, 1],
+                _cycle_damage(
+                    delta_sigma, params[k, 0], params[k, 1], params[k, 2],
+                    params[k, 3], params[k, 4], params[k, 5], use_cutoff
+                )
+            )
+    
+    # Remaining half-cycles
+    for i in range(stack_ptr - 1):
+        delta_sigma = abs(work[i + 1] - work[i]) * partial_safety_factor
+        for k in range(params.shape[0]):
+            damage[k, 0], damage[k, 1] = _neumaier_add(
+                damage[k, 0], damage[k, 1],
+                0.5 * _cycle_damage(
+                    delta_sigma, params[k, 0], params[k, 1], params[k, 2],
+                    params[k, 3], params[k, 4], params[k, 5], use_cutoff
+                )
+            )
+
+
+class FatigueMonitor:
+    """
+    Streaming fatigue damage monitor with bounded latency.
+    
+    Incoming samples are written into a fixed-size ring buffer. Whenever the
+    buffer holds ``buffer_size`` uncounted samples (or a snapshot is
+    requested) they are counted in one JIT call that carries the rainflow
+    residue across calls, so the accumulated damage is identical to counting
+    the whole history at once. All work arrays are preallocated; they only
+    grow if the residue outgrows its initial capacity.
+    
+    Example:
+        >>> monitor = FatigueMonitor(['71', '36'], buffer_size=10000)
+        >>> for frame in frames:
+        ...     monitor.push(frame)
+        >>> state = monitor.snapshot()
+        >>> print(state['damage'])
+    """
+    
+    def __init__(
+        self,
+        curves: Union[FatigueCurve, str, List],
+        buffer_size: int = 4096,
+        partial_safety_factor: float = 1.0,
+        use_cutoff: bool = True,
+        residue_capacity: int = 1024
+    ):
+        """
+        Initialize monitor.
+        
+        Args:
+            curves: FatigueCurve, Eurocode category name, or a list of them
+            buffer_size: Number of samples staged before counting
+            partial_safety_factor: Partial safety factor for fatigue
+            use_cutoff: If True, stress ranges below CAFL cause no damage
+            residue_capacity: Initial room for the rainflow residue
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        
+        if not isinstance(curves, (list, tuple)):
+            curves = [curves]
+        self.curves = [
+            EurocodeCategory.get_curve(c) if isinstance(c, str) else c
+            for c in curves
+        ]
+        if not self.curves:
+            raise ValueError("At least one fatigue curve is required")
+        
+        self.buffer_size = buffer_size
+        self.partial_safety_factor = partial_safety_factor
+        self.use_cutoff = use_cutoff
+        
+        self._params = np.vstack([_curve_parameters(c) for c in self.curves])
+        self._buffer = np.empty(buffer_size, dtype=np.float64)
+        self._reversals = np.empty(buffer_size, dtype=np.float64)
+        self._allocate_stack(buffer_size + residue_capacity)
+        self.reset()
+    
+    def _allocate_stack(self, capacity: int):
+        """Allocate the stack and the cycle scratch arrays."""
+        old_stack = getattr(self, '_stack', None)
+        self._stack = np.empty(capacity, dtype=np.float64)
+        self._work = np.empty(capacity + 1, dtype=np.float64)
+        self._ranges = np.empty(capacity, dtype=np.float64)
+        self._means = np.empty(capacity, dtype=np.float64)
+        self._counts = np.empty(capacity, dtype=np.float64)
+        if old_stack is not None:
+            self._stack[:len(old_stack)] = old_stack
+    
+    def reset(self):
+        """Discard all samples and accumulated damage."""
+        self._head = 0
+        self._pending = 0
+        self._last = np.zeros(2, dtype=np.float64)
+        # [stack_ptr, n_samples, n_cycles]
+        self._state = np.zeros(3, dtype=np.int64)
+        # Compensated sums [total, compensation] per curve
+        self._damage = np.zeros((len(self.curves), 2), dtype=np.float64)
+        self._residue_damage = np.zeros((len(self.curves), 2), dtype=np.float64)
+    
+    @property
+    def n_samples(self) -> int:
+        """Number of samples pushed so far."""
+        return int(self._state[1]) + self._pending
+    
+    def push(self, samples: np.ndarray):
+        """
+        Add new samples to the monitor.
+        
+        Args:
+            samples: New samples (any length)
+        """
+        samples = np.asarray(samples).ravel()
+        size = self.buffer_size
+        pos = 0
+        n = len(samples)
+        
+        while pos < n:
+            m = min(n - pos, size - self._pending)
+            
+            # Write into the ring, wrapping around its end
+            first = min(m, size - self._head)
+            self._buffer[self._head:self._head + first] = samples[pos:pos + first]
+            if first < m:
+                self._buffer[:m - first] = samples[pos + first:pos + m]
+            
+            self._head = (self._head + m) % size
+            self._pending += m
+            pos += m
+            
+            if self._pending == size:
+                self._flush()
+    
+    def _flush(self):
+        """Count the samples staged in the ring buffer."""
+        if self._pending == 0:
+            return
+        
+        start = (self._head - self._pending) % self.buffer_size
+        if start + self._pending <= self.buffer_size:
+            self._consume(self._buffer[start:start + self._pending])
+        else:
+            self._consume(self._buffer[start:])
+            self._consume(self._buffer[:self._head])
+        self._pending = 0
+    
+    def _consume(self, samples: np.ndarray):
+        """Run the streaming kernel on contiguous samples."""
+        required = int(self._state[0]) + len(samples)
+        if required > len(self._stack):
+            self._allocate_stack(max(2 * len(self._stack), required))
+        
+        _monitor_consume(
+            samples, self._last, self._state, self._stack, self._reversals,
+            self._ranges, self._means, self._counts, self._params,
+            self.partial_safety_factor, self.use_cutoff, self._damage
+        )
+    
+    def recent(self, n: int = None) -> np.ndarray:
+        """
+        Return the latest samples kept in the ring buffer.
+        
+        Args:
+            n: Number of samples (None for the whole buffer)
+        
+        Returns:
+            Copy of the latest samples, oldest first
+        """
+        available = min(self.n_samples, self.buffer_size)
+        n = available if n is None else min(n, available)
+        idx = (self._head - n + np.arange(n)) % self.buffer_size
+        return self._buffer[idx]
+    
+    def snapshot(self) -> dict:
+        """
+        Report the damage accumulated so far.
+        
+        Staged samples are counted first, then the residue is evaluated as
+        if the history ended with the latest sample.
+        
+        Returns:
+            Dictionary with results:
+                - 'n_samples': Number of samples pushed
+                - 'n_cycles': Number of closed full cycles
+                - 'curves': Names of the fatigue curves
+                - 'closed_damage': Damage of closed cycles, per curve
+                - 'residue_damage': Damage of the current residue, per curve
+                - 'damage': Total damage, per curve
+        """
+        self._flush()
+        
+        _monitor_residue(
+            self._last, self._state, self._stack, self._work,
+            self._ranges, self._means, self._counts, self._params,
+            self.partial_safety_factor, self.use_cutoff, self._residue_damage
+        )
+        
+        closed = self._damage.sum(axis=1)
+        residue = self._residue_damage.sum(axis=1)
+        
+        return {
+            'n_samples': int(self._state[1]),
+            'n_cycles': int(self._state[2]),
+            'curves': [c.name for c in self.curves],
+            'closed_damage': closed,
+            'residue_damage': residue,
+            'damage': closed + residue,
+        }
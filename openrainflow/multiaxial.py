@@ -0,0 +1,147 @@
+"""
+Critical plane damage scan for multiaxial (multi-channel) stress histories.
+
+The stress history is projected onto candidate planes, each projection is
+rainflow counted and the plane with the largest Miner damage is the
+critical plane. A projection is a linear superposition of the stress
+components, so all planes are processed by the parallel kernel of
+superposition_damage and the projected histories are never stored.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+from .eurocode import FatigueCurve
+from .superposition import superposition_damage
+
+
+_COMPONENTS = ('normal', 'shear')
+
+
+def plane_weights(angles: np.ndarray, component: str = 'normal') -> np.ndarray:
+    """
+    Projection weights of a plane stress tensor on candidate planes.
+    
+    For a plane whose normal makes the angle theta with the x axis, the
+    stress components (sigma_xx, sigma_yy, tau_xy) project to:
+    
+    - normal: sigma_xx cos²θ + sigma_yy sin²θ + 2 tau_xy sinθ cosθ
+    - shear: (sigma_yy - sigma_xx) sinθ cosθ + tau_xy (cos²θ - sin²θ)
+    
+    Args:
+        angles: Plane angles in degrees
+        component: 'normal' or 'shear' stress on the plane
+    
+    Returns:
+        Weights, shape (n_angles, 3)
+    """
+    if component not in _COMPONENTS:
+        raise ValueError(
+            f"Invalid component '{component}'. Valid components: {', '.join(_COMPONENTS)}"
+        )
+    
+    theta = np.radians(np.asarray(angles, dtype=np.float64).ravel())
+    c = np.cos(theta)
+    s = np.sin(theta)
+    
+    if component == 'normal':
+        return np.column_stack([c * c, s * s, 2.0 * s * c])
+    return np.column_stack([-s * c, s * c, c * c - s * s])
+
+
+def scan_projections(
+    channels: np.ndarray,
+    weights: np.ndarray,
+    fatigue_curve: FatigueCurve,
+    use_cutoff: bool = True,
+    partial_safety_factor: float = 1.0
+) -> np.ndarray:
+    """
+    Miner damage of arbitrary linear projections of a multi-channel history.
+    
+    Each row of ``weights`` defines one projected history
+    ``channels @ weights[p]``, which is rainflow counted and converted to
+    damage. Use it for 3D stress tensors, rosette gauges or any other
+    channel combination.
+    
+    Args:
+        channels: Stress history, shape (n_samples, n_channels)
+        weights: Projection weights, shape (n_planes, n_channels)
+        fatigue_curve: FatigueCurve object
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        partial_safety_factor: Partial safety factor for fatigue
+    
+    Returns:
+        Damage per projection
+    """
+    channels = np.asarray(channels, dtype=np.float64)
+    weights = np.ascontiguousarray(weights, dtype=np.float64)
+    
+    if channels.ndim != 2:
+        raise ValueError("channels must be a 2D array (n_samples, n_channels)")
+    if weights.ndim != 2 or weights.shape[1] != channels.shape[1]:
+        raise ValueError(
+            f"weights must have shape (n_planes, {channels.shape[1]}), "
+            f"got {weights.shape}"
+        )
+    
+    return superposition_damage(
+        weights, channels, fatigue_curve,
+        use_cutoff=use_cutoff, partial_safety_factor=partial_safety_factor
+    )
+
+
+def critical_plane_damage(
+    stress: np.ndarray,
+    fatigue_curve: FatigueCurve,
+    angles: Optional[np.ndarray] = None,
+    component: str = 'normal',
+    use_cutoff: bool = True,
+    partial_safety_factor: float = 1.0
+) -> Dict:
+    """
+    Find the critical plane of a plane stress history.
+    
+    Strain rosette measurements are converted to (sigma_xx, sigma_yy,
+    tau_xy) with Hooke's law before calling this function.
+    
+    Args:
+        stress: Plane stress history, shape (n_samples, 3) with columns
+                (sigma_xx, sigma_yy, tau_xy)
+        fatigue_curve: FatigueCurve object
+        angles: Plane angles in degrees (default: 0 to 179 by 1)
+        component: 'normal' or 'shear' stress on the plane
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        partial_safety_factor: Partial safety factor for fatigue
+    
+    Returns:
+        Dictionary with angles, damage per angle, critical_angle and
+        max_damage
+    
+    Example:
+        >>> stress = np.column_stack([sxx, syy, txy])
+        >>> result = critical_plane_damage(stress, EurocodeCategory.get_curve('71'))
+        >>> print(result['critical_angle'], result['max_damage'])
+    """
+    stress = np.asarray(stress, dtype=np.float64)
+    if stress.ndim != 2 or stress.shape[1] != 3:
+        raise ValueError("stress must have shape (n_samples, 3): sigma_xx, sigma_yy, tau_xy")
+    
+    if angles is None:
+        angles = np.arange(180.0)
+    angles = np.asarray(angles, dtype=np.float64).ravel()
+    if len(angles) == 0:
+        raise ValueError("At least one angle is required")
+    
+    damage = scan_projections(
+        stress, plane_weights(angles, component), fatigue_curve,
+        use_cutoff=use_cutoff, partial_safety_factor=partial_safety_factor
+    )
+    critical = int(np.argmax(damage))
+    
+    return {
+        'angles': angles,
+        'damage': damage,
+        'critical_angle': float(angles[critical]),
+        'max_damage': float(damage[critical]),
+    }
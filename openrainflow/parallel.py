@@ -4,28 +4,64 @@ Parallel processing utilities for large-scale fatigue analysis.
 
 import numpy as np
 from typing import List, Callable, Optional, Any
+from functools import lru_cache
+import json
+import os
+import shutil
+import tempfile
+import time
 import warnings
 
 
+_CYCLE_DTYPE = np.dtype([('range', 'f8'), ('mean', 'f8'), ('count', 'f8')])
+
+
 def process_signals_parallel(
     signals: List[np.ndarray],
     processing_func: Callable,
     n_jobs: int = -1,
     verbose: int = 0,
+    backend: Optional[str] = None,
+    schedule: bool = False,
+    task_size: Optional[int] = None,
+    return_timings: bool = False,
     **kwargs
 ) -> List[Any]:
     """
     Process multiple signals in parallel using joblib.
     
+    By default one task is submitted per signal. With schedule=True, tasks
+    are built from a cost model (cost = number of samples) instead:
+    
+    - Signals shorter than task_size are batched into a single task
+    - With rainflow_count, signals longer than task_size are split into
+      chunks whose reversals are found in parallel; the chunks are then
+      merged by counting their reversals in order, which carries the
+      residue across chunks and gives exactly rainflow_count's result
+      (periodic=True signals are never split)
+    - Tasks are submitted longest first to limit stragglers
+    
     Args:
         signals: List of signal arrays
         processing_func: Function to apply to each signal
         n_jobs: Number of parallel jobs (-1 for all CPUs)
         verbose: Verbosity level (0=silent, 1=basic, 2=detailed)
+        backend: joblib backend (None for the default process pool).
+                 'threading' shares the input arrays without pickling;
+                 the Numba kernels release the GIL, so counting scales
+                 across threads.
+        schedule: If True, use the cost-model scheduler
+        task_size: Target number of samples per task when scheduling
+                   (None for 4 tasks per worker, at least 100k samples)
+        return_timings: If True, also return the per-task timings
         **kwargs: Additional arguments passed to processing_func
         
     Returns:
-        List of results, one per signal
+        List of results, one per signal. With return_timings, a tuple
+        (results, timings) where timings is a list of dictionaries with
+        keys 'kind' ('signal', 'batch', 'chunk' or 'merge'), 'signals'
+        (signal indices), 'samples' (task cost; reversals for merges)
+        and 'seconds', in submission order.
         
     Example:
         >>> from openrainflow import rainflow_count
@@ -34,6 +70,59 @@ def process_signals_parallel(
         >>> results = process_signals_parallel(
         ...     signals, rainflow_count, n_jobs=4
         ... )
+        >>> # Share arrays between threads instead of pickling them
+        >>> results = process_signals_parallel(
+        ...     signals, rainflow_count, n_jobs=4, backend='threading'
+        ... )
+        >>> # Skewed lengths: batch small signals, split huge ones
+        >>> results, timings = process_signals_parallel(
+        ...     signals, rainflow_count, schedule=True, return_timings=True
+        ... )
+    """
+    if schedule:
+        results, timings = _process_scheduled(
+            signals, processing_func, n_jobs, verbose, backend, task_size, kwargs
+        )
+    else:
+        tasks = [
+            (_timed_batch, (processing_func, [sig], kwargs), ('signal', [i], len(sig)))
+            for i, sig in enumerate(signals)
+        ]
+        outputs, timings = _run_tasks(tasks, n_jobs, verbose, backend)
+        results = [out[0] for out in outputs]
+    
+    if return_timings:
+        return results, timings
+    return results
+
+
+_MIN_TASK_SIZE = 100_000
+
+
+def _timed_batch(func: Callable, signals: List[np.ndarray], kwargs: dict):
+    """Apply a function to a batch of signals, timing the whole batch."""
+    start = time.perf_counter()
+    results = [func(sig, **kwargs) for sig in signals]
+    return results, time.perf_counter() - start
+
+
+def _timed_call(func: Callable, *args, **kwargs):
+    """Call a function, returning its result and the elapsed time."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _run_tasks(
+    tasks: List[tuple],
+    n_jobs: int,
+    verbose: int,
+    backend: Optional[str]
+):
+    """
+    Run (func, args, info) tasks, returning outputs and timings in order.
+    
+    Each func returns (output, seconds); info is (kind, signals, samples).
     """
     try:
         from joblib import Parallel, delayed
@@ -42,19 +131,146 @@ def process_signals_parallel(
             "joblib not installed. Falling back to sequential processing. "
             "Install with: pip install joblib"
         )
-        return [processing_func(sig, **kwargs) for sig in signals]
+        timed = [func(*args) for func, args, _ in tasks]
+    else:
+        timed = Parallel(n_jobs=n_jobs, verbose=verbose, backend=backend)(
+            delayed(func)(*args) for func, args, _ in tasks
+        )
     
-    results = Parallel(n_jobs=n_jobs, verbose=verbose)(
-        delayed(processing_func)(sig, **kwargs) for sig in signals
+    timings = [
+        {'kind': kind, 'signals': list(indices), 'samples': int(samples), 'seconds': seconds}
+        for (_, _, (kind, indices, samples)), (_, seconds) in zip(tasks, timed)
+    ]
+    return [output for output, _ in timed], timings
+
+
+def _effective_n_jobs(n_jobs: int) -> int:
+    """Number of workers joblib would use (1 without joblib)."""
+    try:
+        from joblib import effective_n_jobs
+    except ImportError:
+        return 1
+    return effective_n_jobs(n_jobs)
+
+
+def _process_scheduled(
+    signals: List[np.ndarray],
+    processing_func: Callable,
+    n_jobs: int,
+    verbose: int,
+    backend: Optional[str],
+    task_size: Optional[int],
+    kwargs: dict
+):
+    """Cost-model scheduler behind process_signals_parallel(schedule=True)."""
+    from .rainflow import (
+        rainflow_count, _chunk_reversals, _count_reversals, _check_gate_mode, _check_dtype,
+        _check_scale
     )
     
-    return results
+    lengths = np.array([len(sig) for sig in signals], dtype=np.int64)
+    if task_size is None:
+        total = int(lengths.sum())
+        task_size = max(_MIN_TASK_SIZE, total // (4 * _effective_n_jobs(n_jobs)))
+    if task_size < 1:
+        raise ValueError("task_size must be at least 1")
+    
+    # A periodic signal closes its residue over the whole period, so it is
+    # counted in one task
+    splittable = processing_func is rainflow_count and not kwargs.get('periodic', False)
+    if splittable:
+        _check_gate_mode(kwargs.get('gate_mode', 'hysteresis'))
+        dtype = _check_dtype(kwargs.get('dtype'))
+        _check_scale(kwargs.get('scale', 1.0))
+    
+    # Longest first: huge signals are split, the rest packed into batches
+    tasks = []
+    split = {}
+    batch, batch_cost = [], 0
+    for i in np.argsort(-lengths, kind='stable'):
+        i = int(i)
+        n = int(lengths[i])
+        if splittable and n > 2 * task_size:
+            n_chunks = -(-n // task_size)
+            bounds = np.linspace(0, n, n_chunks + 1).astype(np.int64)
+            split[i] = []
+            for a, b in zip(bounds[:-1], bounds[1:]):
+                lo = max(a - 1, 0)
+                hi = min(b + 1, n)
+                split[i].append(len(tasks))
+                tasks.append((
+                    _timed_call,
+                    (_chunk_reversals, signals[i][lo:hi], int(lo), bool(a > 0), bool(b < n),
+                     dtype),
+                    ('chunk', [i], b - a)
+                ))
+        elif n >= task_size:
+            tasks.append(
+                (_timed_batch, (processing_func, [signals[i]], kwargs), ('signal', [i], n))
+            )
+        else:
+            batch.append(i)
+            batch_cost += n
+            if batch_cost >= task_size:
+                tasks.append((
+                    _timed_batch,
+                    (processing_func, [signals[j] for j in batch], kwargs),
+                    ('batch', batch, batch_cost)
+                ))
+                batch, batch_cost = [], 0
+    if batch:
+        tasks.append((
+            _timed_batch,
+            (processing_func, [signals[j] for j in batch], kwargs),
+            ('batch', batch, batch_cost)
+        ))
+    
+    # Longest tasks first, so the last tasks to finish are short ones
+    order = sorted(range(len(tasks)), key=lambda t: -tasks[t][2][2])
+    outputs, timings = _run_tasks([tasks[t] for t in order], n_jobs, verbose, backend)
+    position = {t: k for k, t in enumerate(order)}
+    
+    results = [None] * len(signals)
+    for t, (_, _, (kind, indices, _)) in enumerate(tasks):
+        if kind != 'chunk':
+            for i, result in zip(indices, outputs[position[t]]):
+                results[i] = result
+    
+    # Exact residue merging: the counting core runs over the chunk
+    # reversals in signal order, carrying the stack across chunks
+    if split:
+        count_args = (
+            kwargs.get('remove_zeros', True),
+            kwargs.get('gate', None),
+            kwargs.get('gate_mode', 'hysteresis'),
+            dtype,
+            kwargs.get('scale', 1.0),
+            kwargs.get('offset', 0.0),
+            kwargs.get('return_indices', False),
+        )
+        merges = []
+        for i, chunk_tasks in split.items():
+            chunk_outputs = [outputs[position[t]] for t in chunk_tasks]
+            reversals = np.concatenate([rev for rev, _ in chunk_outputs])
+            indices = np.concatenate([idx for _, idx in chunk_outputs])
+            merges.append((
+                _timed_call,
+                (_count_reversals, reversals, indices) + count_args,
+                ('merge', [i], len(reversals))
+            ))
+        merge_outputs, merge_timings = _run_tasks(merges, n_jobs, verbose, backend)
+        for (_, _, (_, indices, _)), cycles in zip(merges, merge_outputs):
+            results[indices[0]] = cycles
+        timings.extend(merge_timings)
+    
+    return results, timings
 
 
 def batch_damage_calculation(
     cycles_list: List[np.ndarray],
     fatigue_curves: List,
     n_jobs: int = -1,
+    backend: Optional[str] = None,
     **kwargs
 ) -> np.ndarray:
     """
@@ -65,6 +281,7 @@ def batch_damage_calculation(
         fatigue_curves: List of FatigueCurve objects (one per cycles array)
                        or single FatigueCurve for all
         n_jobs: Number of parallel jobs
+        backend: joblib backend (None for the default process pool)
         **kwargs: Additional arguments for calculate_damage
         
     Returns:
@@ -88,7 +305,7 @@ def batch_damage_calculation(
             for cycles, curve in zip(cycles_list, fatigue_curves)
         ])
     
-    damages = Parallel(n_jobs=n_jobs)(
+    damages = Parallel(n_jobs=n_jobs, backend=backend)(
         delayed(calculate_damage)(cycles, curve, **kwargs)
         for cycles, curve in zip(cycles_list, fatigue_curves)
     )
@@ -149,10 +366,267 @@ def parallel_rainflow_batch(
     return combine_cycles(cycles_list)
 
 
+@lru_cache(maxsize=8)
+def _open_memmap(path: str, dtype: np.dtype, length: int, mode: str) -> np.memmap:
+    """Open (once per process) a 1D memory-mapped array."""
+    return np.memmap(path, dtype=dtype, mode=mode, shape=(length,))
+
+
+def _count_memmap_block(
+    signals_path: str,
+    signal_dtype: np.dtype,
+    n_samples: int,
+    cycles_path: str,
+    cycle_dtype: np.dtype,
+    n_slots: int,
+    offsets: np.ndarray,
+    lengths: np.ndarray,
+    cycle_offsets: np.ndarray,
+    kwargs: dict
+) -> np.ndarray:
+    """
+    Count a block of signals stored in a memory-mapped file.
+    
+    Cycles of signal i are written to the cycles file starting at
+    cycle_offsets[i], where room for its largest possible number of cycles
+    is reserved, so only offsets and counts travel between processes.
+    
+    Returns:
+        Number of cycles written for each signal of the block
+    """
+    from .rainflow import rainflow_count
+    
+    # Not cached: the signals file is removed once the pack is counted
+    signals = np.memmap(signals_path, dtype=signal_dtype, mode='r', shape=(n_samples,))
+    out = _open_memmap(cycles_path, cycle_dtype, n_slots, 'r+')
+    
+    n_cycles = np.empty(len(offsets), dtype=np.int64)
+    for i in range(len(offsets)):
+        start = offsets[i]
+        cycles = rainflow_count(signals[start:start + lengths[i]], **kwargs)
+        out[cycle_offsets[i]:cycle_offsets[i] + len(cycles)] = cycles
+        n_cycles[i] = len(cycles)
+    
+    del signals
+    return n_cycles
+
+
+def _max_cycles(lengths: np.ndarray, periodic: bool = False) -> np.ndarray:
+    """
+    Largest number of cycles rainflow_count can return per signal.
+    
+    A history with r reversals (r <= n samples) gives at most r - 1 cycles:
+    each full cycle removes two points from the residue, which then yields
+    one half-cycle per remaining pair. A periodic count returns the cycles
+    of up to _MAX_PERIODIC_PASSES passes, each closing at most r / 2.
+    """
+    if periodic:
+        from .rainflow import _MAX_PERIODIC_PASSES
+        return lengths * _MAX_PERIODIC_PASSES // 2
+    return np.maximum(lengths - 1, 0)
+
+
+def _split_blocks(lengths: np.ndarray, n_blocks: int) -> List[np.ndarray]:
+    """Split signal indices into contiguous blocks of similar total length."""
+    if len(lengths) == 0:
+        return []
+    cumulative = np.cumsum(lengths)
+    targets = cumulative[-1] * np.arange(1, n_blocks) / n_blocks
+    bounds = np.unique(np.searchsorted(cumulative, targets, side='right'))
+    return [b for b in np.split(np.arange(len(lengths)), bounds) if len(b) > 0]
+
+
+class _AnalyzerState:
+    """
+    On-disk analysis state: cycles and damages of every analyzed signal.
+    
+    Layout of the state folder:
+        manifest.json          Count arguments, batches and damage aggregates
+        cycles_NNNNN.npy       Concatenated cycles of one batch of signals,
+                               in the dtype they were counted with
+        offsets_NNNNN.npy      Start of each signal in the batch (n + 1 values)
+        damages_NNNNN_K.npy    Damage per signal of the batch for damage key K
+    
+    A damage key is a fatigue curve plus calculate_damage arguments. Each
+    key keeps running aggregates (count, maximum, sum) that are updated as
+    batches are added, so history is never reloaded to update them.
+    """
+    
+    _MANIFEST = 'manifest.json'
+    
+    def __init__(self, state_dir: str):
+        self.state_dir = state_dir
+        os.makedirs(state_dir, exist_ok=True)
+        
+        path = os.path.join(state_dir, self._MANIFEST)
+        if os.path.exists(path):
+            with open(path) as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {
+                'version': 1,
+                'count_kwargs': None,
+                'batches': [],
+                'damage_keys': [],
+            }
+        
+        # History loaded so far: stored batches never change, so each one
+        # is read once per analyzer
+        self._cycles = []
+        self._n_loaded = 0
+        self._damages = {}
+    
+    @property
+    def n_signals(self) -> int:
+        """Number of signals stored in the state."""
+        return sum(batch['n_signals'] for batch in self.manifest['batches'])
+    
+    def _path(self, name: str) -> str:
+        return os.path.join(self.state_dir, name)
+    
+    def save(self):
+        """Write the manifest atomically."""
+        tmp_path = self._path(self._MANIFEST + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=1)
+        os.replace(tmp_path, self._path(self._MANIFEST))
+    
+    @staticmethod
+    def _manifest_kwargs(count_kwargs: dict) -> dict:
+        """Count arguments in the form stored in the manifest (JSON values)."""
+        kwargs = {
+            name: value.item() if isinstance(value, np.generic) else value
+            for name, value in count_kwargs.items()
+        }
+        if kwargs.get('dtype') is not None:
+            kwargs['dtype'] = np.dtype(kwargs['dtype']).str
+        try:
+            json.dumps(kwargs)
+        except TypeError as error:
+            raise ValueError(
+                f"Count arguments {kwargs} cannot be stored in the analyzer state: {error}"
+            ) from None
+        return kwargs
+    
+    def check_count_kwargs(self, count_kwargs: dict):
+        """Ensure new signals are counted like the stored ones."""
+        count_kwargs = self._manifest_kwargs(count_kwargs)
+        stored = self.manifest['count_kwargs']
+        if stored is not None and stored != count_kwargs:
+            raise ValueError(
+                f"Analyzer state was counted with {stored}, "
+                f"cannot append signals counted with {count_kwargs}"
+            )
+        self.manifest['count_kwargs'] = count_kwargs
+    
+    @staticmethod
+    def _batch_dtype(batch: dict) -> np.dtype:
+        """Cycle dtype of a stored batch (float64 cycles for older states)."""
+        fields = batch.get('cycle_dtype')
+        if fields is None:
+            return _CYCLE_DTYPE
+        return np.dtype([(name, code) for name, code in fields])
+    
+    def append_batch(self, cycles_list: List[np.ndarray]):
+        """Store the cycles of a batch of newly analyzed signals."""
+        batch_id = len(self.manifest['batches']) + 1
+        lengths = [len(cycles) for cycles in cycles_list]
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        
+        # Cycles keep the dtype they were counted with (precision, indices)
+        dtype = cycles_list[0].dtype if cycles_list else _CYCLE_DTYPE
+        if cycles_list:
+            cycles = np.concatenate([np.asarray(c, dtype=dtype) for c in cycles_list])
+        else:
+            cycles = np.empty(0, dtype=dtype)
+        
+        np.save(self._path(f'cycles_{batch_id:05d}.npy'), cycles)
+        np.save(self._path(f'offsets_{batch_id:05d}.npy'), offsets)
+        self.manifest['batches'].append({
+            'id': batch_id,
+            'n_signals': len(cycles_list),
+            'n_cycles': int(len(cycles)),
+            'cycle_dtype': [[name, dtype.fields[name][0].str] for name in dtype.names],
+            'damage_keys': [],
+        })
+    
+    def batch_cycles(self, batch: dict) -> List[np.ndarray]:
+        """Cycles of each signal of a batch (memory-mapped views)."""
+        if batch['n_cycles'] == 0:
+            dtype = self._batch_dtype(batch)
+            return [np.empty(0, dtype=dtype) for _ in range(batch['n_signals'])]
+        cycles = np.load(self._path(f"cycles_{batch['id']:05d}.npy"), mmap_mode='r')
+        offsets = np.load(self._path(f"offsets_{batch['id']:05d}.npy"))
+        return [cycles[offsets[i]:offsets[i + 1]] for i in range(batch['n_signals'])]
+    
+    def cycles_list(self) -> List[np.ndarray]:
+        """Cycles of every stored signal, in insertion order."""
+        batches = self.manifest['batches']
+        for batch in batches[self._n_loaded:]:
+            self._cycles.extend(self.batch_cycles(batch))
+        self._n_loaded = len(batches)
+        return list(self._cycles)
+    
+    def damage_key(self, curve_description: dict, damage_kwargs: dict) -> int:
+        """Index of a damage key, registering it if needed."""
+        for k, entry in enumerate(self.manifest['damage_keys']):
+            if entry['curve'] == curve_description and entry['kwargs'] == damage_kwargs:
+                return k
+        self.manifest['damage_keys'].append({
+            'curve': curve_description,
+            'kwargs': damage_kwargs,
+            'n_signals': 0,
+            'max_damage': 0.0,
+            'sum_damage': 0.0,
+        })
+        return len(self.manifest['damage_keys']) - 1
+    
+    def store_damages(self, batch: dict, key: int, damages: np.ndarray):
+        """Store the damages of a batch and update the key aggregates."""
+        np.save(self._path(f"damages_{batch['id']:05d}_{key}.npy"), damages)
+        batch['damage_keys'].append(key)
+        
+        entry = self.manifest['damage_keys'][key]
+        entry['n_signals'] += len(damages)
+        if len(damages) > 0:
+            entry['max_damage'] = max(entry['max_damage'], float(np.max(damages)))
+            entry['sum_damage'] += float(np.sum(damages))
+    
+    def missing_batches(self, key: int) -> List[dict]:
+        """Batches without damages for a key."""
+        return [b for b in self.manifest['batches'] if key not in b['damage_keys']]
+    
+    def damages(self, key: int) -> np.ndarray:
+        """Damages of every stored signal for a key."""
+        n_batches, damages = self._damages.get(key, (0, np.empty(0)))
+        batches = self.manifest['batches']
+        if n_batches < len(batches):
+            damages = np.concatenate([damages] + [
+                np.load(self._path(f"damages_{b['id']:05d}_{key}.npy"))
+                for b in batches[n_batches:]
+            ])
+            self._damages[key] = (len(batches), damages)
+        return damages.copy()
+
+
 class ParallelFatigueAnalyzer:
     """
     High-level class for parallel fatigue analysis of multiple signals.
     
+    With state_dir, every analyzed signal's cycles and damages are kept on
+    disk with a manifest. A new analyzer on the same folder resumes from
+    it: analyze() only counts the signals added since, and the damage
+    aggregates are updated incrementally. Stored signals are immutable.
+    
+    With backend='memmap', signals are packed in their own dtype into a
+    memory-mapped file and workers write their cycles into a second one;
+    tasks only carry file paths and offsets, and the returned cycle arrays
+    are views of the mapped results. The signals file is removed once
+    counted, and a cycles file once no memoized cycles refer to it. The
+    joblib worker pool and the workers' open mappings are reused across
+    calls. Call close() (or use the analyzer as a context manager) to
+    remove the temporary files.
+    
     Example:
         >>> analyzer = ParallelFatigueAnalyzer(n_jobs=4)
         >>> analyzer.add_signals(signals)
@@ -161,22 +635,69 @@ class ParallelFatigueAnalyzer:
         >>> print(results['damages'])
     """
     
-    def __init__(self, n_jobs: int = -1, verbose: int = 0):
+    def __init__(
+        self,
+        n_jobs: int = -1,
+        verbose: int = 0,
+        backend: Optional[str] = None,
+        temp_folder: Optional[str] = None,
+        state_dir: Optional[str] = None
+    ):
         """
         Initialize analyzer.
         
         Args:
             n_jobs: Number of parallel jobs
             verbose: Verbosity level
+            backend: None (default process pool), any joblib backend name
+                     such as 'threading', or 'memmap' for the shared-file
+                     process backend
+            temp_folder: Folder for the memmap files (None for the system
+                         temporary folder; /dev/shm keeps them in RAM)
+            state_dir: Folder of a persistent, resumable analysis state
+                       (None to keep everything in memory)
         """
         self.n_jobs = n_jobs
         self.verbose = verbose
+        self.backend = backend
+        self.temp_folder = temp_folder
         self.signals = []
         self.fatigue_curve = None
         self.cycles_list = None
+        self._temp_dir = None
+        self._n_packs = 0
+        # Per-signal memoization: cycles, the signal object they were
+        # counted from, and damages per calculate_damage arguments
+        self._cycles = []
+        self._counted = []
+        self._count_kwargs = None
+        self._damage_cache = {}
+        
+        # Persistent state: signals[:_n_stored] are already on disk
+        self._state = None
+        self._n_stored = 0
+        if state_dir is not None:
+            self._state = _AnalyzerState(state_dir)
+            self._count_kwargs = self._state.manifest['count_kwargs']
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def close(self):
+        """Remove the temporary files of the memmap backend."""
+        temp_dir = getattr(self, '_temp_dir', None)
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            self._temp_dir = None
         
     def add_signals(self, signals: List[np.ndarray]):
-        """Add signals to analyze."""
+        """Add signals to analyze (only new signals are counted later)."""
         self.signals.extend(signals)
         
     def set_fatigue_curve(self, curve):
@@ -188,54 +709,216 @@ class ParallelFatigueAnalyzer:
         """
         if isinstance(curve, str):
             from .eurocode import EurocodeCategory
-            self.fatigue_curve = EurocodeCategory.get_curve(curve)
-        else:
-            self.fatigue_curve = curve
+            curve = EurocodeCategory.get_curve(curve)
+        
+        if curve is not self.fatigue_curve:
+            self._damage_cache = {}
+        self.fatigue_curve = curve
     
     def count_cycles(self, **kwargs) -> List[np.ndarray]:
         """
         Perform rainflow counting on all signals in parallel.
         
+        Cycles are memoized per signal: signals already counted with the
+        same arguments are not counted again. Changing the arguments
+        recounts everything.
+        
         Args:
             **kwargs: Arguments passed to rainflow_count
             
         Returns:
             List of cycle arrays
         """
+        # Stored signals fix the count arguments: check before counting
+        if self._state is not None:
+            self._state.check_count_kwargs(dict(kwargs))
+        
+        if kwargs != self._count_kwargs:
+            self._cycles = []
+            self._counted = []
+            self._damage_cache = {}
+            self._count_kwargs = dict(kwargs)
+        
+        return self._update_cycles()
+    
+    def _dirty_indices(self) -> List[int]:
+        """Indices of signals without up-to-date cycles."""
+        n = len(self.signals)
+        del self._cycles[n:]
+        del self._counted[n:]
+        self._cycles.extend([None] * (n - len(self._cycles)))
+        self._counted.extend([None] * (n - len(self._counted)))
+        
+        return [
+            i for i in range(n)
+            if self._cycles[i] is None or self._counted[i] is not self.signals[i]
+        ]
+    
+    def _update_cycles(self) -> List[np.ndarray]:
+        """Count the signals added or replaced since the last count."""
+        if self._count_kwargs is None:
+            self._count_kwargs = {}
+        
+        dirty = self._dirty_indices()
+        if dirty:
+            if self._state is not None:
+                self._state.check_count_kwargs(self._count_kwargs)
+            counted = self._count_signals(
+                [self.signals[i] for i in dirty], **self._count_kwargs
+            )
+            for i, cycles in zip(dirty, counted):
+                self._cycles[i] = cycles
+                self._counted[i] = self.signals[i]
+            
+            for damages in self._damage_cache.values():
+                damages[[i for i in dirty if i < len(damages)]] = np.nan
+            
+            if self.backend == 'memmap':
+                self._remove_unused_packs()
+        
+        self.cycles_list = list(self._cycles)
+        return self.cycles_list
+    
+    def _count_signals(self, signals: List[np.ndarray], **kwargs) -> List[np.ndarray]:
+        """Count cycles of the given signals with the configured backend."""
         from .rainflow import rainflow_count
         
-        self.cycles_list = process_signals_parallel(
-            self.signals,
+        if self.backend == 'memmap':
+            return self._count_cycles_memmap(signals, **kwargs)
+        
+        return process_signals_parallel(
+            signals,
             rainflow_count,
             n_jobs=self.n_jobs,
             verbose=self.verbose,
+            backend=self.backend,
             **kwargs
         )
+    
+    def _count_cycles_memmap(self, signals: List[np.ndarray], **kwargs) -> List[np.ndarray]:
+        """Count cycles through memory-mapped signal and result files."""
+        from .rainflow import _check_dtype, _cycle_dtype
+        
+        if not signals:
+            return []
+        
+        cycle_dtype = _cycle_dtype(
+            _check_dtype(kwargs.get('dtype')), kwargs.get('return_indices', False)
+        )
+        lengths = np.array([len(sig) for sig in signals], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        n_samples = int(lengths.sum())
+        if n_samples == 0:
+            return [np.empty(0, dtype=cycle_dtype) for _ in signals]
         
-        return self.cycles_list
+        # Room for the largest possible number of cycles of each signal
+        slots = _max_cycles(lengths, kwargs.get('periodic', False))
+        cycle_offsets = np.concatenate(([0], np.cumsum(slots)[:-1]))
+        n_slots = max(int(slots.sum()), 1)
+        
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp(
+                prefix='openrainflow_', dir=self.temp_folder
+            )
+        
+        # New file names for every pack so cached worker mappings stay valid
+        self._n_packs += 1
+        signals_path = os.path.join(self._temp_dir, f'signals_{self._n_packs}.dat')
+        cycles_path = os.path.join(self._temp_dir, f'cycles_{self._n_packs}.dat')
+        
+        # Packed in the signals' own dtype (float32 and integer samples are
+        # counted natively by rainflow_count)
+        signal_dtype = np.result_type(*[np.asarray(sig).dtype for sig in signals])
+        packed = np.memmap(signals_path, dtype=signal_dtype, mode='w+', shape=(n_samples,))
+        for sig, start, n in zip(signals, offsets, lengths):
+            packed[start:start + n] = sig
+        packed.flush()
+        del packed
+        
+        results = np.memmap(cycles_path, dtype=cycle_dtype, mode='w+', shape=(n_slots,))
+        args = (signals_path, signal_dtype, n_samples, cycles_path, cycle_dtype, n_slots)
+        
+        try:
+            try:
+                from joblib import Parallel, delayed, effective_n_jobs
+            except ImportError:
+                warnings.warn(
+                    "joblib not installed. Falling back to sequential processing. "
+                    "Install with: pip install joblib"
+                )
+                n_cycles = _count_memmap_block(
+                    *args, offsets, lengths, cycle_offsets, kwargs
+                )
+            else:
+                blocks = _split_blocks(lengths, 4 * effective_n_jobs(self.n_jobs))
+                block_counts = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
+                    delayed(_count_memmap_block)(
+                        *args, offsets[block], lengths[block], cycle_offsets[block], kwargs
+                    )
+                    for block in blocks
+                )
+                n_cycles = np.concatenate(block_counts)
+        finally:
+            os.remove(signals_path)
+        
+        return [
+            results[start:start + n]
+            for start, n in zip(cycle_offsets, n_cycles)
+        ]
+    
+    def _remove_unused_packs(self):
+        """Delete the cycle files no memoized cycles point to any more."""
+        if self._temp_dir is None:
+            return
+        used = {
+            os.path.abspath(cycles.filename) for cycles in self._cycles
+            if getattr(cycles, 'filename', None) is not None
+        }
+        for filename in os.listdir(self._temp_dir):
+            path = os.path.join(self._temp_dir, filename)
+            if filename.startswith('cycles_') and os.path.abspath(path) not in used:
+                # Views still held by the caller stay readable on POSIX
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
     
     def calculate_damages(self, **kwargs) -> np.ndarray:
         """
         Calculate damage for all signals.
         
+        Damages are memoized per signal and per set of arguments; only
+        signals counted since the last call are evaluated.
+        
         Args:
             **kwargs: Arguments passed to calculate_damage
             
         Returns:
             Array of damage values
         """
-        if self.cycles_list is None:
-            self.count_cycles()
-        
         if self.fatigue_curve is None:
             raise ValueError("Fatigue curve not set. Use set_fatigue_curve()")
         
-        return batch_damage_calculation(
-            self.cycles_list,
-            self.fatigue_curve,
-            n_jobs=self.n_jobs,
-            **kwargs
-        )
+        self._update_cycles()
+        
+        key = tuple(sorted(kwargs.items()))
+        n = len(self.signals)
+        damages = self._damage_cache.get(key, np.empty(0))[:n]
+        if len(damages) < n:
+            damages = np.concatenate((damages, np.full(n - len(damages), np.nan)))
+        
+        missing = np.flatnonzero(np.isnan(damages))
+        if len(missing) > 0:
+            damages[missing] = batch_damage_calculation(
+                [self._cycles[i] for i in missing],
+                self.fatigue_curve,
+                n_jobs=self.n_jobs,
+                backend='threading' if self.backend == 'threading' else None,
+                **kwargs
+            )
+        
+        self._damage_cache[key] = damages
+        return damages.copy()
     
     def analyze(
         self,
@@ -245,27 +928,25 @@ class ParallelFatigueAnalyzer:
         """
         Perform complete fatigue analysis.
         
+        Lives are derived from the memoized damages (life = 1 / damage),
+        so repeated calls only process signals added since the last one.
+        
         Args:
             design_life: Design life for assessment
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments passed to calculate_damage
             
         Returns:
             Dictionary with results
         """
-        from .damage import calculate_life
-        
-        # Count cycles
-        if self.cycles_list is None:
-            self.count_cycles()
-        
-        # Calculate damages
+        # Calculate damages (counts new signals if needed)
         damages = self.calculate_damages(**kwargs)
         
+        if self._state is not None:
+            return self._analyze_with_state(damages, design_life, kwargs)
+        
         # Calculate lives
-        lives = np.array([
-            calculate_life(cycles, self.fatigue_curve, **kwargs)
-            for cycles in self.cycles_list
-        ])
+        with np.errstate(divide='ignore'):
+            lives = np.where(damages > 0, 1.0 / damages, np.inf)
         
         # Utilization
         utilizations = design_life / lives
@@ -284,9 +965,66 @@ class ParallelFatigueAnalyzer:
         
         return results
     
+    def _analyze_with_state(
+        self,
+        damages: np.ndarray,
+        design_life: float,
+        damage_kwargs: dict
+    ) -> dict:
+        """Store the new signals and build results over the whole state."""
+        from .damage import calculate_damage
+        
+        state = self._state
+        curve = self.fatigue_curve
+        key = state.damage_key(
+            {
+                'name': curve.name,
+                'delta_sigma_c': curve.delta_sigma_c,
+                'm1': curve.m1,
+                'm2': curve.m2,
+                'N_knee': curve.N_knee,
+                'N_cutoff': curve.N_cutoff,
+                'delta_sigma_L': curve.delta_sigma_L,
+            },
+            damage_kwargs
+        )
+        
+        # Damages for this key of batches stored before it was used
+        for batch in state.missing_batches(key):
+            state.store_damages(batch, key, np.array([
+                calculate_damage(cycles, curve, **damage_kwargs)
+                for cycles in state.batch_cycles(batch)
+            ]))
+        
+        # Append the signals analyzed since the last call
+        new = slice(self._n_stored, len(self.signals))
+        if new.start < new.stop:
+            state.append_batch(self.cycles_list[new])
+            state.store_damages(state.manifest['batches'][-1], key, damages[new])
+            self._n_stored = len(self.signals)
+        state.save()
+        
+        entry = state.manifest['damage_keys'][key]
+        all_damages = state.damages(key)
+        with np.errstate(divide='ignore'):
+            lives = np.where(all_damages > 0, 1.0 / all_damages, np.inf)
+            min_life = 1.0 / entry['max_damage'] if entry['max_damage'] > 0 else np.inf
+        
+        return {
+            'n_signals': state.n_signals,
+            'cycles_list': state.cycles_list(),
+            'damages': all_damages,
+            'lives': lives,
+            'utilizations': design_life / lives,
+            'design_life': design_life,
+            'max_damage': entry['max_damage'],
+            'min_life': min_life,
+            'max_utilization': design_life * entry['max_damage'],
+        }
+    
     def get_summary(self) -> str:
         """Get summary statistics as formatted string."""
-        if self.cycles_list is None:
+        if self.cycles_list is None and (self._state is None or self._state.n_signals == 0):
             return "No analysis performed yet."
         
         results = self.analyze()
@@ -5,16 +5,34 @@ Implementation based on ASTM E1049-85 standard with optimizations using Numba JI
 """
 
 import numpy as np
-from numba import njit
+from numba import njit, prange, get_num_threads, threading_layer
 from typing import Tuple, Optional
+import hashlib
+import inspect
+import threading
 import warnings
 
 
-@njit(cache=True)
+# Reversal detection switches to branch-free compaction when at least one
+# sampled point in _DENSE_REVERSALS is a reversal
+_DENSE_REVERSALS = 8
+_SAMPLE_WINDOWS = 8
+_SAMPLE_WIDTH = 256
+
+
+@njit(cache=True, nogil=True)
 def _find_reversals(signal: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
     Identify turning points (peaks and valleys) in a signal.
     
+    Point i is a peak if x[i] >= x[i-1] and x[i] > x[i+1] (a valley with
+    the comparisons reversed), so a plateau contributes its last point.
+    
+    The scan loop is chosen from the reversal density of a few sampled
+    windows: noisy signals use branch-free compaction
+    (_reversals_branch_free), smooth signals, whose branches are well
+    predicted, keep the branchy loop. Both loops give the same points.
+    
     Args:
         signal: Input time series data
         
@@ -35,15 +53,19 @@ def _find_reversals(signal: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     indices[0] = 0
     count = 1
     
-    i = 1
-    while i < n - 1:
-        # Check if this is a peak or valley
-        if (signal[i] >= signal[i-1] and signal[i] > signal[i+1]) or \
-           (signal[i] <= signal[i-1] and signal[i] < signal[i+1]):
-            reversals[count] = signal[i]
-            indices[count] = i
-            count += 1
-        i += 1
+    n_reversals, n_sampled = _sample_reversals(signal)
+    if n_reversals * _DENSE_REVERSALS >= n_sampled:
+        count = _reversals_branch_free(signal, reversals, indices)
+    else:
+        i = 1
+        while i < n - 1:
+            # Check if this is a peak or valley
+            if (signal[i] >= signal[i-1] and signal[i] > signal[i+1]) or \
+               (signal[i] <= signal[i-1] and signal[i] < signal[i+1]):
+                reversals[count] = signal[i]
+                indices[count] = i
+                count += 1
+            i += 1
     
     # Last point is always a reversal
     reversals[count] = signal[-1]
@@ -53,38 +75,343 @@ def _find_reversals(signal: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     return reversals[:count], indices[:count]
 
 
-@njit(cache=True)
-def _rainflow_core(reversals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+@njit(cache=True, nogil=True)
+def _sample_reversals(signal: np.ndarray) -> Tuple[int, int]:
     """
-    Core rainflow counting algorithm using the three-point method.
+    Count the reversals in a few windows spread over the signal.
     
-    This is the optimized JIT-compiled core function.
+    Args:
+        signal: Input time series data (at least 3 points)
+        
+    Returns:
+        n_reversals: Number of reversals found in the windows
+        n_sampled: Number of points tested
+    """
+    n = len(signal)
+    step = max((n - 2) // _SAMPLE_WINDOWS, 1)
+    n_reversals = 0
+    n_sampled = 0
+    for w in range(_SAMPLE_WINDOWS):
+        start = 1 + w * step
+        end = min(start + _SAMPLE_WIDTH, n - 1)
+        for i in range(start, end):
+            previous = signal[i - 1]
+            current = signal[i]
+            following = signal[i + 1]
+            n_reversals += ((current >= previous) & (current > following)) | \
+                           ((current <= previous) & (current < following))
+        n_sampled += max(end - start, 0)
+    return n_reversals, n_sampled
+
+
+@njit(cache=True, nogil=True)
+def _reversals_branch_free(
+    signal: np.ndarray,
+    reversals: np.ndarray,
+    indices: np.ndarray
+) -> int:
+    """
+    Write the interior reversals after the first point, without branching.
+    
+    Every point is written to the next free slot, and the slot is kept only
+    if the point is a peak or valley. On noisy signals the outcome of the
+    test is unpredictable, so avoiding the branch is faster than skipping
+    the writes.
     
     Args:
-        reversals: Array of reversal points (peaks and valleys)
+        signal: Input time series data (at least 3 points)
+        reversals, indices: Outputs, slot 0 holding the first point
         
     Returns:
-        ranges: Array of cycle ranges (stress range)
-        means: Array of cycle means (mean stress)
-        counts: Array of cycle counts (0.5 for half-cycles, 1.0 for full cycles)
+        Number of reversals written, the first point included
+    """
+    n = len(signal)
+    count = 1
+    
+    previous = signal[0]
+    current = signal[1]
+    for i in range(1, n - 1):
+        following = signal[i + 1]
+        reversals[count] = current
+        indices[count] = i
+        count += ((current >= previous) & (current > following)) | \
+                 ((current <= previous) & (current < following))
+        previous = current
+        current = following
+    
+    return count
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _find_reversals_parallel(
+    signal: np.ndarray,
+    n_chunks: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Identify turning points with the chunks scanned in parallel.
+    
+    Same result as _find_reversals. The classification of a point only
+    reads its two neighbours, which are taken from the full signal, so
+    points at chunk boundaries and on plateaus spanning several chunks
+    are classified exactly as in the sequential scan. A first parallel
+    pass counts the reversals of each chunk, a prefix sum of the counts
+    gives each chunk its output offset, and a second parallel pass writes
+    the reversals with branch-free compaction.
+    
+    Args:
+        signal: Input time series data
+        n_chunks: Number of chunks (at most one per interior point)
+        
+    Returns:
+        reversals: Array of reversal values
+        indices: Array of indices where reversals occur
+    """
+    n = len(signal)
+    if n < 3:
+        return signal.copy(), np.arange(n)
+    
+    # Interior points 1..n-2 in contiguous chunks of equal size
+    n_interior = n - 2
+    n_chunks = min(max(n_chunks, 1), n_interior)
+    size = (n_interior + n_chunks - 1) // n_chunks
+    n_chunks = (n_interior + size - 1) // size
+    
+    counts = np.empty(n_chunks, dtype=np.int64)
+    for c in prange(n_chunks):
+        start = 1 + c * size
+        end = min(start + size, n - 1)
+        count = 0
+        for i in range(start, end):
+            previous = signal[i - 1]
+            current = signal[i]
+            following = signal[i + 1]
+            count += ((current >= previous) & (current > following)) | \
+                     ((current <= previous) & (current < following))
+        counts[c] = count
+    
+    # Output offset of each chunk, after the first point
+    offsets = np.empty(n_chunks + 1, dtype=np.int64)
+    offsets[0] = 1
+    for c in range(n_chunks):
+        offsets[c + 1] = offsets[c] + counts[c]
+    total = offsets[n_chunks] + 1
+    
+    # One spare slot per chunk after the output: once a chunk has written
+    # its last reversal, the remaining speculative writes go there instead
+    # of into the first slot of the next chunk
+    reversals = np.empty(total + n_chunks, dtype=signal.dtype)
+    indices = np.empty(total + n_chunks, dtype=np.int64)
+    
+    # First and last points are always reversals
+    reversals[0] = signal[0]
+    indices[0] = 0
+    reversals[total - 1] = signal[n - 1]
+    indices[total - 1] = n - 1
+    
+    for c in prange(n_chunks):
+        start = 1 + c * size
+        end = min(start + size, n - 1)
+        slot = offsets[c]
+        last = offsets[c + 1]
+        spare = total + c
+        for i in range(start, end):
+            previous = signal[i - 1]
+            current = signal[i]
+            following = signal[i + 1]
+            target = slot if slot < last else spare
+            reversals[target] = current
+            indices[target] = i
+            slot += ((current >= previous) & (current > following)) | \
+                    ((current <= previous) & (current < following))
+    
+    return reversals[:total], indices[:total]
+
+
+@njit(cache=True, nogil=True)
+def _hysteresis_filter(
+    reversals: np.ndarray,
+    indices: np.ndarray,
+    gate: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Remove turning points whose excursion is smaller than the gate.
+    
+    Racetrack (hysteresis) filter: a reversal is only confirmed once the
+    signal has moved back from the running extreme by at least ``gate``.
+    Every range between consecutive retained points is therefore >= gate,
+    except the one from the first point (the start of the history) to the
+    first confirmed extreme, so the counting stage never sees the small
+    reversals.
+    
+    Args:
+        reversals: Array of reversal values from _find_reversals
+        indices: Array of indices where reversals occur
+        gate: Minimum range between retained turning points
+        
+    Returns:
+        reversals: Filtered reversal values
+        indices: Indices of the retained reversals
     """
     n = len(reversals)
-    if n < 2:
-        return np.empty(0), np.empty(0), np.empty(0)
+    out = np.empty(n, dtype=reversals.dtype)
+    out_indices = np.empty(n, dtype=np.int64)
+    if n == 0:
+        return out, out_indices
     
-    # Stack for processing
-    stack = np.empty(n, dtype=reversals.dtype)
-    stack_ptr = 0
+    # First point is always kept
+    out[0] = reversals[0]
+    out_indices[0] = indices[0]
+    count = 1
     
-    # Results storage (maximum possible size is n//2 full cycles + n//2 half cycles)
-    max_cycles = n
-    ranges = np.empty(max_cycles, dtype=reversals.dtype)
-    means = np.empty(max_cycles, dtype=reversals.dtype)
-    counts = np.empty(max_cycles, dtype=np.float64)
-    cycle_count = 0
+    # Direction of the current excursion (0: not yet left the gate band).
+    # Until then the running maximum and minimum are tracked: the band is
+    # left once they are gate apart, and the older of the two is a turning
+    # point unless it is the first point itself
+    direction = 0
+    candidate = reversals[0]
+    candidate_index = indices[0]
+    high = reversals[0]
+    high_index = indices[0]
+    low = reversals[0]
+    low_index = indices[0]
+    
+    for i in range(1, n):
+        x = reversals[i]
+        if direction == 0:
+            if x > high:
+                high = x
+                high_index = indices[i]
+            elif x < low:
+                low = x
+                low_index = indices[i]
+            if high - low >= gate:
+                if x == high:
+                    # Rising excursion: the minimum is the first valley
+                    if low_index != indices[0]:
+                        out[count] = low
+                        out_indices[count] = low_index
+                        count += 1
+                    direction = 1
+                else:
+                    # Falling excursion: the maximum is the first peak
+                    if high_index != indices[0]:
+                        out[count] = high
+                        out_indices[count] = high_index
+                        count += 1
+                    direction = -1
+                candidate = x
+                candidate_index = indices[i]
+        elif direction > 0:
+            if x > candidate:
+                candidate = x
+                candidate_index = indices[i]
+            elif candidate - x >= gate:
+                # Peak confirmed
+                out[count] = candidate
+                out_indices[count] = candidate_index
+                count += 1
+                direction = -1
+                candidate = x
+                candidate_index = indices[i]
+        else:
+            if x < candidate:
+                candidate = x
+                candidate_index = indices[i]
+            elif x - candidate >= gate:
+                # Valley confirmed
+                out[count] = candidate
+                out_indices[count] = candidate_index
+                count += 1
+                direction = 1
+                candidate = x
+                candidate_index = indices[i]
+    
+    # Last pending extreme closes the history (nothing if the signal never
+    # left the gate band)
+    if direction != 0:
+        out[count] = candidate
+        out_indices[count] = candidate_index
+        count += 1
     
-    for reversal in reversals:
-        stack[stack_ptr] = reversal
+    return out[:count], out_indices[:count]
+
+
+@njit(cache=True, nogil=True)
+def _rainflow_feed(
+    reversals: np.ndarray,
+    stack: np.ndarray,
+    stack_ptr: int,
+    ranges: np.ndarray,
+    means: np.ndarray,
+    counts: np.ndarray,
+    cycle_count: int
+) -> Tuple[int, int]:
+    """
+    Feed reversals through the three-point method, extracting closed cycles.
+    
+    This is the incremental part of the counting shared by _rainflow_core
+    and the streaming counters: the stack (residue) is carried between calls
+    so a history can be counted block by block with identical results.
+    
+    The stack must have room for stack_ptr + len(reversals) points and the
+    outputs for (stack_ptr + len(reversals)) // 2 more cycles.
+    
+    Args:
+        reversals: Array of reversal points to push
+        stack: Counting stack (residue), modified in place
+        stack_ptr: Number of points currently on the stack
+        ranges: Output array for cycle ranges
+        means: Output array for cycle means
+        counts: Output array for cycle counts
+        cycle_count: Number of cycles already written to the outputs
+        
+    Returns:
+        stack_ptr: Updated number of points on the stack
+        cycle_count: Updated number of cycles written to the outputs
+    """
+    return _rainflow_feed_indexed(
+        reversals, stack, stack_ptr, ranges, means, counts, cycle_count,
+        None, None, None, None
+    )
+
+
+@njit(cache=True, nogil=True)
+def _rainflow_feed_indexed(
+    reversals: np.ndarray,
+    stack: np.ndarray,
+    stack_ptr: int,
+    ranges: np.ndarray,
+    means: np.ndarray,
+    counts: np.ndarray,
+    cycle_count: int,
+    indices: Optional[np.ndarray],
+    stack_indices: Optional[np.ndarray],
+    starts: Optional[np.ndarray],
+    ends: Optional[np.ndarray]
+) -> Tuple[int, int]:
+    """
+    _rainflow_feed, optionally tracking the sample index of every point.
+    
+    The sample indices are carried on a stack parallel to the counting stack
+    and the indices of the two turning points of each cycle are written to
+    starts and ends. When indices is None the index branches are pruned at
+    compile time, so _rainflow_feed does no index bookkeeping.
+    
+    Args:
+        reversals, stack, stack_ptr, ranges, means, counts, cycle_count:
+            As for _rainflow_feed
+        indices: Sample index of each reversal, or None
+        stack_indices: Index stack, parallel to stack, or None
+        starts, ends: Outputs for the cycle sample indices, or None
+        
+    Returns:
+        stack_ptr: Updated number of points on the stack
+        cycle_count: Updated number of cycles written to the outputs
+    """
+    for k in range(len(reversals)):
+        stack[stack_ptr] = reversals[k]
+        if indices is not None:
+            stack_indices[stack_ptr] = indices[k]
         stack_ptr += 1
         
         # Try to extract cycles
@@ -105,39 +432,75 @@ def _rainflow_core(reversals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.nd
                 # Check if X-Y can be extracted as a full cycle
                 if range_XY <= range_VW and range_WX <= range_VW:
                     # Extract full cycle X-Y
-                    cycle_range = range_XY
-                    cycle_mean = (X + Y) / 2.0
-                    
-                    ranges[cycle_count] = cycle_range
-                    means[cycle_count] = cycle_mean
+                    ranges[cycle_count] = range_XY
+                    means[cycle_count] = (X + Y) / 2.0
                     counts[cycle_count] = 1.0  # Full cycle
+                    if indices is not None:
+                        starts[cycle_count] = stack_indices[stack_ptr - 2]
+                        ends[cycle_count] = stack_indices[stack_ptr - 1]
                     cycle_count += 1
                     
                     # Remove X and Y from stack
                     stack[stack_ptr - 2] = stack[stack_ptr - 1]
+                    if indices is not None:
+                        stack_indices[stack_ptr - 2] = stack_indices[stack_ptr - 1]
                     stack_ptr -= 2
                     continue
             
-            # Check if we have at least 3 points and X-Y >= W-X
-            if stack_ptr >= 3:
-                range_WX = abs(X - W)
-                if range_XY >= range_WX:
-                    # Extract full cycle W-X
-                    cycle_range = range_WX
-                    cycle_mean = (W + X) / 2.0
-                    
-                    ranges[cycle_count] = cycle_range
-                    means[cycle_count] = cycle_mean
-                    counts[cycle_count] = 1.0  # Full cycle
-                    cycle_count += 1
-                    
-                    # Remove W and X from stack
-                    stack[stack_ptr - 3] = stack[stack_ptr - 1]
-                    stack_ptr -= 2
-                    continue
+            # Check if X-Y >= W-X
+            range_WX = abs(X - W)
+            if range_XY >= range_WX:
+                # Extract full cycle W-X
+                ranges[cycle_count] = range_WX
+                means[cycle_count] = (W + X) / 2.0
+                counts[cycle_count] = 1.0  # Full cycle
+                if indices is not None:
+                    starts[cycle_count] = stack_indices[stack_ptr - 3]
+                    ends[cycle_count] = stack_indices[stack_ptr - 2]
+                cycle_count += 1
+                
+                # Remove W and X from stack
+                stack[stack_ptr - 3] = stack[stack_ptr - 1]
+                if indices is not None:
+                    stack_indices[stack_ptr - 3] = stack_indices[stack_ptr - 1]
+                stack_ptr -= 2
+                continue
             
             break
     
+    return stack_ptr, cycle_count
+
+
+@njit(cache=True, nogil=True)
+def _rainflow_count_into(
+    reversals: np.ndarray,
+    stack: np.ndarray,
+    ranges: np.ndarray,
+    means: np.ndarray,
+    counts: np.ndarray,
+    indices: Optional[np.ndarray] = None,
+    stack_indices: Optional[np.ndarray] = None,
+    starts: Optional[np.ndarray] = None,
+    ends: Optional[np.ndarray] = None
+) -> int:
+    """
+    Count a whole history into preallocated outputs (full and half cycles).
+    
+    Args:
+        reversals: Array of reversal points
+        stack: Counting stack with room for len(reversals) points
+        ranges, means, counts: Outputs with room for len(reversals) cycles
+        indices, stack_indices, starts, ends: Optional index tracking (see
+                                              _rainflow_feed_indexed)
+        
+    Returns:
+        Number of cycles written
+    """
+    stack_ptr, cycle_count = _rainflow_feed_indexed(
+        reversals, stack, 0, ranges, means, counts, 0,
+        indices, stack_indices, starts, ends
+    )
+    
     # Extract remaining half-cycles from stack
     for i in range(stack_ptr - 1):
         cycle_range = abs(stack[i + 1] - stack[i])
@@ -146,32 +509,681 @@ def _rainflow_core(reversals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.nd
         ranges[cycle_count] = cycle_range
         means[cycle_count] = cycle_mean
         counts[cycle_count] = 0.5  # Half cycle
+        if indices is not None:
+            starts[cycle_count] = stack_indices[i]
+            ends[cycle_count] = stack_indices[i + 1]
         cycle_count += 1
     
+    return cycle_count
+
+
+@njit(cache=True, nogil=True)
+def _rainflow_core(reversals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Core rainflow counting algorithm using the three-point method.
+    
+    This is the optimized JIT-compiled core function.
+    
+    Args:
+        reversals: Array of reversal points (peaks and valleys)
+        
+    Returns:
+        ranges: Array of cycle ranges (stress range)
+        means: Array of cycle means (mean stress)
+        counts: Array of cycle counts (0.5 for half-cycles, 1.0 for full cycles)
+    """
+    n = len(reversals)
+    if n < 2:
+        empty = np.empty(0, dtype=reversals.dtype)
+        return empty, empty.copy(), np.empty(0, dtype=np.float64)
+    
+    # Stack for processing
+    stack = np.empty(n, dtype=reversals.dtype)
+    
+    # Results storage (maximum possible size is n//2 full cycles + n//2 half cycles)
+    max_cycles = n
+    ranges = np.empty(max_cycles, dtype=reversals.dtype)
+    means = np.empty(max_cycles, dtype=reversals.dtype)
+    counts = np.empty(max_cycles, dtype=np.float64)
+    
+    cycle_count = _rainflow_count_into(reversals, stack, ranges, means, counts)
+    
+    return ranges[:cycle_count], means[:cycle_count], counts[:cycle_count]
+
+
+@njit(cache=True, nogil=True)
+def _rainflow_core_int(reversals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rainflow counting of integer samples (e.g. ADC counts).
+    
+    Comparisons are exact and ranges are computed in int64, so int16
+    differences cannot overflow; means are exact half-integers in float64.
+    
+    Args:
+        reversals: Array of integer reversal points
+        
+    Returns:
+        ranges: Array of cycle ranges (int64)
+        means: Array of cycle means (float64)
+        counts: Array of cycle counts (0.5 for half-cycles, 1.0 for full cycles)
+    """
+    n = len(reversals)
+    if n < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+    
+    stack = np.empty(n, dtype=reversals.dtype)
+    ranges = np.empty(n, dtype=np.int64)
+    means = np.empty(n, dtype=np.float64)
+    counts = np.empty(n, dtype=np.float64)
+    
+    cycle_count = _rainflow_count_into(reversals, stack, ranges, means, counts)
+    
     return ranges[:cycle_count], means[:cycle_count], counts[:cycle_count]
 
 
+def _rainflow_core_indexed(
+    reversals: np.ndarray,
+    indices: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rainflow counting with the start and end sample index of every cycle.
+    
+    Output dtypes follow _rainflow_core (float signals) and
+    _rainflow_core_int (integer signals).
+    
+    Args:
+        reversals: Array of reversal points
+        indices: Sample index of each reversal
+        
+    Returns:
+        ranges, means, counts: As returned by _rainflow_core
+        starts, ends: Sample indices of the two turning points of each cycle
+    """
+    n = len(reversals)
+    if reversals.dtype.kind == 'i':
+        range_dtype, mean_dtype = np.int64, np.float64
+    else:
+        range_dtype = mean_dtype = reversals.dtype
+    
+    ranges = np.empty(n, dtype=range_dtype)
+    means = np.empty(n, dtype=mean_dtype)
+    counts = np.empty(n, dtype=np.float64)
+    starts = np.empty(n, dtype=np.int64)
+    ends = np.empty(n, dtype=np.int64)
+    if n < 2:
+        return ranges[:0], means[:0], counts[:0], starts[:0], ends[:0]
+    
+    cycle_count = _rainflow_count_into(
+        reversals, np.empty(n, dtype=reversals.dtype), ranges, means, counts,
+        np.ascontiguousarray(indices, dtype=np.int64), np.empty(n, dtype=np.int64),
+        starts, ends
+    )
+    
+    return (ranges[:cycle_count], means[:cycle_count], counts[:cycle_count],
+            starts[:cycle_count], ends[:cycle_count])
+
+
+def _output_dtypes(dtype: np.dtype) -> Tuple[np.dtype, np.dtype]:
+    """Range and mean dtypes of the counting outputs for a reversal dtype."""
+    if np.dtype(dtype).kind == 'i':
+        return np.dtype(np.int64), np.dtype(np.float64)
+    return np.dtype(dtype), np.dtype(dtype)
+
+
+def _feed(
+    reversals: np.ndarray,
+    stack: np.ndarray,
+    stack_ptr: int
+) -> Tuple[np.ndarray, int, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Feed reversals on top of a residue and return the closed cycles.
+    
+    Args:
+        reversals: Reversal points to push
+        stack: Counting stack (grown if too small)
+        stack_ptr: Number of points currently on the stack
+        
+    Returns:
+        stack, stack_ptr: Updated residue
+        ranges, means, counts: Closed cycles
+    """
+    needed = stack_ptr + len(reversals)
+    if len(stack) < needed:
+        grown = np.empty(max(needed, 2 * len(stack)), dtype=stack.dtype)
+        grown[:stack_ptr] = stack[:stack_ptr]
+        stack = grown
+    
+    range_dtype, mean_dtype = _output_dtypes(stack.dtype)
+    n_out = needed // 2 + 1
+    ranges = np.empty(n_out, dtype=range_dtype)
+    means = np.empty(n_out, dtype=mean_dtype)
+    counts = np.empty(n_out, dtype=np.float64)
+    
+    stack_ptr, cycle_count = _rainflow_feed(
+        reversals, stack, stack_ptr, ranges, means, counts, 0
+    )
+    return (stack, stack_ptr, ranges[:cycle_count], means[:cycle_count],
+            counts[:cycle_count])
+
+
+def _feed_repeated(
+    reversals: np.ndarray,
+    repetitions: int,
+    stack: np.ndarray,
+    stack_ptr: int
+) -> Tuple[np.ndarray, int, list]:
+    """
+    Feed the same reversals several times in a row.
+    
+    Counting is deterministic, so once a repetition leaves the residue
+    unchanged every further repetition closes the same cycles: their counts
+    are multiplied instead of feeding the block again.
+    
+    Returns:
+        stack, stack_ptr: Updated residue
+        cycles: List of (ranges, means, counts) with scaled counts
+    """
+    cycles = []
+    done = 0
+    while done < repetitions:
+        before = stack[:stack_ptr].copy()
+        stack, stack_ptr, ranges, means, counts = _feed(reversals, stack, stack_ptr)
+        done += 1
+        if stack_ptr == len(before) and np.array_equal(stack[:stack_ptr], before):
+            counts = counts * (repetitions - done + 1)
+            done = repetitions
+        cycles.append((ranges, means, counts))
+    return stack, stack_ptr, cycles
+
+
+# Passes allowed for the residue of a periodic history to repeat
+_MAX_PERIODIC_PASSES = 16
+
+
+def _feed_periodic(prime: list, plan: list, stack: np.ndarray) -> list:
+    """
+    Closed cycles of one period of an endlessly repeated reversal sequence.
+    
+    The first period is fed as recorded, then the sequence is fed until
+    the residue left by a pass equals the residue left by an earlier pass.
+    From then on the passes repeat with period k (k > 1 when equal values
+    make the residue alternate); the cycles closed by the last k passes,
+    with their counts divided by k, are the mean cycles of one period.
+    
+    Args:
+        prime: List of (reversals, repetitions) of the first period
+        plan: List of (reversals, repetitions) of the following periods
+        stack: Empty counting stack
+        
+    Returns:
+        List of (ranges, means, counts)
+    """
+    stack_ptr = 0
+    for reversals, repetitions in prime:
+        stack, stack_ptr, _ = _feed_repeated(reversals, repetitions, stack, stack_ptr)
+    
+    residues = [stack[:stack_ptr].copy()]
+    passes = []
+    for _ in range(_MAX_PERIODIC_PASSES):
+        cycles = []
+        for reversals, repetitions in plan:
+            stack, stack_ptr, fed = _feed_repeated(reversals, repetitions, stack, stack_ptr)
+            cycles.extend(fed)
+        passes.append(cycles)
+        
+        residue = stack[:stack_ptr]
+        for i, earlier in enumerate(residues):
+            if len(earlier) == stack_ptr and np.array_equal(earlier, residue):
+                period = len(residues) - i
+                if period == 1:
+                    return cycles
+                return [
+                    (ranges, means, counts / period)
+                    for cycles in passes[-period:]
+                    for ranges, means, counts in cycles
+                ]
+        residues.append(residue.copy())
+    
+    warnings.warn("Residue of the periodic history did not become steady")
+    return passes[-1]
+
+
+def _rainflow_core_periodic(
+    reversals: np.ndarray,
+    first: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rainflow counting of one period of an endlessly repeated history.
+    
+    Every cycle is closed: the residue is carried into the next period
+    instead of being counted as half-cycles. The result equals the cycles
+    added by each further repetition when the repeated history is counted.
+    
+    Args:
+        reversals: Reversal points of one period (cyclic neighbours)
+        first: Reversal points of the first period as recorded (default:
+               reversals)
+        
+    Returns:
+        ranges, means, counts: As returned by _rainflow_core
+    """
+    range_dtype, mean_dtype = _output_dtypes(reversals.dtype)
+    if len(reversals) < 2:
+        return (np.empty(0, dtype=range_dtype), np.empty(0, dtype=mean_dtype),
+                np.empty(0))
+    if first is None:
+        first = reversals
+    
+    stack = np.empty(2 * len(reversals) + 1, dtype=reversals.dtype)
+    cycles = _feed_periodic([(first, 1)], [(reversals, 1)], stack)
+    
+    return tuple(np.concatenate(field) for field in zip(*cycles))
+
+
+# Kernels compiled into the AOT extension, with the kernels they call
+_AOT_SOURCES = (
+    _find_reversals, _sample_reversals, _reversals_branch_free, _hysteresis_filter,
+    _rainflow_feed, _rainflow_feed_indexed, _rainflow_count_into, _rainflow_core
+)
+
+
+def _kernel_fingerprint() -> int:
+    """
+    Fingerprint of the sources of the kernels exported by build_aot.
+    
+    It is stored in the extension when it is built, so an extension built
+    from other kernels (e.g. before an upgrade) is detected.
+    """
+    try:
+        source = ''.join(inspect.getsource(kernel.py_func) for kernel in _AOT_SOURCES)
+    except OSError:
+        source = ''
+    return int.from_bytes(hashlib.sha256(source.encode()).digest()[:7], 'little')
+
+
+def _checked_aot(module):
+    """Return the AOT extension if it was built from the current kernels, else None."""
+    fingerprint = getattr(module, 'kernel_fingerprint', None)
+    if fingerprint is None or fingerprint() != _kernel_fingerprint():
+        warnings.warn(
+            "openrainflow._aot was built from other kernel sources and is ignored. "
+            "Rebuild it with openrainflow.jit.build_aot()"
+        )
+        return None
+    return module
+
+
+# Ahead-of-time compiled kernels (see openrainflow.jit.build_aot)
+try:
+    from . import _aot
+except ImportError:
+    _aot = None
+else:
+    _aot = _checked_aot(_aot)
+
+_JIT_KERNELS = {
+    'find_reversals': _find_reversals,
+    'hysteresis_filter': _hysteresis_filter,
+    'rainflow_core': _rainflow_core,
+    'rainflow_core_int': _rainflow_core_int,
+}
+
+
+def _kernel(name: str, dtype: np.dtype):
+    """
+    Return a counting kernel for the given signal dtype.
+    
+    The AOT-compiled variant is used when the extension has been built, so
+    the first call needs neither JIT compilation nor a cache lookup.
+    Integer samples, and dtypes the extension was not built for, use the
+    JIT kernels.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'i':
+        if name == 'rainflow_core':
+            name = 'rainflow_core_int'
+        return _JIT_KERNELS[name]
+    if _aot is not None:
+        kernel = getattr(_aot, f'{name}_{dtype.name}', None)
+        if kernel is not None:
+            return kernel
+    return _JIT_KERNELS[name]
+
+
+# Signals from this length on are scanned for reversals in parallel chunks
+# when Numba runs more than one thread
+_PARALLEL_REVERSALS_MIN = 1 << 22
+
+# Numba threading layers that may be entered from several threads at once
+_THREADSAFE_LAYERS = ('tbb', 'omp')
+
+
+def _reversals(signal: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the reversals of a full signal.
+    
+    Long signals are split into a few chunks per Numba thread and scanned
+    by _find_reversals_parallel; the result is the same. Outside the main
+    thread (rainflow_count_parallel with backend='threading', executors)
+    the parallel scan is only used with a threadsafe threading layer: the
+    default workqueue layer aborts the process when two threads enter a
+    parallel region at the same time.
+    """
+    # get_num_threads() starts the Numba thread pool: only ask for long signals
+    if len(signal) >= _PARALLEL_REVERSALS_MIN:
+        n_threads = get_num_threads()
+        if n_threads > 1 and (
+            threading.current_thread() is threading.main_thread()
+            or threading_layer() in _THREADSAFE_LAYERS
+        ):
+            return _find_reversals_parallel(signal, 4 * n_threads)
+    return _kernel('find_reversals', signal.dtype)(signal)
+
+
+def _check_gate_mode(gate_mode: str):
+    """Raise ValueError for an unknown gate mode."""
+    if gate_mode not in ('hysteresis', 'post'):
+        raise ValueError(
+            f"Invalid gate_mode '{gate_mode}'. Valid modes: 'hysteresis', 'post'"
+        )
+
+
+def _check_dtype(dtype) -> Optional[np.dtype]:
+    """Validate a working precision (None, float32 or float64)."""
+    if dtype is None:
+        return None
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Invalid dtype '{dtype}'. Valid dtypes: float32, float64")
+    return dtype
+
+
+def _check_scale(scale: float):
+    """Raise ValueError for a zero or non-finite calibration scale."""
+    if scale == 0 or not np.isfinite(scale):
+        raise ValueError(
+            f"Invalid scale {scale}. The calibration scale must be finite and non-zero"
+        )
+
+
+def _cycle_dtype(dtype=None, indexed: bool = False) -> np.dtype:
+    """
+    Structured dtype of the cycles for a working precision (None: float64).
+    
+    With indexed=True, int64 'start' and 'end' sample index fields are added.
+    """
+    code = 'f4' if dtype == np.float32 else 'f8'
+    fields = [('range', code), ('mean', code), ('count', code)]
+    if indexed:
+        fields += [('start', 'i8'), ('end', 'i8')]
+    return np.dtype(fields)
+
+
+# Unsigned samples are widened to a signed type so differences cannot wrap
+_SIGNED_WIDENING = {
+    np.dtype(np.uint8): np.int16,
+    np.dtype(np.uint16): np.int32,
+    np.dtype(np.uint32): np.int64,
+}
+
+
+def _as_signal(signal, dtype=None) -> np.ndarray:
+    """
+    Convert input to an array the counting kernels accept.
+    
+    Signed integer samples are kept as they are (exact integer counting);
+    uint8/16/32 are widened to the next signed type. Float signals are
+    converted to dtype if given, other inputs to float64.
+    """
+    if isinstance(signal, np.ndarray):
+        if signal.dtype.kind == 'i':
+            return signal
+        if signal.dtype in _SIGNED_WIDENING:
+            return signal.astype(_SIGNED_WIDENING[signal.dtype])
+    if dtype is not None:
+        return np.asarray(signal, dtype=dtype)
+    if not isinstance(signal, np.ndarray):
+        return np.asarray(signal, dtype=np.float64)
+    if signal.dtype not in (np.float32, np.float64):
+        return signal.astype(np.float64)
+    return signal
+
+
+def _chunk_reversals(
+    window: np.ndarray,
+    offset: int,
+    has_previous: bool,
+    has_next: bool,
+    dtype=None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the reversals of one chunk of a longer signal.
+    
+    The window holds the chunk plus its neighbouring sample on each side
+    that exists, so every point is classified exactly as _find_reversals
+    would classify it in the full signal. Concatenating the results of
+    consecutive chunks gives the reversals of the full signal.
+    
+    Args:
+        window: Chunk samples with one neighbour on each existing side
+        offset: Index of window[0] in the full signal
+        has_previous: True if window[0] is the previous chunk's last sample
+        has_next: True if window[-1] is the next chunk's first sample
+        dtype: Working precision (see rainflow_count)
+        
+    Returns:
+        reversals: Reversal values of the chunk
+        indices: Their indices in the full signal
+    """
+    window = _as_signal(window, dtype)
+    reversals, indices = _kernel('find_reversals', window.dtype)(window)
+    start = 1 if has_previous else 0
+    stop = len(reversals) - 1 if has_next else len(reversals)
+    return reversals[start:stop], indices[start:stop] + offset
+
+
+def _build_cycles(
+    ranges: np.ndarray,
+    means: np.ndarray,
+    counts: np.ndarray,
+    remove_zeros: bool = True,
+    gate: Optional[float] = None,
+    gate_mode: str = 'hysteresis',
+    dtype=None,
+    scale: float = 1.0,
+    offset: float = 0.0,
+    starts: Optional[np.ndarray] = None,
+    ends: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Calibrate, filter and pack counted cycles (see rainflow_count).
+    
+    Returns:
+        cycles: Structured array as returned by rainflow_count
+    """
+    # Calibration is applied to the cycles only
+    if scale != 1.0:
+        ranges = ranges * abs(scale)
+        means = means * scale
+    if offset != 0.0:
+        means = means + offset
+    
+    # Post-count gating drops small cycles after counting. After the
+    # hysteresis filter only the excursion from the start of the history
+    # to the first confirmed extreme can be below the gate
+    mask = None
+    if gate is not None and gate > 0:
+        mask = ranges >= gate
+    
+    # Remove zero-range cycles if requested
+    if remove_zeros:
+        mask = ranges > 0 if mask is None else mask & (ranges > 0)
+    
+    if mask is not None:
+        ranges = ranges[mask]
+        means = means[mask]
+        counts = counts[mask]
+    
+    # Create structured array
+    indexed = starts is not None
+    cycles = np.empty(len(ranges), dtype=_cycle_dtype(dtype, indexed))
+    cycles['range'] = ranges
+    cycles['mean'] = means
+    cycles['count'] = counts
+    if indexed:
+        cycles['start'] = starts if mask is None else starts[mask]
+        cycles['end'] = ends if mask is None else ends[mask]
+    
+    return cycles
+
+
+def _count_reversals(
+    reversals: np.ndarray,
+    indices: np.ndarray,
+    remove_zeros: bool = True,
+    gate: Optional[float] = None,
+    gate_mode: str = 'hysteresis',
+    dtype=None,
+    scale: float = 1.0,
+    offset: float = 0.0,
+    return_indices: bool = False
+) -> np.ndarray:
+    """
+    Count cycles from the reversals of a signal (see rainflow_count).
+    
+    Returns:
+        cycles: Structured array as returned by rainflow_count
+    """
+    # Hysteresis gating removes small reversals before counting (the gate
+    # is in output units, the reversals in raw units)
+    if gate is not None and gate > 0 and gate_mode == 'hysteresis':
+        reversals, indices = _kernel('hysteresis_filter', reversals.dtype)(
+            reversals, indices, float(gate) / abs(scale)
+        )
+    
+    # Apply rainflow algorithm
+    if return_indices:
+        ranges, means, counts, starts, ends = _rainflow_core_indexed(reversals, indices)
+        return _build_cycles(
+            ranges, means, counts, remove_zeros, gate, gate_mode, dtype, scale, offset,
+            starts, ends
+        )
+    
+    ranges, means, counts = _kernel('rainflow_core', reversals.dtype)(reversals)
+    
+    return _build_cycles(
+        ranges, means, counts, remove_zeros, gate, gate_mode, dtype, scale, offset
+    )
+
+
+def _count_periodic(
+    signal: np.ndarray,
+    remove_zeros: bool = True,
+    gate: Optional[float] = None,
+    gate_mode: str = 'hysteresis',
+    dtype=None,
+    scale: float = 1.0,
+    offset: float = 0.0
+) -> np.ndarray:
+    """
+    Count one period of an endlessly repeated signal (see rainflow_count).
+    
+    Returns:
+        cycles: Structured array as returned by rainflow_count
+    """
+    # Turning points with the neighbours of the repeated history
+    window = np.concatenate((signal[-1:], signal, signal[:1]))
+    reversals, indices = _chunk_reversals(window, -1, True, True)
+    
+    # The first period starts at the first sample, a forced turning point
+    first, first_indices = _chunk_reversals(
+        np.concatenate((signal, signal[:1])), 0, False, True
+    )
+    
+    if gate is not None and gate > 0 and gate_mode == 'hysteresis' and len(reversals) > 0:
+        # Filter three periods of the repeated history. Once the filter has
+        # passed the absolute maximum of the first period its state repeats
+        # every period, and every point of the second period is confirmed
+        # or superseded by the maximum of the third: the output before
+        # sample n is the first period, the output in [n, 2n) the others
+        n = len(signal)
+        filtered, filtered_indices = _kernel('hysteresis_filter', reversals.dtype)(
+            np.concatenate((first, reversals, reversals)),
+            np.concatenate((first_indices, indices + n, indices + 2 * n)),
+            float(gate) / abs(scale)
+        )
+        first = filtered[filtered_indices < n]
+        reversals = filtered[(filtered_indices >= n) & (filtered_indices < 2 * n)]
+    
+    ranges, means, counts = _rainflow_core_periodic(reversals, first)
+    
+    return _build_cycles(
+        ranges, means, counts, remove_zeros, gate, gate_mode, dtype, scale, offset
+    )
+
+
 def rainflow_count(
     signal: np.ndarray,
     remove_zeros: bool = True,
-    gate: Optional[float] = None
+    gate: Optional[float] = None,
+    gate_mode: str = 'hysteresis',
+    dtype=None,
+    scale: float = 1.0,
+    offset: float = 0.0,
+    return_indices: bool = False,
+    periodic: bool = False
 ) -> np.ndarray:
     """
     Perform rainflow cycle counting on a time series signal.
     
     This function implements the ASTM E1049-85 rainflow counting algorithm
-    with Numba JIT compilation for high performance.
+    with Numba JIT compilation for high performance. The turning points of
+    signals of 2^22 samples or more are found on all Numba threads when
+    called from the main thread, or from any thread with the tbb or omp
+    threading layer (the workqueue layer cannot be entered concurrently).
     
     Args:
         signal: Input time series data (stress/strain history)
         remove_zeros: If True, remove zero-range cycles from results
         gate: Optional minimum range threshold. Cycles below this are ignored.
+        gate_mode: How the gate is applied:
+            - 'hysteresis': Racetrack filter on the turning points before
+              counting (small reversals never reach the counting stage;
+              a cycle from the start of the history below the gate is
+              dropped after counting)
+            - 'post': Count every reversal, then drop cycles below the gate
+        dtype: Working precision, np.float32 or np.float64. The signal is
+               converted to it if needed, counted natively and the cycles
+               are returned with fields of that dtype. None (default)
+               counts float32/float64 signals in their own precision and
+               returns float64 fields.
+        scale: Calibration factor applied to the output ranges and means
+               (e.g. MPa per ADC count). Integer signals (int8 to int64)
+               are counted directly on the raw counts with exact integer
+               ranges; unsigned ones are widened to a signed type first.
+               The gate is given in output units.
+        offset: Calibration offset added to the output means
+        return_indices: If True, add the sample indices of the two turning
+                        points of each cycle. Counted by a separate kernel,
+                        so the default path is unchanged.
+        periodic: If True, the signal is one period of an endlessly
+                  repeated history (e.g. a load block of calculate_life).
+                  The residue is closed across repetitions instead of
+                  being counted as half-cycles, and the cycles of one
+                  period in steady state are returned (full cycles; when
+                  equal values make the residue alternate between
+                  periods, the counts are averaged over the repeating
+                  periods).
+                  With the hysteresis gate, the filter runs from the
+                  absolute maximum of the period.
         
     Returns:
         cycles: Structured numpy array with fields:
             - 'range': Cycle range (peak-to-valley)
             - 'mean': Cycle mean value
             - 'count': Cycle count (0.5 for half-cycles, 1.0 for full cycles)
+            - 'start', 'end': Sample indices of the turning points
+              (int64, only with return_indices=True)
             
     Example:
         >>> import numpy as np
@@ -179,50 +1191,50 @@ def rainflow_count(
         >>> signal = np.array([0, 1, 0, 2, 0, 3, 0])
         >>> cycles = rainflow_count(signal)
         >>> print(cycles)
+        >>> # float32 end to end (DAQ data)
+        >>> cycles32 = rainflow_count(signal.astype(np.float32), dtype=np.float32)
+        >>> # int16 ADC counts, 0.05 MPa per count
+        >>> cycles = rainflow_count(adc_counts, scale=0.05)
+        >>> # Locate the cycles in the signal
+        >>> cycles = rainflow_count(signal, return_indices=True)
+        >>> worst = cycles[np.argmax(cycles['range'])]
+        >>> segment = signal[worst['start']:worst['end'] + 1]
     """
-    if not isinstance(signal, np.ndarray):
-        signal = np.asarray(signal, dtype=np.float64)
-    elif signal.dtype not in (np.float32, np.float64):
-        signal = signal.astype(np.float64)
+    _check_gate_mode(gate_mode)
+    dtype = _check_dtype(dtype)
+    _check_scale(scale)
+    if periodic and return_indices:
+        raise ValueError("return_indices is not available with periodic=True")
+    
+    signal = _as_signal(signal, dtype)
     
     if len(signal) < 2:
         warnings.warn("Signal too short for rainflow counting (need at least 2 points)")
-        return np.empty(0, dtype=[('range', 'f8'), ('mean', 'f8'), ('count', 'f8')])
+        return np.empty(0, dtype=_cycle_dtype(dtype, return_indices))
     
-    # Find reversal points
-    reversals, _ = _find_reversals(signal)
+    if periodic:
+        return _count_periodic(signal, remove_zeros, gate, gate_mode, dtype, scale, offset)
     
-    # Apply rainflow algorithm
-    ranges, means, counts = _rainflow_core(reversals)
-    
-    # Apply gating if specified
-    if gate is not None and gate > 0:
-        mask = ranges >= gate
-        ranges = ranges[mask]
-        means = means[mask]
-        counts = counts[mask]
-    
-    # Remove zero-range cycles if requested
-    if remove_zeros:
-        mask = ranges > 0
-        ranges = ranges[mask]
-        means = means[mask]
-        counts = counts[mask]
-    
-    # Create structured array
-    cycles = np.empty(len(ranges), dtype=[('range', 'f8'), ('mean', 'f8'), ('count', 'f8')])
-    cycles['range'] = ranges
-    cycles['mean'] = means
-    cycles['count'] = counts
+    # Find reversal points
+    reversals, indices = _reversals(signal)
     
-    return cycles
+    return _count_reversals(
+        reversals, indices, remove_zeros, gate, gate_mode, dtype, scale, offset,
+        return_indices
+    )
 
 
 def rainflow_count_parallel(
     signals: list,
     remove_zeros: bool = True,
     gate: Optional[float] = None,
-    n_jobs: int = -1
+    n_jobs: int = -1,
+    gate_mode: str = 'hysteresis',
+    backend: Optional[str] = None,
+    dtype=None,
+    scale: float = 1.0,
+    offset: float = 0.0,
+    return_indices: bool = False
 ) -> list:
     """
     Perform rainflow counting on multiple signals in parallel.
@@ -232,6 +1244,14 @@ def rainflow_count_parallel(
         remove_zeros: If True, remove zero-range cycles from results
         gate: Optional minimum range threshold
         n_jobs: Number of parallel jobs (-1 for all CPUs)
+        gate_mode: 'hysteresis' or 'post' (see rainflow_count)
+        backend: joblib backend (None for the default process pool).
+                 'threading' avoids pickling the signals; the counting
+                 kernels release the GIL.
+        dtype: Working precision (see rainflow_count)
+        scale: Calibration factor for integer samples (see rainflow_count)
+        offset: Calibration offset added to the means
+        return_indices: If True, add cycle start/end sample indices
         
     Returns:
         cycles_list: List of cycle arrays, one per input signal
@@ -239,6 +1259,7 @@ def rainflow_count_parallel(
     Example:
         >>> signals = [np.random.randn(1000) for _ in range(10)]
         >>> cycles_list = rainflow_count_parallel(signals, n_jobs=4)
+        >>> cycles_list = rainflow_count_parallel(signals, backend='threading')
     """
     try:
         from joblib import Parallel, delayed
@@ -247,16 +1268,134 @@ def rainflow_count_parallel(
             "joblib not installed. Falling back to sequential processing. "
             "Install with: pip install joblib"
         )
-        return [rainflow_count(sig, remove_zeros, gate) for sig in signals]
+        return [
+            rainflow_count(
+                sig, remove_zeros, gate, gate_mode, dtype, scale, offset, return_indices
+            )
+            for sig in signals
+        ]
     
-    results = Parallel(n_jobs=n_jobs)(
-        delayed(rainflow_count)(sig, remove_zeros, gate) 
+    results = Parallel(n_jobs=n_jobs, backend=backend)(
+        delayed(rainflow_count)(
+            sig, remove_zeros, gate, gate_mode, dtype, scale, offset, return_indices
+        )
         for sig in signals
     )
     
     return results
 
 
+def count_block_sequence(
+    blocks: list,
+    repetitions: list,
+    remove_zeros: bool = True,
+    dtype=None,
+    periodic: bool = False
+) -> np.ndarray:
+    """
+    Count a sequence of repeated load blocks without concatenating them.
+    
+    The result equals rainflow_count of the concatenated history (e.g.
+    1000 x flight A followed by 200 x flight B), including the cycles that
+    close across block boundaries. Each block is searched for reversals
+    once per distinct neighbourhood, and repetitions are fed through the
+    counting residue until it becomes steady; further repetitions only
+    multiply the cycle counts, so the cost does not grow with the number
+    of repetitions.
+    
+    Args:
+        blocks: List of load blocks (1D arrays)
+        repetitions: Number of consecutive repetitions of each block
+        remove_zeros: If True, remove zero-range cycles from results
+        dtype: Working precision (see rainflow_count)
+        periodic: If True, the whole sequence repeats endlessly and the
+                  cycles of one sequence in steady state are returned (see
+                  rainflow_count)
+        
+    Returns:
+        cycles: Structured array as returned by rainflow_count, with counts
+                multiplied by the number of repetitions that close them
+                
+    Example:
+        >>> cycles = count_block_sequence([flight_a, flight_b], [1000, 200])
+        >>> damage = calculate_damage(cycles, curve)
+    """
+    dtype = _check_dtype(dtype)
+    if len(blocks) != len(repetitions):
+        raise ValueError(
+            f"blocks and repetitions must have the same length "
+            f"({len(blocks)} != {len(repetitions)})"
+        )
+    
+    entries = []
+    for block, n in zip(blocks, repetitions):
+        if n < 0 or int(n) != n:
+            raise ValueError(f"Invalid number of repetitions {n}")
+        block = _as_signal(block, dtype)
+        if n > 0 and len(block) > 0:
+            entries.append((block, int(n)))
+    
+    empty = np.empty(0, dtype=_cycle_dtype(dtype))
+    if not entries:
+        return empty
+    
+    common = np.result_type(*(block.dtype for block, _ in entries))
+    entries = [(block.astype(common, copy=False), n) for block, n in entries]
+    
+    def block_reversals(block, previous, following):
+        window = block
+        if previous is not None:
+            window = np.concatenate(([previous], window))
+        if following is not None:
+            window = np.concatenate((window, [following]))
+        return _chunk_reversals(window, 0, previous is not None, following is not None)[0]
+    
+    def build_plan(first_previous):
+        """Reversals of each block with its neighbours in the full history."""
+        plan = []
+        for e, (block, n) in enumerate(entries):
+            previous = entries[e - 1][0][-1] if e > 0 else first_previous
+            if e < len(entries) - 1:
+                following = entries[e + 1][0][0]
+            else:
+                following = entries[0][0][0] if periodic else None
+            
+            if n == 1:
+                plan.append((block_reversals(block, previous, following), 1))
+                continue
+            plan.append((block_reversals(block, previous, block[0]), 1))
+            if n > 2:
+                plan.append((block_reversals(block, block[-1], block[0]), n - 2))
+            plan.append((block_reversals(block, block[-1], following), 1))
+        return plan
+    
+    plan = build_plan(None)
+    stack = np.empty(max(len(rev) for rev, _ in plan) * 2 + 1, dtype=common)
+    if periodic:
+        cycles = _feed_periodic(plan, build_plan(entries[-1][0][-1]), stack)
+    else:
+        stack_ptr = 0
+        cycles = []
+        for reversals, n in plan:
+            stack, stack_ptr, fed = _feed_repeated(reversals, n, stack, stack_ptr)
+            cycles.extend(fed)
+        
+        # Remaining half-cycles of the whole history
+        residue = stack[:stack_ptr]
+        if len(residue) > 1:
+            cycles.append((
+                np.abs(np.diff(residue.astype(_output_dtypes(common)[0]))),
+                (residue[:-1] + residue[1:].astype(np.float64)) / 2.0,
+                np.full(len(residue) - 1, 0.5)
+            ))
+    
+    if not cycles:
+        return empty
+    ranges, means, counts = (np.concatenate(field) for field in zip(*cycles))
+    
+    return _build_cycles(ranges, means, counts, remove_zeros, dtype=dtype)
+
+
 def combine_cycles(cycles_list: list) -> np.ndarray:
     """
     Combine multiple cycle arrays into a single array.
@@ -268,7 +1407,7 @@ def combine_cycles(cycles_list: list) -> np.ndarray:
         combined: Single combined cycle array
     """
     if not cycles_list:
-        return np.empty(0, dtype=[('range', 'f8'), ('mean', 'f8'), ('count', 'f8')])
+        return np.empty(0, dtype=_cycle_dtype())
     
     return np.concatenate(cycles_list)
 
@@ -0,0 +1,270 @@
+"""
+Monte Carlo fatigue reliability.
+
+The probability of failure is estimated by sampling the uncertain inputs
+of Miner's rule and evaluating the damage of a fixed stress range
+histogram for every sample:
+
+- fatigue strength delta_sigma_c (lognormal), which moves the whole S-N
+  curve, knee point and CAFL included
+- slope offset added to m1 and m2 (normal)
+- Miner damage at failure (lognormal)
+- load scale factor applied to the stress ranges (lognormal)
+
+The histogram is counted once; each sample costs one pass over its bins
+in a parallel JIT kernel, in log space (one exponential per bin). Samples
+are drawn from a numpy Generator seeded with a SeedSequence, so results
+are reproducible and do not depend on the number of threads.
+"""
+
+import numpy as np
+from numba import njit, prange
+from typing import Dict, Optional
+
+from .damage import _neumaier_add
+from .eurocode import FatigueCurve
+
+
+def _lognormal(rng, median: float, cov: float, n: int) -> np.ndarray:
+    """Lognormal samples from a median and a coefficient of variation."""
+    if cov == 0.0:
+        return np.full(n, float(median))
+    sigma = np.sqrt(np.log1p(cov * cov))
+    return median * np.exp(sigma * rng.standard_normal(n))
+
+
+def sample_parameters(
+    fatigue_curve: FatigueCurve,
+    n_samples: int,
+    strength_cov: float = 0.0,
+    strength_median: Optional[float] = None,
+    slope_std: float = 0.0,
+    miner_cov: float = 0.0,
+    miner_median: float = 1.0,
+    load_cov: float = 0.0,
+    load_median: float = 1.0,
+    seed=None
+) -> Dict[str, np.ndarray]:
+    """
+    Sample S-N curve, Miner threshold and load scale parameters.
+    
+    Args:
+        fatigue_curve: Nominal FatigueCurve object
+        n_samples: Number of samples
+        strength_cov: Coefficient of variation of delta_sigma_c
+        strength_median: Median of delta_sigma_c [MPa] (default: the
+                         characteristic value of the curve)
+        slope_std: Standard deviation of the offset added to m1 and m2
+        miner_cov: Coefficient of variation of the damage at failure
+        miner_median: Median damage at failure
+        load_cov: Coefficient of variation of the load scale factor
+        load_median: Median load scale factor
+        seed: Seed, SeedSequence or Generator
+    
+    Returns:
+        Dictionary of arrays: delta_sigma_c, m1, m2, miner, load
+    """
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be >= 1, got {n_samples}")
+    for name, value in (('strength_cov', strength_cov), ('slope_std', slope_std),
+                        ('miner_cov', miner_cov), ('load_cov', load_cov)):
+        if value < 0:
+            raise ValueError(f"{name} must be non-negative, got {value}")
+    
+    # Integers are expanded through a SeedSequence by default_rng
+    rng = np.random.default_rng(seed)
+    
+    if strength_median is None:
+        strength_median = fatigue_curve.delta_sigma_c
+    
+    n = int(n_samples)
+    if slope_std > 0:
+        offset = slope_std * rng.standard_normal(n)
+    else:
+        offset = np.zeros(n)
+    
+    return {
+        'delta_sigma_c': _lognormal(rng, strength_median, strength_cov, n),
+        'm1': fatigue_curve.m1 + offset,
+        'm2': fatigue_curve.m2 + offset,
+        'miner': _lognormal(rng, miner_median, miner_cov, n),
+        'load': _lognormal(rng, load_median, load_cov, n),
+    }
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _sampled_damage(
+    log_ranges: np.ndarray,
+    counts: np.ndarray,
+    log_load: np.ndarray,
+    log_strength: np.ndarray,
+    m1: np.ndarray,
+    m2: np.ndarray,
+    log_N_ref: float,
+    log_N_knee: float,
+    log_N_cutoff: float,
+    log_cafl_shift: float,
+    use_cutoff: bool
+) -> np.ndarray:
+    """
+    Miner damage of one histogram for every sampled S-N curve and load.
+    
+    The curve of each sample is rebuilt as in FatigueCurve.__post_init__,
+    in log space, and the damage per bin follows _cycle_damage.
+    
+    Args:
+        log_ranges: Log of the histogram stress ranges
+        counts: Cycle counts per bin
+        log_load: Log of the load scale factor per sample
+        log_strength: Log of delta_sigma_c per sample
+        m1, m2: Slopes per sample
+        log_N_ref, log_N_knee, log_N_cutoff: Log of the curve cycle counts
+        log_cafl_shift: Log of the CAFL relative to its default value
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+    
+    Returns:
+        Damage per sample
+    """
+    n_samples = len(log_load)
+    damage = np.zeros(n_samples)
+    
+    for k in prange(n_samples):
+        log_C1 = log_N_ref + m1[k] * log_strength[k]
+        log_knee = (log_C1 - log_N_knee) / m1[k]
+        log_C2 = log_N_knee + m2[k] * log_knee
+        log_cafl = (log_C2 - log_N_cutoff) / m2[k] + log_cafl_shift
+        
+        total = 0.0
+        compensation = 0.0
+        for j in range(len(log_ranges)):
+            x = log_load[k] + log_ranges[j]
+            if use_cutoff and x < log_cafl:
+                continue
+            if x >= log_knee:
+                increment = counts[j] * np.exp(m1[k] * x - log_C1)
+            else:
+                increment = counts[j] * np.exp(m2[k] * x - log_C2)
+            total, compensation = _neumaier_add(total, compensation, increment)
+        damage[k] = total + compensation
+    
+    return damage
+
+
+def sampled_damage(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    fatigue_curve: FatigueCurve,
+    samples: Dict[str, np.ndarray],
+    use_cutoff: bool = True
+) -> np.ndarray:
+    """
+    Miner damage of a stress range histogram for every sample.
+    
+    Args:
+        stress_ranges: Stress range bin centers
+        cycle_counts: Cycle counts per bin
+        fatigue_curve: Nominal FatigueCurve object (cycle counts of the
+                       reference, knee and cut-off points)
+        samples: Output of sample_parameters
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+    
+    Returns:
+        Damage per sample
+    """
+    stress_ranges = np.asarray(stress_ranges, dtype=np.float64).ravel()
+    cycle_counts = np.asarray(cycle_counts, dtype=np.float64).ravel()
+    if len(stress_ranges) != len(cycle_counts):
+        raise ValueError("stress_ranges and cycle_counts must have same length")
+    
+    keep = (stress_ranges > 0) & (cycle_counts > 0)
+    stress_ranges = stress_ranges[keep]
+    cycle_counts = cycle_counts[keep]
+    
+    # A CAFL given explicitly keeps its ratio to the default value
+    default_cafl = (fatigue_curve.C2 / fatigue_curve.N_cutoff) ** (1.0 / fatigue_curve.m2)
+    log_cafl_shift = np.log(fatigue_curve.delta_sigma_L / default_cafl)
+    
+    return _sampled_damage(
+        np.log(stress_ranges),
+        cycle_counts,
+        np.log(np.asarray(samples['load'], dtype=np.float64)),
+        np.log(np.asarray(samples['delta_sigma_c'], dtype=np.float64)),
+        np.ascontiguousarray(samples['m1'], dtype=np.float64),
+        np.ascontiguousarray(samples['m2'], dtype=np.float64),
+        np.log(fatigue_curve.N_ref),
+        np.log(fatigue_curve.N_knee),
+        np.log(fatigue_curve.N_cutoff),
+        log_cafl_shift,
+        use_cutoff
+    )
+
+
+def failure_probability(
+    stress_ranges: np.ndarray,
+    cycle_counts: np.ndarray,
+    fatigue_curve: FatigueCurve,
+    n_samples: int = 1_000_000,
+    design_life: float = 1.0,
+    strength_cov: float = 0.0,
+    strength_median: Optional[float] = None,
+    slope_std: float = 0.0,
+    miner_cov: float = 0.0,
+    miner_median: float = 1.0,
+    load_cov: float = 0.0,
+    load_median: float = 1.0,
+    use_cutoff: bool = True,
+    seed=None
+) -> Dict:
+    """
+    Monte Carlo probability of fatigue failure over the design life.
+    
+    A sample fails when the damage of the histogram, repeated design_life
+    times, reaches its sampled Miner threshold.
+    
+    Args:
+        stress_ranges: Stress range bin centers (e.g. from bin_cycles or
+                       an extrapolated spectrum)
+        cycle_counts: Cycle counts per bin for one load history
+        fatigue_curve: Nominal FatigueCurve object
+        n_samples: Number of Monte Carlo samples
+        design_life: Number of repetitions of the load history
+        strength_cov, strength_median, slope_std, miner_cov, miner_median,
+        load_cov, load_median: See sample_parameters
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        seed: Seed for reproducible results
+    
+    Returns:
+        Dictionary with probability_of_failure, standard_error,
+        reliability_index, n_failures, n_samples and damage (per sample)
+    
+    Example:
+        >>> ranges, counts, _ = bin_cycles(cycles, range_bins=64)
+        >>> result = failure_probability(
+        ...     ranges, counts, curve, design_life=1e4,
+        ...     strength_cov=0.25, load_cov=0.1, miner_cov=0.3, seed=42
+        ... )
+        >>> print(result['probability_of_failure'], result['reliability_index'])
+    """
+    from scipy.special import ndtri
+    
+    samples = sample_parameters(
+        fatigue_curve, n_samples,
+        strength_cov=strength_cov, strength_median=strength_median,
+        slope_std=slope_std, miner_cov=miner_cov, miner_median=miner_median,
+        load_cov=load_cov, load_median=load_median, seed=seed
+    )
+    damage = design_life * sampled_damage(
+        stress_ranges, cycle_counts, fatigue_curve, samples, use_cutoff=use_cutoff
+    )
+    
+    n_failures = int(np.count_nonzero(damage >= samples['miner']))
+    probability = n_failures / len(damage)
+    
+    return {
+        'probability_of_failure': probability,
+        'standard_error': float(np.sqrt(probability * (1.0 - probability) / len(damage))),
+        'reliability_index': float(-ndtri(probability)),
+        'n_failures': n_failures,
+        'n_samples': len(damage),
+        'damage': damage,
+    }
@@ -0,0 +1,228 @@
+"""
+Fatigue maps from linear superposition of unit-load cases.
+
+For a linear FE model, the stress history of node j is the product of
+its unit-load influence coefficients with the load time series:
+    
+    sigma_j(t) = sum_k coefficients[j, k] * loads[t, k]
+
+The n_nodes x n_samples stress matrix is never formed. Nodes are
+processed in parallel; each one builds its history block by block (a
+small contiguous buffer per thread), extracts the turning points as the
+blocks arrive, then rainflow counts them and sums the Miner damage.
+"""
+
+import numpy as np
+from numba import njit, prange
+from typing import Optional, Union
+
+from .rainflow import _rainflow_count_into
+from .damage import _batch_curves, _damage_accumulate
+
+
+@njit(cache=True, nogil=True)
+def _superposed_reversals(
+    loads_t: np.ndarray,
+    coefficients: np.ndarray,
+    block_size: int,
+    buffer: np.ndarray,
+    out: np.ndarray
+) -> int:
+    """
+    Turning points of one superposed history, built block by block.
+    
+    Same selection rule as _find_reversals. Each block of the history is
+    accumulated channel by channel into a contiguous buffer, so the inner
+    loop runs over consecutive samples.
+    
+    Args:
+        loads_t: Load time series, shape (n_channels, n_samples)
+        coefficients: Unit-load stresses of the node, shape (n_channels,)
+        block_size: Samples per block
+        buffer: Work array with room for block_size values
+        out: Output array with room for n_samples reversals
+    
+    Returns:
+        Number of reversals written
+    """
+    n_channels, n = loads_t.shape
+    if n == 0:
+        return 0
+    
+    count = 0
+    previous = 0.0
+    current = 0.0
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+        size = end - start
+        
+        for b in range(size):
+            buffer[b] = 0.0
+        for k in range(n_channels):
+            c = coefficients[k]
+            if c == 0.0:
+                continue
+            for b in range(size):
+                buffer[b] += c * loads_t[k, start + b]
+        
+        for b in range(size):
+            value = buffer[b]
+            i = start + b
+            if i == 0:
+                out[0] = value
+                count = 1
+                previous = value
+            elif i == 1:
+                current = value
+            else:
+                if (current >= previous and current > value) or \
+                   (current <= previous and current < value):
+                    out[count] = current
+                    count += 1
+                previous = current
+                current = value
+    
+    # Last point is always a reversal
+    if n > 1:
+        out[count] = current
+        count += 1
+    return count
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _superposition_damage(
+    loads_t: np.ndarray,
+    coefficients: np.ndarray,
+    curve_parameters: np.ndarray,
+    curve_index: np.ndarray,
+    partial_safety_factor: np.ndarray,
+    use_cutoff: bool,
+    block_size: int
+) -> np.ndarray:
+    """
+    Miner damage of every node's superposed history, in parallel.
+    
+    Args:
+        loads_t: Load time series, shape (n_channels, n_samples)
+        coefficients: Unit-load stresses, shape (n_nodes, n_channels)
+        curve_parameters: Rows of _curve_parameters, shape (n_curves, 6)
+        curve_index: Curve row per node
+        partial_safety_factor: Partial safety factor per node
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        block_size: Samples per block
+    
+    Returns:
+        Damage per node
+    """
+    n = loads_t.shape[1]
+    n_nodes = coefficients.shape[0]
+    damage = np.zeros(n_nodes)
+    
+    for j in prange(n_nodes):
+        buffer = np.empty(min(block_size, max(n, 1)))
+        reversals = np.empty(n)
+        n_reversals = _superposed_reversals(
+            loads_t, coefficients[j], block_size, buffer, reversals
+        )
+        if n_reversals < 2:
+            continue
+        
+        stack = np.empty(n_reversals)
+        ranges = np.empty(n_reversals)
+        means = np.empty(n_reversals)
+        counts = np.empty(n_reversals)
+        n_cycles = _rainflow_count_into(
+            reversals[:n_reversals], stack, ranges, means, counts
+        )
+        
+        C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L = curve_parameters[curve_index[j]]
+        state = np.zeros(2)
+        _damage_accumulate(
+            ranges[:n_cycles], counts[:n_cycles], partial_safety_factor[j],
+            C1, m1, C2, m2, delta_sigma_knee, delta_sigma_L, use_cutoff, state
+        )
+        damage[j] = state[0] + state[1]
+    
+    return damage
+
+
+def node_history(coefficients: np.ndarray, loads: np.ndarray, node: int) -> np.ndarray:
+    """
+    Stress history of one node, e.g. to count a critical node in detail.
+    
+    Args:
+        coefficients: Unit-load stresses, shape (n_nodes, n_channels)
+        loads: Load time series, shape (n_samples, n_channels)
+        node: Node index
+    
+    Returns:
+        Stress history, shape (n_samples,)
+    """
+    return np.asarray(loads, dtype=np.float64) @ np.asarray(coefficients, dtype=np.float64)[node]
+
+
+def superposition_damage(
+    coefficients: np.ndarray,
+    loads: np.ndarray,
+    fatigue_curves,
+    curve_index: Optional[np.ndarray] = None,
+    use_cutoff: bool = True,
+    partial_safety_factor: Union[float, np.ndarray] = 1.0,
+    block_size: int = 4096
+) -> np.ndarray:
+    """
+    Miner damage map of a linear model under multi-channel loading.
+    
+    Each node's history is loads @ coefficients[node]; it is formed in
+    blocks, rainflow counted and converted to damage without storing the
+    stress matrix. The result equals calculate_damage(rainflow_count(
+    node_history(coefficients, loads, j)), curve) for every node j.
+    
+    Args:
+        coefficients: Unit-load stresses [MPa per unit load], shape
+                      (n_nodes, n_channels)
+        loads: Load time series, shape (n_samples, n_channels)
+        fatigue_curves: FatigueCurve, or sequence of FatigueCurve objects
+        curve_index: Index into fatigue_curves per node (default: curve j
+                     for node j, or the single curve)
+        use_cutoff: If True, stress ranges below CAFL cause no damage
+        partial_safety_factor: Partial safety factor (scalar or per node)
+        block_size: Samples per block of the on-the-fly product
+    
+    Returns:
+        Damage per node
+    
+    Example:
+        >>> damage = superposition_damage(unit_stresses, loads,
+        ...                               EurocodeCategory.get_curve('71'))
+        >>> critical = np.argmax(damage)
+        >>> cycles = rainflow_count(node_history(unit_stresses, loads, critical))
+    """
+    coefficients = np.ascontiguousarray(coefficients, dtype=np.float64)
+    loads = np.asarray(loads, dtype=np.float64)
+    
+    if loads.ndim == 1:
+        loads = loads[:, None]
+    if coefficients.ndim == 1:
+        coefficients = coefficients[:, None]
+    if loads.ndim != 2 or coefficients.ndim != 2 or coefficients.shape[1] != loads.shape[1]:
+        raise ValueError(
+            "coefficients must have shape (n_nodes, n_channels) and loads "
+            "(n_samples, n_channels) with the same n_channels"
+        )
+    if block_size < 1:
+        raise ValueError(f"block_size must be >= 1, got {block_size}")
+    
+    n_nodes = coefficients.shape[0]
+    
+    curve_parameters, curve_index, partial_safety_factor = _batch_curves(
+        fatigue_curves, curve_index, partial_safety_factor, n_nodes, 'node'
+    )
+    
+    # Channels in rows: each block is accumulated over consecutive samples
+    loads_t = np.ascontiguousarray(loads.T)
+    
+    return _superposition_damage(
+        loads_t, coefficients, curve_parameters, curve_index,
+        partial_safety_factor, use_cutoff, int(block_size)
+    )
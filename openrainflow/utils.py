@@ -7,7 +7,7 @@ from typing import Optional, Tuple
 from numba import njit
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def remove_mean(signal: np.ndarray) -> Tuple[np.ndarray, float]:
     """
     Remove mean value from signal.
@@ -210,7 +210,7 @@ def calculate_statistics(signal: np.ndarray) -> dict:
     }
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def range_pair_count(signal: np.ndarray) -> int:
     """
     Estimate number of reversals in signal (fast check).
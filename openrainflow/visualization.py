@@ -8,16 +8,21 @@ Provides plotting functions for:
 - Fatigue assessment visualizations
 """
 
+from __future__ import annotations
+
+import importlib.util
 import numpy as np
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 import warnings
 
-try:
+# matplotlib is only imported by the first plot (see _check_matplotlib)
+if TYPE_CHECKING:
     import matplotlib.pyplot as plt
-    import matplotlib as mpl
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+else:
+    plt = None
+
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+if not MATPLOTLIB_AVAILABLE:
     warnings.warn(
         "Matplotlib not installed. Visualization functions will not work. "
         "Install with: pip install matplotlib"
@@ -25,12 +30,15 @@ except ImportError:
 
 
 def _check_matplotlib():
-    """Check if matplotlib is available."""
+    """Check if matplotlib is available and import it on first use."""
+    global plt
     if not MATPLOTLIB_AVAILABLE:
         raise ImportError(
             "Matplotlib is required for visualization. "
             "Install with: pip install matplotlib"
         )
+    if plt is None:
+        import matplotlib.pyplot as plt
 
 
 def plot_rainflow_cycles(
@@ -370,41 +378,69 @@ def plot_signal_with_cycles(
     signal: np.ndarray,
     cycles: np.ndarray,
     max_cycles_to_show: int = 10,
-    figsize: Tuple[float, float] = (12, 6)
+    figsize: Tuple[float, float] = (12, 6),
+    **count_kwargs
 ) -> plt.Figure:
     """
     Plot signal time history with identified cycles highlighted.
     
+    The largest cycles are drawn between their start and end samples.
+    Cycles counted with ``return_indices=True`` are located directly;
+    otherwise the signal is counted again with indices to locate them,
+    using count_kwargs so that the same cycles are found.
+    
     Args:
         signal: Original signal array
         cycles: Structured array from rainflow_count
         max_cycles_to_show: Maximum number of cycles to highlight
         figsize: Figure size
+        **count_kwargs: Options of the rainflow_count call that produced
+                        cycles (gate, gate_mode, scale, ...), used when
+                        cycles carry no indices
         
     Returns:
         Matplotlib figure object
-        
-    Note:
-        This is a simplified visualization showing the largest cycles.
     """
     _check_matplotlib()
     
+    signal = np.asarray(signal)
+    
     fig, ax = plt.subplots(figsize=figsize)
     
     # Plot signal
     ax.plot(signal, 'b-', linewidth=1, alpha=0.7, label='Signal')
     
+    located = cycles
+    if len(cycles) > 0 and 'start' not in cycles.dtype.names:
+        from .rainflow import rainflow_count
+        located = rainflow_count(signal, return_indices=True, **count_kwargs)
+    
+    # Highlight the largest cycles
+    n_show = min(max_cycles_to_show, len(located))
+    if n_show > 0:
+        largest = np.argsort(located['range'])[::-1][:n_show]
+        colors = plt.cm.autumn(np.linspace(0, 0.8, n_show))
+        for rank, (k, color) in enumerate(zip(largest, colors)):
+            start, end = int(located['start'][k]), int(located['end'][k])
+            x = np.arange(start, end + 1)
+            ax.plot(
+                x, signal[start:end + 1], '-', color=color, linewidth=2,
+                label=f'Cycle {rank + 1}: {located["range"][k]:.1f} MPa'
+            )
+            ax.plot([start, end], signal[[start, end]], 'o', color=color, markersize=5)
+    
     ax.set_xlabel('Time Index', fontsize=12)
     ax.set_ylabel('Stress [MPa]', fontsize=12)
     ax.set_title('Signal with Rainflow Cycles', fontsize=14, fontweight='bold')
     ax.grid(True, alpha=0.3)
-    ax.legend()
+    ax.legend(fontsize=8, loc='upper right')
     
     # Add statistics
     total_cycles = np.sum(cycles['count'])
     stats_text = f'Total cycles: {total_cycles:.0f}\n'
     stats_text += f'Signal length: {len(signal)}\n'
-    stats_text += f'Max range: {np.max(cycles["range"]):.1f} MPa'
+    if len(cycles) > 0:
+        stats_text += f'Max range: {np.max(cycles["range"]):.1f} MPa'
     
     ax.text(
         0.02, 0.98, stats_text,
@@ -0,0 +1,156 @@
+"""Tests for the asyncio wrappers."""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from openrainflow import rainflow_count, calculate_damage
+from openrainflow.aio import (
+    rainflow_count_async,
+    rainflow_count_many_async,
+    analyze_async,
+    stream_damage,
+)
+from openrainflow.eurocode import EurocodeCategory
+from openrainflow.parallel import ParallelFatigueAnalyzer
+
+
+class TestAsyncCounting:
+    """Test async rainflow counting."""
+    
+    def test_count_matches_sync(self):
+        """Async counting gives the same cycles as rainflow_count."""
+        np.random.seed(42)
+        signal = np.random.randn(1000) * 50
+        
+        cycles = asyncio.run(rainflow_count_async(signal, gate=10.0))
+        
+        np.testing.assert_array_equal(cycles, rainflow_count(signal, gate=10.0))
+    
+    def test_many_channels(self):
+        """Several channels are counted concurrently, order preserved."""
+        np.random.seed(0)
+        signals = [np.random.randn(500 + 100 * i) for i in range(6)]
+        
+        results = asyncio.run(rainflow_count_many_async(signals, max_concurrency=2))
+        
+        assert len(results) == len(signals)
+        for sig, cycles in zip(signals, results):
+            np.testing.assert_array_equal(cycles, rainflow_count(sig))
+    
+    def test_count_options_forwarded(self):
+        """Later rainflow_count options are available from async callers."""
+        np.random.seed(2)
+        signals = [np.random.randint(-500, 500, 300).astype(np.int16) for _ in range(2)]
+        options = dict(dtype=np.float32, scale=0.1, offset=2.0, return_indices=True)
+        
+        single = asyncio.run(rainflow_count_async(signals[0], gate=5.0, **options))
+        many = asyncio.run(rainflow_count_many_async(signals, max_concurrency=1, **options))
+        
+        np.testing.assert_array_equal(single, rainflow_count(signals[0], gate=5.0, **options))
+        for sig, cycles in zip(signals, many):
+            expected = rainflow_count(sig, **options)
+            assert cycles.dtype == expected.dtype
+            np.testing.assert_array_equal(cycles, expected)
+    
+    def test_event_loop_not_blocked(self):
+        """The loop keeps running while a large signal is counted."""
+        np.random.seed(1)
+        signal = np.random.randn(3_000_000)
+        rainflow_count(signal[:100])  # compile outside the timed section
+        
+        async def main():
+            ticks = 0
+            task = asyncio.ensure_future(rainflow_count_async(signal))
+            while not task.done():
+                ticks += 1
+                await asyncio.sleep(0.001)
+            return ticks, task.result()
+        
+        ticks, cycles = asyncio.run(main())
+        assert ticks > 1
+        assert len(cycles) > 0
+
+
+class TestAsyncAnalysis:
+    """Test async analyzer and streaming APIs."""
+    
+    def test_analyze_async(self):
+        """Analyzer results are available from a coroutine."""
+        np.random.seed(42)
+        analyzer = ParallelFatigueAnalyzer(n_jobs=1)
+        analyzer.add_signals([np.random.randn(200) * 50 + 100 for _ in range(3)])
+        analyzer.set_fatigue_curve('71')
+        
+        results = asyncio.run(analyze_async(analyzer, design_life=100))
+        
+        assert results['n_signals'] == 3
+        assert results['design_life'] == 100
+    
+    def test_stream_damage_async_source(self):
+        """async for over an async chunk source tracks the batch damage."""
+        np.random.seed(3)
+        signal = np.random.randn(4000) * 60
+        curve = EurocodeCategory.get_curve('36')
+        
+        async def frames():
+            for start in range(0, len(signal), 500):
+                await asyncio.sleep(0)
+                yield signal[start:start + 500]
+        
+        async def main():
+            return [state async for state in stream_damage(frames(), curve, buffer_size=256)]
+        
+        states = asyncio.run(main())
+        
+        assert len(states) == 8
+        assert states[-1]['n_samples'] == len(signal)
+        expected = calculate_damage(rainflow_count(signal), curve)
+        assert states[-1]['damage'][0] == pytest.approx(expected, rel=1e-10)
+    
+    def test_stream_damage_sync_source(self):
+        """Regular iterables are accepted as chunk sources."""
+        np.random.seed(4)
+        chunks = [np.random.randn(100) * 80 for _ in range(5)]
+        
+        async def main():
+            return [state async for state in stream_damage(chunks, ['71', '36'])]
+        
+        states = asyncio.run(main())
+        
+        assert [s['n_samples'] for s in states] == [100, 200, 300, 400, 500]
+        assert np.all(np.diff([s['closed_damage'][1] for s in states]) >= 0)
+    
+    def test_stream_damage_blocking_source(self):
+        """A blocking iterator is pulled off the event loop thread."""
+        np.random.seed(5)
+        chunks = [np.random.randn(100) * 80 for _ in range(3)]
+        
+        def slow_reader():
+            for chunk in chunks:
+                time.sleep(0.05)
+                yield chunk
+        
+        async def main():
+            ticks = 0
+            
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.001)
+            
+            ticker = asyncio.ensure_future(tick())
+            states = [state async for state in stream_damage(slow_reader(), '71')]
+            ticker.cancel()
+            return ticks, states
+        
+        ticks, states = asyncio.run(main())
+        
+        assert [s['n_samples'] for s in states] == [100, 200, 300]
+        assert ticks > 10
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -8,7 +8,12 @@ from openrainflow.damage import (
     calculate_damage_from_histogram,
     calculate_equivalent_stress,
     assess_fatigue_safety,
-    damage_contribution_analysis
+    assess_fatigue_safety_batch,
+    ASSESSMENT_STATUS,
+    damage_contribution_analysis,
+    calculate_damage_per_bucket,
+    calculate_sequence_damage,
+    DamageAccumulator
 )
 
 
@@ -84,6 +89,180 @@ class TestCalculateDamage:
         
         damage = calculate_damage(cycles, curve, use_cutoff=True)
         assert damage == 0.0
+    
+    def test_damage_below_cafl_without_cutoff(self):
+        """Without cutoff, the m2 slope extends below CAFL."""
+        curve = EurocodeCategory.get_curve('71')
+        low_stress = curve.delta_sigma_L * 0.5
+        cycles = np.array(
+            [(low_stress, 0.0, 1.0)],
+            dtype=[('range', 'f8'), ('mean', 'f8'), ('count', 'f8')]
+        )
+        
+        damage = calculate_damage(cycles, curve, use_cutoff=False)
+        
+        assert damage == pytest.approx(low_stress ** curve.m2 / curve.C2)
+    
+    def test_float32_cycles(self):
+        """float32 cycles give the damage of their float64 values."""
+        np.random.seed(42)
+        signal = (np.random.randn(20000) * 60 + 100).astype(np.float32)
+        curve = EurocodeCategory.get_curve('71')
+        
+        cycles32 = rainflow_count(signal, dtype=np.float32)
+        cycles64 = cycles32.astype([('range', 'f8'), ('mean', 'f8'), ('count', 'f8')])
+        
+        assert calculate_damage(cycles32, curve) == calculate_damage(cycles64, curve)
+    
+    def test_compensated_summation(self):
+        """Many tiny increments after a large one are not lost."""
+        import math
+        
+        curve = FatigueCurve(name='Test', delta_sigma_c=100.0)
+        ranges = np.full(200001, 60.0)
+        ranges[0] = 1000.0
+        cycles = np.empty(len(ranges), dtype=[('range', 'f8'), ('mean', 'f8'), ('count', 'f8')])
+        cycles['range'] = ranges
+        cycles['mean'] = 0.0
+        cycles['count'] = 1.0
+        
+        expected = math.fsum(
+            [1000.0 ** curve.m1 / curve.C1] + [60.0 ** curve.m2 / curve.C2] * 200000
+        )
+        
+        assert calculate_damage(cycles, curve) == pytest.approx(expected, rel=1e-14)
+
+
+class TestSequenceDamage:
+    """Test damage of repeated block sequences."""
+    
+    def test_matches_concatenated_history(self):
+        """Sequence damage equals the damage of the concatenated history."""
+        np.random.seed(5)
+        flight_a = np.random.randn(300) * 60
+        flight_b = np.random.randn(200) * 90
+        curve = EurocodeCategory.get_curve('71')
+        
+        history = np.concatenate([np.tile(flight_a, 20), np.tile(flight_b, 4)])
+        expected = calculate_damage(rainflow_count(history), curve, partial_safety_factor=1.35)
+        
+        damage = calculate_sequence_damage(
+            [flight_a, flight_b], [20, 4], curve, partial_safety_factor=1.35
+        )
+        assert damage == pytest.approx(expected, rel=1e-12)
+
+
+class TestDamagePerBucket:
+    """Test damage attribution to time buckets."""
+    
+    def test_buckets_sum_to_total(self):
+        """Bucket damages add up to the damage of the whole history."""
+        np.random.seed(42)
+        signal = np.random.randn(10000) * 60
+        curve = EurocodeCategory.get_curve('71')
+        cycles = rainflow_count(signal, return_indices=True)
+        
+        damage = calculate_damage_per_bucket(cycles, curve, bucket_size=1000, n_buckets=10)
+        
+        assert damage.shape == (10,)
+        assert damage.sum() == pytest.approx(calculate_damage(cycles, curve), rel=1e-12)
+    
+    def test_attribution_by_closing_index(self):
+        """Each cycle goes to the bucket of its end sample."""
+        np.random.seed(0)
+        signal = np.random.randn(3000) * 60
+        curve = EurocodeCategory.get_curve('71')
+        cycles = rainflow_count(signal, return_indices=True)
+        
+        damage = calculate_damage_per_bucket(cycles, curve, bucket_size=500)
+        
+        for b in range(len(damage)):
+            in_bucket = cycles[cycles['end'] // 500 == b]
+            assert damage[b] == pytest.approx(calculate_damage(in_bucket, curve), rel=1e-12)
+    
+    def test_bucket_ids(self):
+        """External bucket ids match the equivalent fixed bucket size."""
+        np.random.seed(1)
+        signal = np.random.randn(4000) * 60
+        curve = EurocodeCategory.get_curve('71')
+        cycles = rainflow_count(signal, return_indices=True)
+        
+        ids = np.repeat(np.arange(4), 1000)
+        np.testing.assert_allclose(
+            calculate_damage_per_bucket(cycles, curve, bucket_ids=ids,
+                                        partial_safety_factor=1.35),
+            calculate_damage_per_bucket(cycles, curve, bucket_size=1000,
+                                        partial_safety_factor=1.35),
+            rtol=1e-15
+        )
+    
+    def test_invalid_input(self):
+        """Cycles without indices and ambiguous buckets are rejected."""
+        curve = EurocodeCategory.get_curve('71')
+        signal = np.random.randn(500) * 60
+        
+        with pytest.raises(ValueError):
+            calculate_damage_per_bucket(rainflow_count(signal), curve, bucket_size=100)
+        
+        cycles = rainflow_count(signal, return_indices=True)
+        with pytest.raises(ValueError):
+            calculate_damage_per_bucket(cycles, curve)
+        with pytest.raises(ValueError):
+            calculate_damage_per_bucket(cycles, curve, bucket_size=100, n_buckets=2)
+        with pytest.raises(ValueError):
+            calculate_damage_per_bucket(cycles, curve, bucket_ids=np.zeros(10, dtype=int))
+
+
+class TestDamageAccumulator:
+    """Test chunked damage accumulation."""
+    
+    def test_chunks_match_single_pass(self):
+        """Accumulating chunks gives the single-pass damage."""
+        np.random.seed(42)
+        cycles = rainflow_count(np.random.randn(20000) * 60)
+        curve = EurocodeCategory.get_curve('71')
+        
+        acc = DamageAccumulator(curve)
+        for chunk in np.array_split(cycles, 7):
+            acc.add(chunk)
+        
+        assert acc.damage == pytest.approx(calculate_damage(cycles, curve), rel=1e-14)
+    
+    def test_merge_partial_sums(self):
+        """Merged partial sums keep the tiny increments."""
+        import math
+        
+        curve = FatigueCurve(name='Test', delta_sigma_c=100.0)
+        dtype = [('range', 'f8'), ('mean', 'f8'), ('count', 'f8')]
+        large = np.array([(1000.0, 0.0, 1.0)], dtype=dtype)
+        small = np.zeros(100000, dtype=dtype)
+        small['range'] = 60.0
+        small['count'] = 1.0
+        
+        acc = DamageAccumulator(curve).add(large)
+        for chunk in np.array_split(small, 4):
+            acc.merge(DamageAccumulator(curve).add(chunk))
+        
+        expected = math.fsum(
+            [1000.0 ** curve.m1 / curve.C1] + [60.0 ** curve.m2 / curve.C2] * 100000
+        )
+        assert acc.damage == pytest.approx(expected, rel=1e-14)
+    
+    def test_merge_different_curve(self):
+        """Merging accumulators of different curves is rejected."""
+        acc71 = DamageAccumulator(EurocodeCategory.get_curve('71'))
+        acc90 = DamageAccumulator(EurocodeCategory.get_curve('90'))
+        
+        with pytest.raises(ValueError):
+            acc71.merge(acc90)
+    
+    def test_empty(self):
+        """Empty cycles add no damage."""
+        acc = DamageAccumulator(EurocodeCategory.get_curve('71'))
+        acc.add(rainflow_count(np.array([1.0, 2.0])))
+        
+        assert acc.damage == 0.0
+        assert acc.partial_sum == (0.0, 0.0)
 
 
 class TestCalculateLife:
@@ -270,6 +449,77 @@ class TestFatigueSafetyAssessment:
             assert details['reserve_factor'] == pytest.approx(1.0 / util, rel=1e-6)
 
 
+class TestFatigueSafetyBatch:
+    """Test columnar fatigue assessment of many locations."""
+    
+    @staticmethod
+    def _locations():
+        np.random.seed(0)
+        locations = [rainflow_count(np.random.randn(2000) * a)
+                     for a in np.random.uniform(5, 120, 40)]
+        locations.append(rainflow_count(np.zeros(3)))
+        offsets = np.concatenate([[0], np.cumsum([len(c) for c in locations])])
+        return locations, offsets
+    
+    def test_matches_single_assessment(self):
+        """Each location matches assess_fatigue_safety."""
+        locations, offsets = self._locations()
+        curves = [EurocodeCategory.get_curve(c) for c in ('71', '90', '36')]
+        curve_index = np.arange(len(locations)) % 3
+        psf = np.linspace(1.0, 1.35, len(locations))
+        
+        result = assess_fatigue_safety_batch(
+            np.concatenate(locations), offsets, curves, design_life=100,
+            partial_safety_factor=psf, curve_index=curve_index
+        )
+        
+        for k, cycles in enumerate(locations):
+            util, status, details = assess_fatigue_safety(
+                cycles, curves[curve_index[k]], design_life=100,
+                partial_safety_factor=psf[k]
+            )
+            assert result['utilization'][k] == pytest.approx(util, rel=1e-10)
+            assert ASSESSMENT_STATUS[result['status'][k]] == status
+            assert result['life'][k] == pytest.approx(details['actual_life'], rel=1e-10)
+            assert result['reserve_factor'][k] == pytest.approx(
+                details['reserve_factor'], rel=1e-10
+            )
+            assert result['equivalent_stress'][k] == pytest.approx(
+                details['equivalent_stress'], rel=1e-10
+            )
+        
+        assert set(result['status']) == {0, 1, 2}
+    
+    def test_empty_location(self):
+        """Locations without cycles pass with infinite life."""
+        locations, offsets = self._locations()
+        result = assess_fatigue_safety_batch(
+            np.concatenate(locations), offsets, EurocodeCategory.get_curve('71')
+        )
+        
+        assert result['status'][-1] == 0
+        assert result['life'][-1] == np.inf
+        assert result['reserve_factor'][-1] == np.inf
+        assert result['utilization'][-1] == 0.0
+    
+    def test_invalid_input(self):
+        """Inconsistent offsets and curve indices are rejected."""
+        locations, offsets = self._locations()
+        cycles = np.concatenate(locations)
+        curve = EurocodeCategory.get_curve('71')
+        
+        with pytest.raises(ValueError):
+            assess_fatigue_safety_batch(cycles, offsets[1:], curve)
+        with pytest.raises(ValueError):
+            assess_fatigue_safety_batch(cycles, offsets, [curve, curve])
+        with pytest.raises(ValueError):
+            assess_fatigue_safety_batch(cycles, offsets, curve,
+                                        curve_index=np.ones(len(locations), dtype=int))
+        with pytest.raises(ValueError):
+            assess_fatigue_safety_batch(cycles, offsets, curve,
+                                        design_life=np.ones(3))
+
+
 class TestDamageContribution:
     """Test damage contribution analysis."""
     
@@ -0,0 +1,122 @@
+"""Tests for inverse fatigue design solvers."""
+
+import numpy as np
+import pytest
+from openrainflow import rainflow_count
+from openrainflow.damage import assess_fatigue_safety, calculate_damage_from_histogram
+from openrainflow.eurocode import EurocodeCategory, FatigueCurve
+from openrainflow.design import (
+    critical_load_factor,
+    required_fatigue_strength,
+    minimum_category
+)
+
+
+def _locations():
+    """Cycle arrays of random signals with increasing amplitude."""
+    np.random.seed(0)
+    return [rainflow_count(np.random.randn(5000) * a) for a in (10, 30, 60, 100)]
+
+
+class TestCriticalLoadFactor:
+    """Test the critical load scale factor."""
+    
+    @pytest.mark.parametrize('use_cutoff', [True, False])
+    def test_utilization_reaches_one(self, use_cutoff):
+        """Scaled by the factor, the utilization is 1.0."""
+        curve = EurocodeCategory.get_curve('71')
+        locations = _locations()
+        
+        factors = critical_load_factor(locations, curve, design_life=200,
+                                       partial_safety_factor=1.35, use_cutoff=use_cutoff)
+        
+        assert factors.shape == (4,)
+        for cycles, factor in zip(locations, factors):
+            utilization, _, _ = assess_fatigue_safety(
+                cycles, curve, design_life=200,
+                partial_safety_factor=1.35 * factor, use_cutoff=use_cutoff
+            )
+            assert utilization == pytest.approx(1.0, rel=1e-9)
+    
+    def test_single_power_law(self):
+        """Above the knee point the factor has a closed form."""
+        curve = EurocodeCategory.get_curve('90')
+        ranges = np.array([150.0, 200.0])
+        counts = np.array([100.0, 10.0])
+        
+        factor = critical_load_factor((ranges, counts), curve)
+        damage = calculate_damage_from_histogram(ranges, counts, curve)
+        
+        assert isinstance(factor, float)
+        assert factor == pytest.approx(damage ** (-1.0 / 3.0), rel=1e-10)
+    
+    def test_cutoff_jump(self):
+        """When the damage jumps at the CAFL, the jump point is returned."""
+        curve = EurocodeCategory.get_curve('71')
+        ranges = np.array([10.0])
+        
+        factor = critical_load_factor((ranges, np.array([1e12])), curve)
+        assert factor == pytest.approx(curve.delta_sigma_L / 10.0, rel=1e-9)
+    
+    def test_no_damaging_cycles(self):
+        """Locations without positive ranges can take any load."""
+        curve = EurocodeCategory.get_curve('71')
+        
+        factors = critical_load_factor(
+            [(np.array([0.0]), np.array([1.0])), (np.array([100.0]), np.array([1.0]))],
+            curve
+        )
+        assert factors[0] == np.inf
+        assert np.isfinite(factors[1])
+    
+    def test_invalid_input(self):
+        """Bad design lives and shapes are rejected."""
+        curve = EurocodeCategory.get_curve('71')
+        
+        with pytest.raises(ValueError):
+            critical_load_factor(_locations()[0], curve, design_life=0.0)
+        with pytest.raises(ValueError):
+            critical_load_factor((np.ones(3), np.ones(2)), curve)
+        with pytest.raises(ValueError):
+            critical_load_factor([], curve)
+
+
+class TestMinimumCategory:
+    """Test the required fatigue strength and detail category."""
+    
+    def test_required_strength(self):
+        """A curve with the required strength has a utilization of 1.0."""
+        cycles = _locations()[2]
+        strength = required_fatigue_strength(cycles, design_life=200)
+        
+        utilization, _, _ = assess_fatigue_safety(
+            cycles, FatigueCurve('r', strength), design_life=200
+        )
+        assert utilization == pytest.approx(1.0, rel=1e-9)
+    
+    def test_matches_category_loop(self):
+        """The category is the lowest one passing assess_fatigue_safety."""
+        locations = _locations()
+        categories = minimum_category(locations, design_life=200,
+                                      partial_safety_factor=1.15)
+        
+        ordered = sorted(EurocodeCategory.list_categories(),
+                         key=EurocodeCategory.get_category_strength)
+        for cycles, category in zip(locations, categories):
+            expected = next(
+                (name for name in ordered
+                 if assess_fatigue_safety(cycles, EurocodeCategory.get_curve(name),
+                                          design_life=200,
+                                          partial_safety_factor=1.15)[0] < 1.0),
+                None
+            )
+            assert category == expected
+    
+    def test_no_category_passes(self):
+        """None is returned when even the best category fails."""
+        cycles = _locations()[3]
+        assert minimum_category(cycles, design_life=1e6) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
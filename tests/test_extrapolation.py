@@ -0,0 +1,163 @@
+"""Tests for load spectrum extrapolation and synthesis."""
+
+import numpy as np
+import pytest
+from openrainflow import rainflow_count
+from openrainflow.rainflow import bin_cycles, _cycle_dtype
+from openrainflow.damage import calculate_damage, calculate_damage_from_histogram
+from openrainflow.eurocode import EurocodeCategory
+from openrainflow.extrapolation import (
+    fit_spectrum,
+    extrapolate_spectrum,
+    iter_turning_points,
+    synthesize_turning_points
+)
+
+
+def _weibull_cycles(n, shape=1.5, scale=40.0, seed=0):
+    """Cycle array with Weibull distributed ranges."""
+    np.random.seed(seed)
+    cycles = np.zeros(n, dtype=_cycle_dtype())
+    cycles['range'] = scale * np.random.weibull(shape, n)
+    cycles['count'] = 1.0
+    return cycles
+
+
+class TestFitSpectrum:
+    """Test tail model fitting."""
+    
+    def test_weibull_parameters(self):
+        """The Weibull fit recovers the parameters of the sampled ranges."""
+        model = fit_spectrum(_weibull_cycles(200_000))
+        
+        assert model.shape == pytest.approx(1.5, rel=0.03)
+        assert model.scale == pytest.approx(40.0, rel=0.03)
+        assert model.n_cycles == 200_000
+        assert model.n_tail == pytest.approx(20_000, rel=1e-3)
+    
+    def test_binned_input(self):
+        """bin_cycles output gives the same fit as the raw cycles."""
+        cycles = _weibull_cycles(200_000)
+        raw = fit_spectrum(cycles)
+        binned = fit_spectrum(bin_cycles(cycles, range_bins=64))
+        
+        assert binned.shape == pytest.approx(raw.shape, rel=0.02)
+        assert binned.scale == pytest.approx(raw.scale, rel=0.02)
+    
+    def test_exponential_tail(self):
+        """The exponential model recovers the scale of an exponential tail."""
+        np.random.seed(1)
+        cycles = np.zeros(100_000, dtype=_cycle_dtype())
+        cycles['range'] = np.random.exponential(25.0, 100_000)
+        cycles['count'] = 1.0
+        
+        model = fit_spectrum(cycles, model='exponential')
+        assert model.scale == pytest.approx(25.0, rel=0.05)
+    
+    def test_invalid_input(self):
+        """Unknown models and tails too short to fit are rejected."""
+        cycles = _weibull_cycles(1000)
+        
+        with pytest.raises(ValueError):
+            fit_spectrum(cycles, model='gumbel')
+        with pytest.raises(ValueError):
+            fit_spectrum(cycles, threshold_quantile=1.0)
+        with pytest.raises(ValueError):
+            fit_spectrum((np.array([10.0, 20.0]), np.array([5.0, 1.0]), None))
+
+
+class TestExtrapolation:
+    """Test extrapolated spectra."""
+    
+    def test_large_cycle_counts(self):
+        """10^10 cycles are extrapolated without materialising them."""
+        cycles = _weibull_cycles(200_000)
+        factor = 5e4
+        ranges, counts = extrapolate_spectrum(cycles, factor)
+        
+        assert counts.sum() == pytest.approx(1e10, rel=1e-12)
+        assert ranges.max() > cycles['range'].max()
+        
+        # Damage per measured duration matches the measurement without cut-off
+        curve = EurocodeCategory.get_curve('71')
+        damage = calculate_damage_from_histogram(ranges, counts, curve, use_cutoff=False)
+        assert damage / factor == pytest.approx(
+            calculate_damage(cycles, curve, use_cutoff=False), rel=0.02
+        )
+    
+    def test_max_range(self):
+        """The tail ends at the range exceeded once on average."""
+        model = fit_spectrum(_weibull_cycles(100_000))
+        factor = 1000.0
+        s_max = model.max_range(factor)
+        
+        assert factor * model.n_tail * model.tail_exceedance(s_max) == pytest.approx(1.0)
+        ranges, counts = model.extrapolate(factor)
+        assert ranges[-1] == pytest.approx(s_max)
+        assert counts[-1] == pytest.approx(1.0)
+    
+    def test_rainflow_matrix(self):
+        """Rainflow matrices keep the mean bins and the total count."""
+        cycles = _weibull_cycles(50_000)
+        cycles['mean'] = np.random.randn(50_000) * 10
+        range_centers, mean_centers, counts_2d = bin_cycles(cycles, 40, 8)
+        
+        ranges, means, counts = extrapolate_spectrum(
+            (range_centers, mean_centers, counts_2d), 100.0, n_bins=20
+        )
+        np.testing.assert_array_equal(means, mean_centers)
+        assert counts.shape == (len(ranges), 8)
+        assert counts.sum() == pytest.approx(100.0 * counts_2d.sum())
+    
+    def test_body_is_scaled(self):
+        """Below the threshold the measured spectrum is scaled unchanged."""
+        model = fit_spectrum(bin_cycles(_weibull_cycles(10_000), range_bins=30))
+        body = model.ranges <= model.threshold
+        
+        ranges, counts = model.extrapolate(3.0)
+        np.testing.assert_array_equal(ranges[:body.sum()], model.ranges[body])
+        np.testing.assert_allclose(counts[:body.sum()], 3.0 * model.counts[body])
+
+
+class TestSynthesis:
+    """Test synthetic turning-point sequences."""
+    
+    def test_counting_recovers_cycles(self):
+        """Rainflow counting a synthetic sequence returns the drawn cycles."""
+        ranges = np.array([20.0, 50.0, 80.0, 140.0])
+        counts = np.array([1000.0, 300.0, 50.0, 2.0])
+        points = synthesize_turning_points(ranges, counts, 5000, mean=30.0, seed=3)
+        drawn = points[1::2] - points[0::2]
+        
+        cycles = rainflow_count(points)
+        full = cycles[cycles['count'] == 1.0]
+        drawn_values, drawn_counts = np.unique(drawn, return_counts=True)
+        counted_values, counted = np.unique(full['range'], return_counts=True)
+        
+        np.testing.assert_allclose(counted_values, drawn_values)
+        assert np.all(drawn_counts - counted <= 2)
+        assert cycles['count'].sum() == pytest.approx(len(drawn), abs=1.0)
+    
+    def test_chunks_are_reproducible(self):
+        """Chunks of a seeded iterator concatenate to the single sequence."""
+        ranges = np.array([10.0, 30.0, 60.0])
+        counts = np.array([5.0, 3.0, 1.0])
+        
+        chunks = list(iter_turning_points(ranges, counts, 1050, chunk_cycles=100, seed=9))
+        assert len(chunks) == 11
+        assert len(chunks[-1]) == 100
+        
+        single = synthesize_turning_points(ranges, counts, 1050, seed=9)
+        assert len(single) == 2100
+        np.testing.assert_array_equal(np.concatenate(chunks), single)
+    
+    def test_invalid_counts(self):
+        """Negative or empty counts are rejected."""
+        with pytest.raises(ValueError):
+            synthesize_turning_points(np.array([1.0, 2.0]), np.array([-1.0, 2.0]), 10)
+        with pytest.raises(ValueError):
+            synthesize_turning_points(np.array([1.0, 2.0]), np.zeros(2), 10)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -383,6 +383,50 @@ class TestConsistency:
                 assert cycle_counts[i] <= cycle_counts[i-1]
 
 
+class TestLazyImport:
+    """Test that the package loads its submodules on demand."""
+    
+    def test_import_is_lazy(self):
+        """Importing the package loads neither numba nor matplotlib."""
+        import os
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys, openrainflow\n"
+            "heavy = ('numba', 'matplotlib', 'scipy', 'joblib', 'openrainflow.rainflow')\n"
+            "assert not [m for m in heavy if m in sys.modules], sys.modules.keys()\n"
+            "openrainflow.EurocodeCategory\n"
+            "assert 'numba' not in sys.modules\n"
+            "openrainflow.rainflow_count\n"
+            "assert 'numba' in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=root)
+    
+    def test_public_attributes(self):
+        """Public names and submodules resolve on access."""
+        import openrainflow
+        from openrainflow import rainflow_count, visualization
+        
+        assert openrainflow.rainflow_count is rainflow_count
+        assert openrainflow.visualization is visualization
+        assert 'calculate_damage' in dir(openrainflow)
+        with pytest.raises(AttributeError):
+            openrainflow.not_a_function
+    
+    def test_visualization_none_without_matplotlib(self, monkeypatch):
+        """Without matplotlib, openrainflow.visualization is None."""
+        import openrainflow
+        
+        openrainflow.visualization
+        monkeypatch.delattr(openrainflow, 'visualization')
+        monkeypatch.setattr(openrainflow, '_HAS_VISUALIZATION', False)
+        
+        assert hasattr(openrainflow, 'visualization')
+        assert openrainflow.visualization is None
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
 
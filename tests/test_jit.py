@@ -0,0 +1,101 @@
+"""Tests for eager and ahead-of-time compilation."""
+
+import importlib.util
+import os
+import types
+
+import numpy as np
+import pytest
+import openrainflow.rainflow as rainflow_module
+from openrainflow import rainflow_count, warmup
+from openrainflow.jit import SIGNATURES, build_aot
+from openrainflow.rainflow import _find_reversals, _rainflow_core
+
+
+class TestWarmup:
+    """Test eager compilation of the kernels."""
+    
+    def test_warmup_compiles_signatures(self):
+        """Every kernel is compiled for its explicit signatures."""
+        timings = warmup()
+        
+        assert set(timings) == set(SIGNATURES)
+        assert all(t >= 0 for t in timings.values())
+        assert len(_find_reversals.signatures) >= 2
+    
+    def test_no_recompilation_after_warmup(self):
+        """Counting after warmup reuses the compiled signatures."""
+        warmup()
+        n_signatures = len(_rainflow_core.signatures)
+        
+        np.random.seed(42)
+        for dtype in (np.float64, np.float32):
+            rainflow_count((np.random.randn(500) * 50).astype(dtype), gate=5.0)
+        
+        assert len(_rainflow_core.signatures) == n_signatures
+    
+    def test_float32_signal(self):
+        """float32 signals are counted like their float64 values."""
+        np.random.seed(0)
+        signal = (np.random.randn(1000) * 50).astype(np.float32)
+        
+        cycles = rainflow_count(signal)
+        expected = rainflow_count(signal.astype(np.float64))
+        
+        np.testing.assert_allclose(cycles['range'], expected['range'], rtol=1e-6)
+        np.testing.assert_array_equal(cycles['count'], expected['count'])
+    
+    def test_invalid_dtype(self):
+        """Unsupported dtypes raise ValueError."""
+        with pytest.raises(ValueError):
+            warmup(dtypes=('int8',))
+
+
+class TestAheadOfTime:
+    """Test the ahead-of-time compiled extension."""
+    
+    @pytest.fixture(scope='class')
+    def aot_module(self, tmp_path_factory):
+        pytest.importorskip('numba.pycc')
+        path = build_aot(str(tmp_path_factory.mktemp('aot')), dtypes=('float64',))
+        assert os.path.exists(path)
+        
+        spec = importlib.util.spec_from_file_location('_aot', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    
+    def test_aot_kernels_match_jit(self, aot_module, monkeypatch):
+        """rainflow_count gives identical cycles with the AOT kernels."""
+        np.random.seed(42)
+        signal = np.random.randn(2000) * 50 + 100
+        expected = [rainflow_count(signal), rainflow_count(signal[::2], gate=10.0)]
+        
+        monkeypatch.setattr(rainflow_module, '_aot', aot_module)
+        
+        np.testing.assert_array_equal(rainflow_count(signal), expected[0])
+        np.testing.assert_array_equal(rainflow_count(signal[::2], gate=10.0), expected[1])
+    
+    def test_missing_dtype_uses_jit(self, aot_module, monkeypatch):
+        """float32 signals use the JIT kernels with a float64-only extension."""
+        np.random.seed(0)
+        signal = (np.random.randn(2000) * 50).astype(np.float32)
+        expected = rainflow_count(signal, dtype=np.float32)
+        
+        monkeypatch.setattr(rainflow_module, '_aot', aot_module)
+        
+        np.testing.assert_array_equal(rainflow_count(signal, dtype=np.float32), expected)
+    
+    def test_stale_extension_ignored(self, aot_module):
+        """Extensions built from other kernel sources are not used."""
+        assert rainflow_module._checked_aot(aot_module) is aot_module
+        
+        stale = types.SimpleNamespace(kernel_fingerprint=lambda: -1)
+        with pytest.warns(UserWarning, match="build_aot"):
+            assert rainflow_module._checked_aot(stale) is None
+        with pytest.warns(UserWarning, match="build_aot"):
+            assert rainflow_module._checked_aot(types.SimpleNamespace()) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,117 @@
+"""Tests for real-time fatigue monitoring."""
+
+import numpy as np
+import pytest
+from openrainflow import rainflow_count, calculate_damage
+from openrainflow.eurocode import EurocodeCategory
+from openrainflow.monitor import FatigueMonitor
+
+
+def _push_in_frames(monitor, signal, seed=0):
+    """Push a signal in frames of random length."""
+    rng = np.random.default_rng(seed)
+    pos = 0
+    while pos < len(signal):
+        step = int(rng.integers(1, 50))
+        monitor.push(signal[pos:pos + step])
+        pos += step
+
+
+class TestFatigueMonitor:
+    """Test streaming damage accumulation."""
+    
+    def test_matches_batch_damage(self):
+        """Streaming damage equals counting the whole history at once."""
+        np.random.seed(42)
+        signal = np.random.randn(5000) * 60 + 100
+        curve = EurocodeCategory.get_curve('71')
+        
+        monitor = FatigueMonitor(curve, buffer_size=64)
+        _push_in_frames(monitor, signal)
+        state = monitor.snapshot()
+        
+        expected = calculate_damage(rainflow_count(signal), curve)
+        assert state['n_samples'] == len(signal)
+        assert state['damage'][0] == pytest.approx(expected, rel=1e-10)
+    
+    def test_intermediate_snapshots(self):
+        """Snapshots during streaming match the batch result of the prefix."""
+        np.random.seed(1)
+        signal = np.random.randn(3000) * 80
+        curve = EurocodeCategory.get_curve('36')
+        monitor = FatigueMonitor(curve, buffer_size=100)
+        
+        for end in (2, 3, 517, 1000, 3000):
+            monitor.push(signal[monitor.n_samples:end])
+            state = monitor.snapshot()
+            expected = calculate_damage(rainflow_count(signal[:end]), curve)
+            assert state['damage'][0] == pytest.approx(expected, rel=1e-10)
+    
+    def test_multiple_curves(self):
+        """Damage is accumulated independently for each curve."""
+        np.random.seed(2)
+        signal = np.random.randn(2000) * 50
+        curves = [EurocodeCategory.get_curve(c) for c in ('160', '71', '36')]
+        
+        monitor = FatigueMonitor(['160', '71', curves[2]], partial_safety_factor=1.35)
+        monitor.push(signal)
+        state = monitor.snapshot()
+        
+        cycles = rainflow_count(signal)
+        expected = [
+            calculate_damage(cycles, c, partial_safety_factor=1.35) for c in curves
+        ]
+        assert state['curves'] == ['160', '71', '36']
+        np.testing.assert_allclose(state['damage'], expected, rtol=1e-10)
+        np.testing.assert_allclose(
+            state['closed_damage'] + state['residue_damage'], state['damage']
+        )
+    
+    def test_residue_growth(self):
+        """A diverging history larger than the initial capacity is handled."""
+        signal = np.arange(1, 3001, dtype=np.float64) * (-1.0) ** np.arange(3000)
+        curve = EurocodeCategory.get_curve('71')
+        
+        monitor = FatigueMonitor(curve, buffer_size=16, residue_capacity=4)
+        _push_in_frames(monitor, signal)
+        state = monitor.snapshot()
+        
+        expected = calculate_damage(rainflow_count(signal), curve)
+        assert state['damage'][0] == pytest.approx(expected, rel=1e-10)
+    
+    def test_recent_samples(self):
+        """The ring buffer keeps the latest samples in order."""
+        monitor = FatigueMonitor('71', buffer_size=8)
+        monitor.push(np.arange(5))
+        np.testing.assert_array_equal(monitor.recent(), np.arange(5))
+        
+        monitor.push(np.arange(5, 13))
+        np.testing.assert_array_equal(monitor.recent(), np.arange(5, 13))
+        np.testing.assert_array_equal(monitor.recent(3), [10, 11, 12])
+    
+    def test_reset_and_short_history(self):
+        """Short histories give no damage; reset clears everything."""
+        monitor = FatigueMonitor('71')
+        assert monitor.snapshot()['damage'][0] == 0.0
+        
+        monitor.push([0.0])
+        assert monitor.snapshot()['damage'][0] == 0.0
+        
+        monitor.push([500.0, 0.0])
+        assert monitor.snapshot()['damage'][0] > 0.0
+        
+        monitor.reset()
+        state = monitor.snapshot()
+        assert state['n_samples'] == 0
+        assert state['damage'][0] == 0.0
+    
+    def test_invalid_arguments(self):
+        """Invalid configuration raises ValueError."""
+        with pytest.raises(ValueError):
+            FatigueMonitor('71', buffer_size=0)
+        with pytest.raises(ValueError):
+            FatigueMonitor([])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,119 @@
+"""Tests for critical plane damage scans."""
+
+import numpy as np
+import pytest
+from openrainflow import rainflow_count, calculate_damage
+from openrainflow.eurocode import EurocodeCategory
+from openrainflow.multiaxial import (
+    critical_plane_damage,
+    scan_projections,
+    plane_weights
+)
+
+
+def _reference_damage(channels, weights, curve):
+    """Project, count and sum damage plane by plane."""
+    return np.array([
+        calculate_damage(rainflow_count(channels @ w), curve) for w in weights
+    ])
+
+
+class TestPlaneWeights:
+    """Test stress projection weights."""
+    
+    def test_normal_stress_rotation(self):
+        """Normal stress follows the plane stress transformation."""
+        weights = plane_weights([0.0, 90.0, 45.0], 'normal')
+        stress = np.array([100.0, 20.0, 30.0])
+        
+        projected = weights @ stress
+        assert projected[0] == pytest.approx(100.0)
+        assert projected[1] == pytest.approx(20.0)
+        assert projected[2] == pytest.approx(60.0 + 30.0)
+    
+    def test_shear_stress_rotation(self):
+        """Shear stress on the 0° plane is tau_xy."""
+        weights = plane_weights([0.0, 45.0], 'shear')
+        stress = np.array([100.0, 20.0, 30.0])
+        
+        projected = weights @ stress
+        assert projected[0] == pytest.approx(30.0)
+        assert projected[1] == pytest.approx(-40.0)
+    
+    def test_invalid_component(self):
+        """Unknown components are rejected."""
+        with pytest.raises(ValueError):
+            plane_weights([0.0], 'axial')
+
+
+class TestCriticalPlane:
+    """Test the parallel critical plane scan."""
+    
+    def test_matches_per_plane_counting(self):
+        """Damage per plane equals counting each projection separately."""
+        np.random.seed(42)
+        stress = np.column_stack([
+            np.random.randn(5000) * 80,
+            np.random.randn(5000) * 40,
+            np.random.randn(5000) * 30,
+        ])
+        curve = EurocodeCategory.get_curve('71')
+        angles = np.arange(0.0, 180.0, 5.0)
+        
+        result = critical_plane_damage(stress, curve, angles=angles)
+        expected = _reference_damage(stress, plane_weights(angles), curve)
+        
+        np.testing.assert_allclose(result['damage'], expected, rtol=1e-10)
+        assert result['critical_angle'] == angles[np.argmax(expected)]
+        assert result['max_damage'] == pytest.approx(expected.max(), rel=1e-10)
+    
+    def test_uniaxial_critical_angle(self):
+        """A uniaxial history in y is critical on the 90° plane."""
+        np.random.seed(0)
+        stress = np.zeros((2000, 3))
+        stress[:, 1] = np.random.randn(2000) * 100
+        
+        result = critical_plane_damage(stress, EurocodeCategory.get_curve('71'))
+        
+        assert result['critical_angle'] == 90.0
+        assert result['max_damage'] == pytest.approx(
+            calculate_damage(rainflow_count(stress[:, 1]), EurocodeCategory.get_curve('71')),
+            rel=1e-10
+        )
+    
+    def test_arbitrary_projections(self):
+        """scan_projections handles any number of channels."""
+        np.random.seed(3)
+        channels = np.random.randn(3000, 6) * 50
+        weights = np.random.randn(10, 6)
+        curve = EurocodeCategory.get_curve('90')
+        
+        damage = scan_projections(channels, weights, curve, partial_safety_factor=1.35)
+        
+        expected = np.array([
+            calculate_damage(rainflow_count(channels @ w), curve, partial_safety_factor=1.35)
+            for w in weights
+        ])
+        np.testing.assert_allclose(damage, expected, rtol=1e-10)
+    
+    def test_short_history(self):
+        """Histories too short to hold a cycle give zero damage."""
+        damage = scan_projections(
+            np.ones((1, 3)), plane_weights([0.0, 45.0]), EurocodeCategory.get_curve('71')
+        )
+        np.testing.assert_array_equal(damage, 0.0)
+    
+    def test_invalid_shapes(self):
+        """Mismatched shapes are rejected."""
+        curve = EurocodeCategory.get_curve('71')
+        
+        with pytest.raises(ValueError):
+            critical_plane_damage(np.zeros((100, 2)), curve)
+        with pytest.raises(ValueError):
+            scan_projections(np.zeros((100, 3)), np.zeros((5, 4)), curve)
+        with pytest.raises(ValueError):
+            critical_plane_damage(np.zeros((100, 3)), curve, angles=[])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -1,8 +1,10 @@
 """Tests for parallel processing module."""
 
+import os
+
 import numpy as np
 import pytest
-from openrainflow import rainflow_count
+from openrainflow import rainflow_count, calculate_damage, calculate_life
 from openrainflow.parallel import (
     process_signals_parallel,
     batch_damage_calculation,
@@ -65,6 +67,89 @@ class TestProcessSignalsParallel:
             if len(cycles) > 0:
                 assert np.all(cycles['range'] >= 20.0 - 1e-10)
     
+    def test_threading_backend(self):
+        """Threading backend shares the input arrays without copies."""
+        np.random.seed(42)
+        signals = [np.random.randn(200) * 50 + 100 for _ in range(4)]
+        seen = []
+        
+        def count_and_record(sig):
+            seen.append(sig)
+            return rainflow_count(sig)
+        
+        results = process_signals_parallel(
+            signals, count_and_record, n_jobs=2, backend='threading'
+        )
+        
+        assert all(any(s is sig for s in seen) for sig in signals)
+        for sig, cycles in zip(signals, results):
+            np.testing.assert_array_equal(cycles, rainflow_count(sig))
+    
+    def test_scheduled_exact_results(self):
+        """Batched and split signals give exactly rainflow_count's cycles."""
+        np.random.seed(42)
+        signals = [np.random.randn(300) * 50 for _ in range(20)]
+        signals.append(np.cumsum(np.random.randn(50_000)))
+        signals.append(np.repeat(np.random.randn(8_000), 3))  # plateaus
+        
+        for kwargs in ({}, {'gate': 2.0}, {'gate': 2.0, 'gate_mode': 'post'},
+                       {'remove_zeros': False}):
+            results = process_signals_parallel(
+                signals, rainflow_count, n_jobs=2, backend='threading',
+                schedule=True, task_size=4_000, **kwargs
+            )
+            for sig, cycles in zip(signals, results):
+                np.testing.assert_array_equal(cycles, rainflow_count(sig, **kwargs))
+    
+    def test_scheduled_timings(self):
+        """Tasks are batched, split and submitted longest first."""
+        np.random.seed(0)
+        lengths = [100] * 30 + [20_000, 5_000, 2_000]
+        signals = [np.random.randn(n) for n in lengths]
+        
+        results, timings = process_signals_parallel(
+            signals, rainflow_count, n_jobs=1, schedule=True,
+            task_size=4_000, return_timings=True
+        )
+        
+        assert len(results) == len(signals)
+        kinds = [t['kind'] for t in timings]
+        assert kinds.count('chunk') == 5
+        assert kinds.count('merge') == 1
+        assert sorted(i for t in timings if t['kind'] == 'batch' for i in t['signals']) \
+            == list(range(30)) + [32]
+        
+        first_pass = [t['samples'] for t in timings if t['kind'] != 'merge']
+        assert first_pass == sorted(first_pass, reverse=True)
+        assert sum(first_pass) == sum(lengths)
+        assert all(t['seconds'] >= 0 for t in timings)
+    
+    def test_scheduled_periodic_not_split(self):
+        """Periodic signals are counted whole, however long."""
+        np.random.seed(1)
+        signals = [np.random.randn(300) * 50, np.cumsum(np.random.randn(20_000))]
+        
+        results, timings = process_signals_parallel(
+            signals, rainflow_count, n_jobs=1, schedule=True,
+            task_size=1_000, return_timings=True, periodic=True
+        )
+        
+        assert 'chunk' not in [t['kind'] for t in timings]
+        for sig, cycles in zip(signals, results):
+            np.testing.assert_array_equal(cycles, rainflow_count(sig, periodic=True))
+    
+    def test_scheduled_generic_function(self):
+        """Other functions are batched but never split."""
+        signals = [np.arange(n, dtype=float) for n in (10, 50_000, 20)]
+        
+        results, timings = process_signals_parallel(
+            signals, np.sum, n_jobs=1, schedule=True,
+            task_size=1_000, return_timings=True
+        )
+        
+        assert results == [np.sum(sig) for sig in signals]
+        assert [t['kind'] for t in timings] == ['signal', 'batch']
+    
     def test_single_job(self):
         """Test that n_jobs=1 works (sequential)."""
         np.random.seed(42)
@@ -365,6 +450,301 @@ class TestParallelFatigueAnalyzer:
             if len(cycles) > 0:
                 assert np.all(cycles['range'] >= 30.0 - 1e-10)
     
+    def test_memmap_backend(self):
+        """Memmap backend gives the same results as the default backend."""
+        np.random.seed(42)
+        signals = [np.random.randn(n) * 50 + 100 for n in (50, 300, 1, 1000, 120)]
+        
+        reference = ParallelFatigueAnalyzer(n_jobs=2)
+        reference.add_signals(signals)
+        reference.set_fatigue_curve('71')
+        expected = reference.analyze(design_life=100)
+        
+        with ParallelFatigueAnalyzer(n_jobs=2, backend='memmap') as analyzer:
+            analyzer.add_signals(signals)
+            analyzer.set_fatigue_curve('71')
+            results = analyzer.analyze(design_life=100)
+            temp_dir = analyzer._temp_dir
+            
+            assert os.path.isdir(temp_dir)
+            for cycles, ref in zip(results['cycles_list'], expected['cycles_list']):
+                if len(cycles) > 0:
+                    assert isinstance(cycles, np.memmap)
+                np.testing.assert_array_equal(cycles, ref)
+            np.testing.assert_allclose(results['damages'], expected['damages'])
+            
+            # Adding signals repacks the files on the next count
+            analyzer.add_signals([signals[3] * 2])
+            cycles_list = analyzer.count_cycles(gate=20.0)
+            assert len(cycles_list) == 6
+            np.testing.assert_array_equal(
+                cycles_list[5], rainflow_count(signals[3] * 2, gate=20.0)
+            )
+        
+        assert not os.path.exists(temp_dir)
+    
+    def test_memmap_files_and_dtypes(self):
+        """Packs keep the signal dtype, and only live cycle files remain."""
+        np.random.seed(3)
+        signals32 = [(np.random.randn(n) * 50).astype(np.float32) for n in (400, 2, 900)]
+        counts16 = [(np.random.randn(500) * 1000).astype(np.int16)]
+        
+        with ParallelFatigueAnalyzer(n_jobs=2, backend='memmap') as analyzer:
+            analyzer.add_signals(signals32)
+            cycles_list = analyzer.count_cycles()
+            for sig, cycles in zip(signals32, cycles_list):
+                np.testing.assert_array_equal(cycles, rainflow_count(sig))
+            
+            files = os.listdir(analyzer._temp_dir)
+            assert files == ['cycles_1.dat']
+            assert os.path.getsize(os.path.join(analyzer._temp_dir, files[0])) \
+                == (399 + 1 + 899) * cycles_list[0].dtype.itemsize
+            
+            cycles_list = analyzer.count_cycles(dtype=np.float32, return_indices=True)
+            assert cycles_list[0].dtype == rainflow_count(
+                signals32[0], dtype=np.float32, return_indices=True
+            ).dtype
+            assert os.listdir(analyzer._temp_dir) == ['cycles_2.dat']
+            
+            analyzer.signals = counts16
+            cycles_list = analyzer.count_cycles(scale=0.1)
+            np.testing.assert_array_equal(cycles_list[0], rainflow_count(counts16[0], scale=0.1))
+            assert os.listdir(analyzer._temp_dir) == ['cycles_3.dat']
+    
+    def test_threading_backend(self):
+        """Threading backend gives the same damages as the default backend."""
+        np.random.seed(0)
+        signals = [np.random.randn(200) * 50 + 100 for _ in range(4)]
+        curve = EurocodeCategory.get_curve('71')
+        
+        analyzer = ParallelFatigueAnalyzer(n_jobs=2, backend='threading')
+        analyzer.add_signals(signals)
+        analyzer.set_fatigue_curve(curve)
+        damages = analyzer.calculate_damages()
+        
+        expected = [calculate_damage(rainflow_count(sig), curve) for sig in signals]
+        np.testing.assert_allclose(damages, expected)
+    
+    def test_recount_only_new_signals(self):
+        """Signals added after counting are counted alone."""
+        np.random.seed(42)
+        analyzer = ParallelFatigueAnalyzer(n_jobs=1)
+        analyzer.set_fatigue_curve('71')
+        counted = []
+        count_signals = analyzer._count_signals
+        
+        def recording_count(signals, **kwargs):
+            counted.append(len(signals))
+            return count_signals(signals, **kwargs)
+        
+        analyzer._count_signals = recording_count
+        
+        analyzer.add_signals([np.random.randn(100) * 50 for _ in range(3)])
+        analyzer.count_cycles(gate=5.0)
+        analyzer.add_signals([np.random.randn(100) * 50 for _ in range(2)])
+        results = analyzer.analyze()
+        analyzer.analyze()
+        
+        assert counted == [3, 2]
+        assert len(results['cycles_list']) == 5
+        np.testing.assert_array_equal(
+            results['cycles_list'][4], rainflow_count(analyzer.signals[4], gate=5.0)
+        )
+        
+        # Replacing a signal recounts it; new arguments recount everything
+        analyzer.signals[0] = analyzer.signals[0] * 2
+        analyzer.analyze()
+        analyzer.count_cycles()
+        assert counted == [3, 2, 1, 5]
+    
+    def test_damages_memoized(self, monkeypatch):
+        """Damages are computed once per signal and arguments."""
+        import openrainflow.parallel as parallel_module
+        
+        np.random.seed(0)
+        analyzer = ParallelFatigueAnalyzer(n_jobs=1)
+        analyzer.add_signals([np.random.randn(200) * 50 + 100 for _ in range(4)])
+        analyzer.set_fatigue_curve('71')
+        
+        evaluated = []
+        batch = parallel_module.batch_damage_calculation
+        
+        def recording_batch(cycles_list, curves, **kwargs):
+            evaluated.append(len(cycles_list))
+            return batch(cycles_list, curves, **kwargs)
+        
+        monkeypatch.setattr(parallel_module, 'batch_damage_calculation', recording_batch)
+        
+        results = analyzer.analyze(design_life=10)
+        analyzer.get_summary()
+        analyzer.analyze(partial_safety_factor=1.35)
+        analyzer.add_signals([np.random.randn(200) * 50 + 100])
+        analyzer.analyze(design_life=10)
+        analyzer.set_fatigue_curve('36')
+        analyzer.analyze()
+        
+        assert evaluated == [4, 4, 1, 5]
+        
+        curve = EurocodeCategory.get_curve('71')
+        expected_lives = [
+            calculate_life(cycles, curve) for cycles in results['cycles_list']
+        ]
+        np.testing.assert_allclose(results['lives'], expected_lives)
+    
+    def test_persistent_state_resumes(self, tmp_path, monkeypatch):
+        """A resumed analyzer only counts the new signals."""
+        import openrainflow.parallel as parallel_module
+        
+        np.random.seed(7)
+        day1 = [np.random.randn(300) * 50 + 100 for _ in range(3)]
+        day2 = [np.random.randn(300) * 80 + 100 for _ in range(2)]
+        state_dir = str(tmp_path / 'fleet')
+        
+        analyzer = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        analyzer.add_signals(day1)
+        analyzer.set_fatigue_curve('71')
+        analyzer.count_cycles(gate=5.0)
+        first = analyzer.analyze(design_life=50)
+        assert first['n_signals'] == 3
+        
+        counted = []
+        original = parallel_module.process_signals_parallel
+        
+        def spy(signals, *args, **kwargs):
+            counted.append(len(signals))
+            return original(signals, *args, **kwargs)
+        
+        monkeypatch.setattr(parallel_module, 'process_signals_parallel', spy)
+        
+        resumed = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        resumed.add_signals(day2)
+        resumed.set_fatigue_curve('71')
+        results = resumed.analyze(design_life=50)
+        
+        assert counted == [2]
+        assert results['n_signals'] == 5
+        
+        curve = EurocodeCategory.get_curve('71')
+        expected = [
+            calculate_damage(rainflow_count(sig, gate=5.0), curve)
+            for sig in day1 + day2
+        ]
+        np.testing.assert_allclose(results['damages'], expected)
+        assert len(results['cycles_list']) == 5
+        assert results['max_damage'] == pytest.approx(max(expected))
+        assert results['min_life'] == pytest.approx(1.0 / max(expected))
+        assert results['max_utilization'] == pytest.approx(50 * max(expected))
+        reference = ParallelFatigueAnalyzer(n_jobs=1)
+        reference.add_signals(day1 + day2)
+        reference.set_fatigue_curve('71')
+        reference.count_cycles(gate=5.0)
+        assert results.keys() == reference.analyze(design_life=50).keys()
+        
+        # Analyzing again stores nothing new and reads no stored file
+        loads = []
+        original_load = np.load
+        monkeypatch.setattr(parallel_module.np, 'load',
+                            lambda *a, **k: loads.append(a[0]) or original_load(*a, **k))
+        results = resumed.analyze(design_life=50)
+        assert results['n_signals'] == 5
+        assert len(results['cycles_list']) == 5
+        np.testing.assert_allclose(results['damages'], expected)
+        assert len(resumed._state.manifest['batches']) == 2
+        assert loads == []
+    
+    def test_persistent_state_new_curve(self, tmp_path):
+        """A new curve is evaluated from the stored cycles."""
+        np.random.seed(8)
+        signals = [np.random.randn(200) * 60 + 100 for _ in range(3)]
+        state_dir = str(tmp_path / 'fleet')
+        
+        analyzer = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        analyzer.add_signals(signals)
+        analyzer.set_fatigue_curve('71')
+        analyzer.analyze()
+        
+        resumed = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        resumed.set_fatigue_curve('36')
+        results = resumed.analyze(partial_safety_factor=1.35)
+        
+        curve = EurocodeCategory.get_curve('36')
+        expected = [
+            calculate_damage(rainflow_count(sig), curve, partial_safety_factor=1.35)
+            for sig in signals
+        ]
+        np.testing.assert_allclose(results['damages'], expected)
+        assert results['max_damage'] == pytest.approx(max(expected))
+    
+    def test_persistent_state_indexed_cycles(self, tmp_path):
+        """Cycles counted with indices are stored and reloaded with them."""
+        np.random.seed(10)
+        signals = [np.random.randn(200) * 60 + 100 for _ in range(3)]
+        state_dir = str(tmp_path / 'fleet')
+        
+        analyzer = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        analyzer.add_signals(signals[:2])
+        analyzer.set_fatigue_curve('71')
+        analyzer.count_cycles(return_indices=True)
+        analyzer.analyze()
+        
+        resumed = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        resumed.add_signals(signals[2:])
+        resumed.set_fatigue_curve('71')
+        results = resumed.analyze()
+        
+        assert results['n_signals'] == 3
+        curve = EurocodeCategory.get_curve('71')
+        for sig, cycles in zip(signals, results['cycles_list']):
+            expected = rainflow_count(sig, return_indices=True)
+            assert cycles.dtype == expected.dtype
+            np.testing.assert_array_equal(cycles, expected)
+        np.testing.assert_allclose(
+            results['damages'], [calculate_damage(rainflow_count(sig), curve) for sig in signals]
+        )
+    
+    def test_persistent_state_float32(self, tmp_path):
+        """Single-precision counts are stored in float32 and resumed."""
+        np.random.seed(11)
+        signals = [np.random.randn(200) * 60 + 100 for _ in range(3)]
+        state_dir = str(tmp_path / 'fleet')
+        
+        analyzer = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        analyzer.add_signals(signals[:2])
+        analyzer.set_fatigue_curve('71')
+        analyzer.count_cycles(dtype=np.float32)
+        analyzer.analyze()
+        
+        resumed = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        resumed.add_signals(signals[2:])
+        resumed.set_fatigue_curve('71')
+        resumed.count_cycles(dtype='float32')
+        results = resumed.analyze()
+        
+        assert results['n_signals'] == 3
+        for sig, cycles in zip(signals, results['cycles_list']):
+            assert cycles['range'].dtype == np.float32
+            np.testing.assert_array_equal(cycles, rainflow_count(sig, dtype=np.float32))
+        
+        with pytest.raises(ValueError, match="counted with"):
+            resumed.count_cycles()
+    
+    def test_persistent_state_count_mismatch(self, tmp_path):
+        """Appending signals counted differently raises an error."""
+        np.random.seed(9)
+        state_dir = str(tmp_path / 'fleet')
+        
+        analyzer = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        analyzer.add_signals([np.random.randn(100) * 50])
+        analyzer.set_fatigue_curve('71')
+        analyzer.analyze()
+        
+        resumed = ParallelFatigueAnalyzer(n_jobs=1, state_dir=state_dir)
+        resumed.add_signals([np.random.randn(100) * 50])
+        resumed.set_fatigue_curve('71')
+        with pytest.raises(ValueError, match="counted with"):
+            resumed.count_cycles(gate=10.0)
+        assert resumed.cycles_list is None
+    
     def test_analyzer_empty_signals(self):
         """Test analyzer with no signals."""
         analyzer = ParallelFatigueAnalyzer(n_jobs=2)
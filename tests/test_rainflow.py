@@ -1,9 +1,17 @@
 """Tests for rainflow counting algorithm."""
 
+import threading
+import warnings
+
 import numpy as np
 import pytest
-from openrainflow import rainflow_count, rainflow_count_parallel
-from openrainflow.rainflow import _find_reversals, combine_cycles, bin_cycles
+from openrainflow import rainflow_count, rainflow_count_parallel, calculate_damage
+from openrainflow.eurocode import EurocodeCategory
+from openrainflow import rainflow as rainflow_module
+from openrainflow.rainflow import (
+    _find_reversals, _find_reversals_parallel, _hysteresis_filter,
+    combine_cycles, bin_cycles, count_block_sequence
+)
 
 
 class TestFindReversals:
@@ -36,6 +44,126 @@ class TestFindReversals:
         
         # Only endpoints
         assert len(reversals) == 2
+    
+    @staticmethod
+    def _reference(signal):
+        """Reversals with the compound peak/valley test, point by point."""
+        keep = [0]
+        for i in range(1, len(signal) - 1):
+            if (signal[i] >= signal[i-1] and signal[i] > signal[i+1]) or \
+               (signal[i] <= signal[i-1] and signal[i] < signal[i+1]):
+                keep.append(i)
+        keep.append(len(signal) - 1)
+        return signal[keep], np.array(keep)
+    
+    @pytest.mark.parametrize('dtype', ['float64', 'float32', 'int16', 'int32'])
+    def test_matches_reference_with_plateaus(self, dtype):
+        """Both detection loops keep exactly the reference points."""
+        np.random.seed(5)
+        t = np.arange(5000)
+        signals = [
+            np.random.randn(5000) * 100,
+            np.round(np.random.randn(5000) * 2),             # many plateaus
+            np.repeat(np.random.randint(-5, 5, 500), np.random.randint(1, 6, 500)),
+            np.array([0, 1, 1, 1, 0, 0, 2, 2, 2, 2]),
+            np.sin(t * 0.01) * 100,                          # few reversals
+            np.round(np.sin(t * 0.01) * 20),                 # smooth, with plateaus
+            np.concatenate([np.sin(t * 0.01), np.random.randn(5000)]) * 100,
+        ]
+        for signal in signals:
+            signal = signal.astype(dtype)
+            reversals, indices = _find_reversals(signal)
+            expected_reversals, expected_indices = self._reference(signal)
+            
+            np.testing.assert_array_equal(indices, expected_indices)
+            np.testing.assert_array_equal(reversals, expected_reversals)
+    
+    def test_sampled_density_selects_loop(self):
+        """Noisy signals are scanned without branching, smooth ones with the branchy loop."""
+        np.random.seed(6)
+        for signal, dense in [(np.random.randn(5000), True),
+                              (np.sin(np.arange(5000) * 0.01), False)]:
+            n_reversals, n_sampled = rainflow_module._sample_reversals(signal)
+            assert (n_reversals * rainflow_module._DENSE_REVERSALS >= n_sampled) == dense
+    
+    def test_nan_is_not_a_reversal(self):
+        """NaN samples fail every comparison, as in the compound test."""
+        signal = np.array([0.0, 2.0, np.nan, 1.0, 3.0, 0.0])
+        _, indices = _find_reversals(signal)
+        np.testing.assert_array_equal(indices, self._reference(signal)[1])
+    
+    @pytest.mark.parametrize('dtype', ['float64', 'float32', 'int16'])
+    def test_parallel_matches_sequential(self, dtype):
+        """Chunked detection equals the sequential scan for any chunk count."""
+        np.random.seed(6)
+        signals = [
+            np.random.randn(3001) * 100,
+            np.repeat(np.random.randint(-3, 3, 300), np.random.randint(1, 40, 300)),
+            np.zeros(50),
+            np.array([0, 1, 1, 1, 0]),
+            np.array([0, 1]),
+        ]
+        for signal in signals:
+            signal = signal.astype(dtype)
+            expected_reversals, expected_indices = _find_reversals(signal)
+            for n_chunks in (1, 2, 3, 7, 64, 10_000):
+                reversals, indices = _find_reversals_parallel(signal, n_chunks)
+                
+                assert reversals.dtype == signal.dtype
+                np.testing.assert_array_equal(indices, expected_indices)
+                np.testing.assert_array_equal(reversals, expected_reversals)
+    
+    def test_plateau_across_chunks(self):
+        """A plateau split between chunks contributes only its last point."""
+        signal = np.array([0.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 1.0, 3.0, 3.0, 3.0, 0.0])
+        for n_chunks in range(1, len(signal)):
+            _, indices = _find_reversals_parallel(signal, n_chunks)
+            np.testing.assert_array_equal(indices, [0, 6, 7, 10, 11])
+    
+    def test_rainflow_count_uses_parallel_scan(self, monkeypatch):
+        """Long signals are scanned in chunks with several Numba threads."""
+        np.random.seed(7)
+        signal = np.random.randn(20_000)
+        expected = rainflow_count(signal)
+        
+        monkeypatch.setattr(rainflow_module, '_PARALLEL_REVERSALS_MIN', 1000)
+        monkeypatch.setattr(rainflow_module, 'get_num_threads', lambda: 4)
+        calls = []
+        
+        def parallel(signal, n_chunks):
+            calls.append(n_chunks)
+            return _find_reversals_parallel(signal, n_chunks)
+        
+        monkeypatch.setattr(rainflow_module, '_find_reversals_parallel', parallel)
+        cycles = rainflow_count(signal)
+        
+        assert calls == [16]
+        np.testing.assert_array_equal(cycles, expected)
+    
+    @pytest.mark.parametrize('layer, expected_calls', [('workqueue', 0), ('tbb', 1)])
+    def test_parallel_scan_from_worker_thread(self, monkeypatch, layer, expected_calls):
+        """Worker threads only use the parallel scan with a threadsafe layer."""
+        np.random.seed(8)
+        signal = np.random.randn(20_000)
+        expected = rainflow_count(signal)
+        
+        monkeypatch.setattr(rainflow_module, '_PARALLEL_REVERSALS_MIN', 1000)
+        monkeypatch.setattr(rainflow_module, 'get_num_threads', lambda: 4)
+        monkeypatch.setattr(rainflow_module, 'threading_layer', lambda: layer)
+        calls = []
+        
+        def parallel(signal, n_chunks):
+            calls.append(n_chunks)
+            return _find_reversals_parallel(signal, n_chunks)
+        
+        monkeypatch.setattr(rainflow_module, '_find_reversals_parallel', parallel)
+        results = []
+        worker = threading.Thread(target=lambda: results.append(rainflow_count(signal)))
+        worker.start()
+        worker.join()
+        
+        assert len(calls) == expected_calls
+        np.testing.assert_array_equal(results[0], expected)
 
 
 class TestRainflowCount:
@@ -117,6 +245,410 @@ class TestRainflowCount:
         np.testing.assert_array_equal(cycles1['count'], cycles2['count'])
 
 
+class TestHysteresisGate:
+    """Test hysteresis (racetrack) gating before counting."""
+    
+    def test_filter_removes_small_reversals(self):
+        """Small excursions are removed from the turning points."""
+        signal = np.array([0.0, 10.0, 9.0, 10.5, 0.0, 0.5, -1.0, 8.0])
+        reversals, indices = _find_reversals(signal)
+        filtered, filtered_idx = _hysteresis_filter(reversals, indices, 2.0)
+        
+        np.testing.assert_array_equal(filtered, [0.0, 10.5, -1.0, 8.0])
+        np.testing.assert_array_equal(filtered_idx, [0, 3, 6, 7])
+    
+    def test_filter_within_band(self):
+        """Signal that never leaves the gate band keeps only its start."""
+        signal = np.array([0.0, 0.5, -0.5, 0.3, 0.0])
+        reversals, indices = _find_reversals(signal)
+        filtered, _ = _hysteresis_filter(reversals, indices, 5.0)
+        
+        assert len(filtered) == 1
+        assert len(rainflow_count(signal, gate=5.0)) == 0
+    
+    def test_filtered_ranges_above_gate(self):
+        """All consecutive retained turning points differ by at least gate."""
+        np.random.seed(0)
+        signal = np.random.randn(5000) * 20
+        reversals, indices = _find_reversals(signal)
+        filtered, _ = _hysteresis_filter(reversals, indices, 15.0)
+        
+        assert len(filtered) < len(reversals)
+        # The start of the history may lie inside the band of the first extreme
+        assert np.all(np.abs(np.diff(filtered[1:])) >= 15.0)
+    
+    def test_band_left_in_two_steps(self):
+        """The band is left on the running max - min, not the distance to the start."""
+        signal = np.array([0.0, -1.5, 1.5, -1.5, 1.5])
+        reversals, indices = _find_reversals(signal)
+        filtered, filtered_idx = _hysteresis_filter(reversals, indices, 2.0)
+        
+        np.testing.assert_array_equal(filtered_idx, [0, 1, 2, 3, 4])
+        
+        cycles = rainflow_count(signal, gate=2.0)
+        full = cycles[cycles['count'] == 1.0]
+        assert len(full) == 1
+        assert full['range'][0] == pytest.approx(3.0)
+        assert full['mean'][0] == pytest.approx(0.0)
+        post = rainflow_count(signal, gate=2.0, gate_mode='post')
+        np.testing.assert_array_equal(
+            full, post[post['count'] == 1.0].astype(full.dtype)
+        )
+    
+    def test_starts_mid_band(self):
+        """A history starting inside a large oscillation keeps its first extreme."""
+        signal = np.array([0.0, 1.0, -0.5, 0.8, -4.0, 4.0, -4.0, 4.0])
+        reversals, indices = _find_reversals(signal)
+        filtered, filtered_idx = _hysteresis_filter(reversals, indices, 3.0)
+        
+        # The small wiggles around the start are dropped, the 1.0 peak is
+        # the first extreme confirmed by the fall to -4.0
+        np.testing.assert_array_equal(filtered, [0.0, 1.0, -4.0, 4.0, -4.0, 4.0])
+        np.testing.assert_array_equal(filtered_idx, [0, 1, 4, 5, 6, 7])
+    
+    def test_noise_removed_before_counting(self):
+        """Noise below the gate does not reach the counting stage."""
+        np.random.seed(1)
+        base = np.tile([0.0, 100.0, 20.0, 80.0, 0.0], 20)
+        signal = np.repeat(base, 10) + np.random.uniform(-1, 1, len(base) * 10)
+        reversals, indices = _find_reversals(signal)
+        filtered, _ = _hysteresis_filter(reversals, indices, 10.0)
+        
+        # The noisy start is kept, followed by the noise minimum of the
+        # first plateau (the first valley)
+        assert len(filtered) == len(_find_reversals(base)[0]) + 1
+        
+        cycles = rainflow_count(signal, gate=10.0)
+        clean = rainflow_count(base)
+        # Up to the sub-gate cycle closed by the noisy start
+        assert np.sum(cycles['count']) == pytest.approx(np.sum(clean['count']), abs=0.5)
+        assert np.all(cycles['range'] >= 10.0)
+        assert np.max(cycles['range']) == pytest.approx(np.max(clean['range']), abs=2.0)
+    
+    def test_post_mode_matches_masking(self):
+        """gate_mode='post' keeps the original post-count semantics."""
+        np.random.seed(2)
+        signal = np.random.randn(1000) * 50
+        cycles_all = rainflow_count(signal)
+        cycles_post = rainflow_count(signal, gate=40.0, gate_mode='post')
+        
+        expected = cycles_all[cycles_all['range'] >= 40.0]
+        np.testing.assert_array_equal(cycles_post, expected)
+    
+    def test_invalid_gate_mode(self):
+        """Unknown gate mode raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid gate_mode"):
+            rainflow_count(np.array([0.0, 1.0, 0.0]), gate=0.5, gate_mode='before')
+
+
+class TestFloat32Mode:
+    """Test the native float32 counting path."""
+    
+    def test_float32_end_to_end(self):
+        """float32 mode counts natively and returns float32 fields."""
+        np.random.seed(42)
+        signal = (np.random.randn(5000) * 50 + 100).astype(np.float32)
+        
+        cycles = rainflow_count(signal, dtype=np.float32)
+        reference = rainflow_count(signal.astype(np.float64))
+        
+        assert cycles.dtype['range'] == np.float32
+        assert cycles.dtype['count'] == np.float32
+        np.testing.assert_array_equal(cycles['count'], reference['count'])
+        np.testing.assert_allclose(cycles['range'], reference['range'], rtol=1e-6)
+        np.testing.assert_allclose(cycles['mean'], reference['mean'], rtol=1e-6)
+    
+    def test_float64_input_downcast(self):
+        """float64 input is converted to the requested precision."""
+        np.random.seed(0)
+        signal = np.random.randn(1000) * 50
+        
+        cycles = rainflow_count(signal, gate=10.0, dtype='float32')
+        expected = rainflow_count(signal.astype(np.float32), gate=10.0, dtype='float32')
+        
+        np.testing.assert_array_equal(cycles, expected)
+    
+    def test_default_keeps_float64_output(self):
+        """Without dtype, float32 signals still give float64 fields."""
+        signal = np.array([0, 2, 1, 3, 0], dtype=np.float32)
+        assert rainflow_count(signal).dtype['range'] == np.float64
+    
+    def test_short_signal_dtype(self):
+        """Short signals return an empty array of the requested dtype."""
+        with pytest.warns(UserWarning):
+            cycles = rainflow_count(np.array([1.0], dtype=np.float32), dtype=np.float32)
+        assert len(cycles) == 0
+        assert cycles.dtype['range'] == np.float32
+        
+        # Two equal points: a single reversal reaches the core
+        cycles = rainflow_count(np.array([1.0, 1.0], dtype=np.float32), dtype=np.float32)
+        assert cycles.dtype['mean'] == np.float32
+    
+    def test_invalid_dtype(self):
+        """Non-float precisions raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid dtype"):
+            rainflow_count(np.array([0.0, 1.0, 0.0]), dtype=np.int32)
+
+
+class TestIntegerCounting:
+    """Test counting of raw integer ADC samples."""
+    
+    def test_matches_float_counting(self):
+        """Integer samples give exactly the cycles of their float64 values."""
+        np.random.seed(42)
+        for dtype in (np.int16, np.int32, np.uint16):
+            signal = np.random.randint(0, 30000, 5000).astype(dtype)
+            for kwargs in ({}, {'gate': 500.0}, {'gate': 500.0, 'gate_mode': 'post'}):
+                np.testing.assert_array_equal(
+                    rainflow_count(signal, **kwargs),
+                    rainflow_count(signal.astype(np.float64), **kwargs)
+                )
+    
+    def test_full_scale_range(self):
+        """int16 ranges spanning the full scale do not overflow."""
+        signal = np.array([-32768, 32767, -32768, 32767], dtype=np.int16)
+        
+        cycles = rainflow_count(signal)
+        
+        assert np.all(cycles['range'] == 65535.0)
+        assert np.all(cycles['mean'] == -0.5)
+    
+    def test_calibration_applied_to_output(self):
+        """Scale and offset convert the cycles to physical units."""
+        np.random.seed(0)
+        counts = np.random.randint(-2000, 2000, 3000).astype(np.int16)
+        raw = rainflow_count(counts)
+        
+        cycles = rainflow_count(counts, scale=-0.05, offset=12.0)
+        
+        np.testing.assert_allclose(cycles['range'], raw['range'] * 0.05)
+        np.testing.assert_allclose(cycles['mean'], raw['mean'] * -0.05 + 12.0)
+        np.testing.assert_array_equal(cycles['count'], raw['count'])
+    
+    def test_gate_in_output_units(self):
+        """The gate applies to calibrated ranges."""
+        np.random.seed(1)
+        counts = np.random.randint(-2000, 2000, 3000).astype(np.int16)
+        
+        cycles = rainflow_count(counts, scale=0.05, gate=30.0)
+        
+        assert np.all(cycles['range'] >= 30.0)
+        np.testing.assert_array_equal(
+            cycles['count'], rainflow_count(counts, gate=600.0)['count']
+        )
+    
+    def test_invalid_scale(self):
+        """A zero scale raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid scale"):
+            rainflow_count(np.array([0, 5, 0], dtype=np.int16), scale=0.0)
+
+
+class TestCycleIndices:
+    """Test start/end sample index tracking."""
+    
+    def test_same_cycles_as_default(self):
+        """Indexed counting gives exactly the default cycles."""
+        np.random.seed(42)
+        signal = np.random.randn(5000) * 50
+        for kwargs in ({}, {'gate': 20.0}, {'gate': 20.0, 'gate_mode': 'post'},
+                       {'remove_zeros': False}, {'dtype': np.float32}):
+            plain = rainflow_count(signal, **kwargs)
+            indexed = rainflow_count(signal, return_indices=True, **kwargs)
+            
+            for name in ('range', 'mean', 'count'):
+                np.testing.assert_array_equal(indexed[name], plain[name])
+            assert indexed['start'].dtype == np.int64
+    
+    def test_indices_locate_turning_points(self):
+        """Start and end samples hold the cycle extremes."""
+        np.random.seed(1)
+        signal = np.random.randn(3000) * 50
+        
+        cycles = rainflow_count(signal, return_indices=True)
+        
+        assert np.all(cycles['start'] < cycles['end'])
+        np.testing.assert_allclose(
+            np.abs(signal[cycles['end']] - signal[cycles['start']]), cycles['range']
+        )
+        np.testing.assert_allclose(
+            (signal[cycles['end']] + signal[cycles['start']]) / 2, cycles['mean']
+        )
+    
+    def test_simple_history(self):
+        """Known cycle locations in a short history."""
+        signal = np.array([0.0, 5.0, 1.0, 3.0, 2.0, 8.0, 0.0])
+        
+        cycles = rainflow_count(signal, return_indices=True)
+        
+        # 1-3 closes inside 5-2, which closes inside 0-8
+        assert list(zip(cycles['start'], cycles['end'])) == [(2, 3), (1, 4), (0, 5)]
+    
+    def test_integer_and_parallel(self):
+        """Indices are tracked for integer signals and in parallel."""
+        np.random.seed(3)
+        signal = np.random.randint(-1000, 1000, 2000).astype(np.int16)
+        
+        cycles = rainflow_count(signal, return_indices=True, scale=0.1)
+        np.testing.assert_allclose(
+            np.abs(signal[cycles['end']].astype(float) - signal[cycles['start']]) * 0.1,
+            cycles['range']
+        )
+        
+        results = rainflow_count_parallel([signal, signal[::-1]], n_jobs=1,
+                                          return_indices=True)
+        np.testing.assert_array_equal(results[0], rainflow_count(signal, return_indices=True))
+
+
+class TestPeriodicCounting:
+    """Test counting of endlessly repeated histories."""
+    
+    def test_matches_repeated_history(self):
+        """One period equals the cycles added by each further repetition."""
+        curve = EurocodeCategory.get_curve('71')
+        np.random.seed(42)
+        for _ in range(5):
+            signal = np.random.randn(500) * 60
+            damages = [calculate_damage(rainflow_count(np.tile(signal, k)), curve)
+                       for k in (3, 4)]
+            
+            cycles = rainflow_count(signal, periodic=True)
+            
+            assert np.all(cycles['count'] == 1.0)
+            assert calculate_damage(cycles, curve) == pytest.approx(
+                damages[1] - damages[0], rel=1e-10
+            )
+    
+    @pytest.mark.parametrize('gate', [None, 50.0])
+    def test_long_tiled_history_with_ties(self, gate):
+        """Equal values make the residue alternate; the mean period is returned."""
+        curve = EurocodeCategory.get_curve('36')
+        np.random.seed(3)
+        for _ in range(40):
+            signal = np.round(np.random.randn(np.random.randint(5, 60)) * 3) * 30
+            damages = [
+                calculate_damage(rainflow_count(np.tile(signal, k), gate=gate), curve)
+                for k in (100, 200)
+            ]
+            
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                cycles = rainflow_count(signal, periodic=True, gate=gate)
+            
+            assert calculate_damage(cycles, curve) == pytest.approx(
+                (damages[1] - damages[0]) / 100, rel=1e-9
+            )
+    
+    def test_residue_closed(self):
+        """The residue is closed into full cycles instead of half-cycles."""
+        signal = np.array([0.0, 10.0, 2.0, 8.0, -10.0, 3.0])
+        
+        cycles = rainflow_count(signal, periodic=True)
+        
+        assert np.any(rainflow_count(signal)['count'] == 0.5)
+        np.testing.assert_array_equal(np.sort(cycles['range']), [6.0, 10.0, 13.0])
+        np.testing.assert_array_equal(
+            np.sort(rainflow_count(np.tile(signal, 5))['range']),
+            np.repeat([6.0, 10.0, 13.0], 5)
+        )
+    
+    def test_options(self):
+        """Integer, float32 and gated periodic counting."""
+        np.random.seed(0)
+        counts = (np.random.randn(800) * 1000).astype(np.int16)
+        
+        np.testing.assert_array_equal(
+            rainflow_count(counts, periodic=True, scale=0.1),
+            rainflow_count(counts.astype(np.float64), periodic=True, scale=0.1)
+        )
+        assert rainflow_count(counts, periodic=True, dtype=np.float32)['range'].dtype == np.float32
+        
+        gated = rainflow_count(counts, periodic=True, gate=300.0)
+        assert np.all(gated['range'] >= 300.0)
+        
+        with pytest.raises(ValueError):
+            rainflow_count(counts, periodic=True, return_indices=True)
+
+
+class TestBlockSequence:
+    """Test counting of repeated block sequences."""
+    
+    def _blocks(self):
+        np.random.seed(7)
+        return [np.random.randn(200) * 60, np.random.randn(150) * 40 + 10,
+                np.random.randn(5) * 100]
+    
+    def test_matches_concatenation(self):
+        """Sequence counting equals counting the concatenated history."""
+        curve = EurocodeCategory.get_curve('71')
+        blocks = self._blocks()
+        for repetitions in ([5, 3, 1], [1, 1, 1], [2, 7, 3], [1, 0, 4]):
+            history = np.concatenate([np.tile(b, n) for b, n in zip(blocks, repetitions)])
+            reference = rainflow_count(history)
+            
+            cycles = count_block_sequence(blocks, repetitions)
+            
+            assert cycles['count'].sum() == reference['count'].sum()
+            assert calculate_damage(cycles, curve) == pytest.approx(
+                calculate_damage(reference, curve), rel=1e-12
+            )
+    
+    def test_same_histogram(self):
+        """Ranges and counts match the concatenated history."""
+        blocks = self._blocks()
+        history = np.concatenate([np.tile(blocks[0], 4), np.tile(blocks[1], 3)])
+        reference = rainflow_count(history)
+        
+        cycles = count_block_sequence(blocks[:2], [4, 3])
+        
+        edges = np.linspace(0, reference['range'].max() + 1, 30)
+        np.testing.assert_allclose(
+            np.histogram(cycles['range'], edges, weights=cycles['count'])[0],
+            np.histogram(reference['range'], edges, weights=reference['count'])[0]
+        )
+    
+    def test_many_repetitions(self):
+        """Cost does not grow with the number of repetitions."""
+        curve = EurocodeCategory.get_curve('71')
+        blocks = self._blocks()[:2]
+        
+        small = count_block_sequence(blocks, [10, 10])
+        large = count_block_sequence(blocks, [10_000_000, 10])
+        
+        assert len(large) <= len(small)
+        assert large['count'].sum() > 1e8
+        
+        steady = count_block_sequence(blocks[:1], [3])['count'].sum() - \
+            count_block_sequence(blocks[:1], [2])['count'].sum()
+        assert large['count'].sum() - small['count'].sum() == pytest.approx(
+            steady * (10_000_000 - 10)
+        )
+        assert calculate_damage(large, curve) > calculate_damage(small, curve)
+    
+    def test_periodic_sequence(self):
+        """A periodic sequence gives the damage added per repetition."""
+        curve = EurocodeCategory.get_curve('71')
+        blocks = self._blocks()
+        repetitions = [2, 3, 1]
+        history = np.concatenate([np.tile(b, n) for b, n in zip(blocks, repetitions)])
+        damages = [calculate_damage(rainflow_count(np.tile(history, k)), curve) for k in (3, 4)]
+        
+        cycles = count_block_sequence(blocks, repetitions, periodic=True)
+        
+        assert calculate_damage(cycles, curve) == pytest.approx(damages[1] - damages[0], rel=1e-10)
+        assert calculate_damage(cycles, curve) == pytest.approx(
+            calculate_damage(rainflow_count(history, periodic=True), curve), rel=1e-10
+        )
+    
+    def test_invalid_input(self):
+        """Mismatched lengths and negative repetitions are rejected."""
+        blocks = self._blocks()
+        with pytest.raises(ValueError):
+            count_block_sequence(blocks, [1, 2])
+        with pytest.raises(ValueError):
+            count_block_sequence(blocks, [1, -1, 2])
+        assert len(count_block_sequence(blocks, [0, 0, 0])) == 0
+
+
 class TestRainflowParallel:
     """Test parallel rainflow counting."""
     
@@ -136,6 +668,19 @@ class TestRainflowParallel:
         for cs, cp in zip(cycles_serial, cycles_parallel):
             np.testing.assert_array_almost_equal(cs['range'], cp['range'])
     
+    def test_threading_backend(self):
+        """Threading backend gives the same results as serial counting."""
+        np.random.seed(7)
+        signals = [np.random.randn(500) for _ in range(5)]
+        
+        cycles_serial = [rainflow_count(sig, gate=0.5) for sig in signals]
+        cycles_threads = rainflow_count_parallel(
+            signals, gate=0.5, n_jobs=2, backend='threading'
+        )
+        
+        for cs, ct in zip(cycles_serial, cycles_threads):
+            np.testing.assert_array_equal(cs, ct)
+    
     def test_combine_cycles(self):
         """Test combining multiple cycle arrays."""
         cycles1 = np.array([(10, 5, 1.0), (20, 10, 0.5)],
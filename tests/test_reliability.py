@@ -0,0 +1,146 @@
+"""Tests for Monte Carlo fatigue reliability."""
+
+import numpy as np
+import pytest
+from scipy.special import ndtr
+from openrainflow.damage import calculate_damage_from_histogram
+from openrainflow.eurocode import EurocodeCategory, FatigueCurve
+from openrainflow.reliability import (
+    sample_parameters,
+    sampled_damage,
+    failure_probability
+)
+
+
+def _histogram():
+    """Exponential-like stress range histogram."""
+    ranges = np.linspace(5.0, 200.0, 64)
+    return ranges, 1e5 * np.exp(-ranges / 20.0)
+
+
+class TestSampleParameters:
+    """Test parameter sampling."""
+    
+    def test_reproducible(self):
+        """The same seed gives the same samples."""
+        curve = EurocodeCategory.get_curve('71')
+        a = sample_parameters(curve, 1000, strength_cov=0.2, load_cov=0.1, seed=5)
+        b = sample_parameters(curve, 1000, strength_cov=0.2, load_cov=0.1, seed=5)
+        
+        for key in a:
+            np.testing.assert_array_equal(a[key], b[key])
+    
+    def test_lognormal_moments(self):
+        """Lognormal samples have the requested median and CoV."""
+        curve = EurocodeCategory.get_curve('71')
+        samples = sample_parameters(curve, 200_000, strength_cov=0.25,
+                                    strength_median=90.0, seed=0)
+        
+        strength = samples['delta_sigma_c']
+        assert np.median(strength) == pytest.approx(90.0, rel=0.01)
+        assert strength.std() / strength.mean() == pytest.approx(0.25, rel=0.02)
+        np.testing.assert_array_equal(samples['m1'], 3.0)
+        np.testing.assert_array_equal(samples['load'], 1.0)
+    
+    def test_invalid_parameters(self):
+        """Negative scatter and empty samples are rejected."""
+        curve = EurocodeCategory.get_curve('71')
+        
+        with pytest.raises(ValueError):
+            sample_parameters(curve, 0)
+        with pytest.raises(ValueError):
+            sample_parameters(curve, 10, load_cov=-0.1)
+
+
+class TestSampledDamage:
+    """Test the per-sample damage kernel."""
+    
+    @pytest.mark.parametrize('use_cutoff', [True, False])
+    def test_matches_histogram_damage(self, use_cutoff):
+        """Each sample equals calculate_damage_from_histogram on its curve."""
+        ranges, counts = _histogram()
+        curve = EurocodeCategory.get_curve('71')
+        samples = sample_parameters(curve, 50, strength_cov=0.2, slope_std=0.2,
+                                    load_cov=0.1, seed=1)
+        
+        damage = sampled_damage(ranges, counts, curve, samples, use_cutoff=use_cutoff)
+        
+        expected = [
+            calculate_damage_from_histogram(
+                ranges, counts,
+                FatigueCurve('s', samples['delta_sigma_c'][k],
+                             m1=samples['m1'][k], m2=samples['m2'][k]),
+                use_cutoff=use_cutoff,
+                partial_safety_factor=samples['load'][k]
+            )
+            for k in range(50)
+        ]
+        np.testing.assert_allclose(damage, expected, rtol=1e-12)
+    
+    def test_explicit_cafl(self):
+        """An explicit CAFL is kept for the nominal sample."""
+        ranges, counts = _histogram()
+        curve = FatigueCurve('c', 71.0, delta_sigma_L=40.0)
+        samples = sample_parameters(curve, 1)
+        
+        damage = sampled_damage(ranges, counts, curve, samples)
+        assert damage[0] == pytest.approx(
+            calculate_damage_from_histogram(ranges, counts, curve), rel=1e-12
+        )
+
+
+class TestFailureProbability:
+    """Test Monte Carlo failure probabilities."""
+    
+    def test_analytical_strength_scatter(self):
+        """With strength scatter only, Pf matches the lognormal closed form."""
+        curve = FatigueCurve('t', 100.0, m1=3.0, m2=3.0)
+        stress, n = 150.0, 1e6
+        cov = 0.3
+        
+        result = failure_probability(
+            np.array([stress]), np.array([n]), curve, n_samples=400_000,
+            strength_cov=cov, use_cutoff=False, seed=3
+        )
+        
+        # Failure when delta_sigma_c <= stress * (n / N_ref)^(1/m)
+        critical = stress * (n / 2e6) ** (1.0 / 3.0)
+        sigma = np.sqrt(np.log1p(cov ** 2))
+        expected = ndtr(np.log(critical / 100.0) / sigma)
+        
+        assert result['probability_of_failure'] == pytest.approx(
+            expected, abs=4 * result['standard_error']
+        )
+        assert result['reliability_index'] == pytest.approx(
+            np.log(100.0 / critical) / sigma, abs=0.01
+        )
+    
+    def test_deterministic(self):
+        """Without scatter, failure is all or nothing."""
+        ranges, counts = _histogram()
+        curve = EurocodeCategory.get_curve('71')
+        damage = calculate_damage_from_histogram(ranges, counts, curve)
+        
+        safe = failure_probability(ranges, counts, curve, n_samples=100,
+                                   design_life=0.5 / damage)
+        failed = failure_probability(ranges, counts, curve, n_samples=100,
+                                     design_life=2.0 / damage)
+        
+        assert safe['probability_of_failure'] == 0.0
+        assert failed['probability_of_failure'] == 1.0
+    
+    def test_seed(self):
+        """Results are reproducible with a seed."""
+        ranges, counts = _histogram()
+        curve = EurocodeCategory.get_curve('71')
+        kwargs = dict(n_samples=10_000, design_life=1e3, strength_cov=0.3,
+                      miner_cov=0.3, load_cov=0.1, seed=11)
+        
+        a = failure_probability(ranges, counts, curve, **kwargs)
+        b = failure_probability(ranges, counts, curve, **kwargs)
+        assert a['n_failures'] == b['n_failures']
+        np.testing.assert_array_equal(a['damage'], b['damage'])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,128 @@
+"""Tests for spectral fatigue damage estimators."""
+
+from math import gamma
+
+import numpy as np
+import pytest
+from scipy.signal import butter, lfilter
+from openrainflow import rainflow_count, calculate_damage
+from openrainflow.eurocode import EurocodeCategory, FatigueCurve
+from openrainflow.spectral import (
+    METHODS,
+    spectral_moments,
+    spectral_damage,
+    spectral_damage_from_signal
+)
+
+
+def _band_signal(n, fs, low, high, seed=0):
+    """Gaussian noise filtered in a frequency band."""
+    np.random.seed(seed)
+    b, a = butter(4, [low / (fs / 2), high / (fs / 2)], 'band')
+    signal = lfilter(b, a, np.random.randn(n))
+    return signal * 60.0 / signal.std()
+
+
+class TestSpectralMoments:
+    """Test spectral moments."""
+    
+    def test_flat_band(self):
+        """Moments of a flat band match the analytical values."""
+        f = np.linspace(0.0, 10.0, 10001)
+        psd = np.where(f <= 10.0, 2.0, 0.0)
+        
+        m0, m1, m2, m4 = spectral_moments(f, psd)
+        assert m0 == pytest.approx(20.0)
+        assert m1 == pytest.approx(100.0)
+        assert m2 == pytest.approx(2.0 * 1000.0 / 3.0, rel=1e-6)
+        assert m4 == pytest.approx(2.0 * 1e5 / 5.0, rel=1e-6)
+    
+    def test_invalid_frequencies(self):
+        """Decreasing frequencies and shape mismatches are rejected."""
+        with pytest.raises(ValueError):
+            spectral_moments(np.array([2.0, 1.0]), np.ones(2))
+        with pytest.raises(ValueError):
+            spectral_moments(np.array([1.0, 2.0]), np.ones(3))
+
+
+class TestSpectralDamage:
+    """Test PSD-based damage estimators."""
+    
+    def test_narrow_band_analytical(self):
+        """Narrow-band damage matches the closed form for a single slope."""
+        curve = FatigueCurve(name='Test', delta_sigma_c=100.0, m1=3.0, m2=3.0)
+        f = np.linspace(0.0, 100.0, 2001)
+        psd = np.where((f > 40.0) & (f < 60.0), 1.0, 0.0)
+        m0, _, m2, _ = spectral_moments(f, psd)
+        
+        expected = (np.sqrt(m2 / m0) * 3600.0
+                    * (2.0 * np.sqrt(2.0 * m0)) ** 3 * gamma(2.5) / curve.C1)
+        damage = spectral_damage(f, psd, curve, 3600.0, method='narrow_band', use_cutoff=False)
+        
+        assert damage == pytest.approx(expected, rel=1e-10)
+    
+    def test_narrow_band_signal_matches_rainflow(self):
+        """All methods agree with rainflow counting on a narrow-band signal."""
+        fs = 1000.0
+        signal = _band_signal(400_000, fs, 48.0, 52.0)
+        curve = EurocodeCategory.get_curve('71')
+        
+        reference = calculate_damage(rainflow_count(signal), curve)
+        for method in METHODS:
+            damage = spectral_damage_from_signal(signal, fs, curve, method=method)
+            assert damage == pytest.approx(reference, rel=0.05)
+    
+    def test_narrow_band_is_conservative(self):
+        """Dirlik and Tovo-Benasciutti stay below the narrow-band bound."""
+        fs = 1000.0
+        signal = _band_signal(200_000, fs, 2.0, 50.0)
+        curve = EurocodeCategory.get_curve('71')
+        
+        narrow = spectral_damage_from_signal(signal, fs, curve, method='narrow_band')
+        assert spectral_damage_from_signal(signal, fs, curve, method='dirlik') < narrow
+        assert spectral_damage_from_signal(signal, fs, curve, method='tovo_benasciutti') < narrow
+    
+    def test_many_locations(self):
+        """A 2D PSD gives the same damage as one call per location."""
+        np.random.seed(7)
+        f = np.linspace(0.0, 100.0, 257)
+        psd = np.exp(-((f - 20.0) / 5.0) ** 2) * np.random.uniform(10, 500, (20, 1))
+        psd += np.exp(-((f - 70.0) / 5.0) ** 2) * np.random.uniform(1, 50, (20, 1))
+        curve = EurocodeCategory.get_curve('90')
+        
+        for method in METHODS:
+            damages = spectral_damage(f, psd, curve, 3600.0, method=method,
+                                      partial_safety_factor=1.25)
+            expected = [
+                spectral_damage(f, row, curve, 3600.0, method=method,
+                                partial_safety_factor=1.25)
+                for row in psd
+            ]
+            np.testing.assert_allclose(damages, expected, rtol=1e-12)
+    
+    def test_cutoff(self):
+        """A process far below the CAFL causes no damage with the cut-off."""
+        curve = EurocodeCategory.get_curve('71')
+        f = np.linspace(0.0, 100.0, 201)
+        psd = np.where((f > 40.0) & (f < 60.0), 1e-6, 0.0)
+        
+        assert spectral_damage(f, psd, curve, 3600.0) == pytest.approx(0.0, abs=1e-300)
+        assert spectral_damage(f, psd, curve, 3600.0, use_cutoff=False) > 0.0
+    
+    def test_zero_psd(self):
+        """A zero PSD gives zero damage."""
+        f = np.linspace(0.0, 100.0, 101)
+        curve = EurocodeCategory.get_curve('71')
+        
+        assert spectral_damage(f, np.zeros(101), curve, 3600.0) == 0.0
+    
+    def test_invalid_method(self):
+        """Unknown methods are rejected."""
+        f = np.linspace(0.0, 100.0, 101)
+        with pytest.raises(ValueError):
+            spectral_damage(f, np.ones(101), EurocodeCategory.get_curve('71'), 1.0,
+                            method='rayleigh')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
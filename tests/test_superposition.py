@@ -0,0 +1,90 @@
+"""Tests for fatigue maps from unit-load superposition."""
+
+import numpy as np
+import pytest
+from openrainflow import rainflow_count, calculate_damage
+from openrainflow.eurocode import EurocodeCategory
+from openrainflow.superposition import node_history, superposition_damage
+
+
+def _model(n_nodes=40, n_samples=6000, n_channels=4, seed=0):
+    """Random unit-load stresses and correlated load channels."""
+    np.random.seed(seed)
+    loads = (np.cumsum(np.random.randn(n_samples, n_channels), axis=0) * 0.2
+             + np.random.randn(n_samples, n_channels))
+    coefficients = np.random.randn(n_nodes, n_channels) * 10
+    return coefficients, loads
+
+
+class TestSuperpositionDamage:
+    """Test the superposition damage engine."""
+    
+    @pytest.mark.parametrize('block_size', [1, 7, 4096])
+    def test_matches_per_node_counting(self, block_size):
+        """Damage equals counting each node history, for any block size."""
+        coefficients, loads = _model()
+        curve = EurocodeCategory.get_curve('71')
+        
+        damage = superposition_damage(coefficients, loads, curve, block_size=block_size)
+        
+        expected = [
+            calculate_damage(rainflow_count(node_history(coefficients, loads, j)), curve)
+            for j in range(len(coefficients))
+        ]
+        np.testing.assert_allclose(damage, expected, rtol=1e-10)
+    
+    def test_curves_and_factors_per_node(self):
+        """Each node uses its own curve and partial safety factor."""
+        coefficients, loads = _model(n_nodes=12)
+        curves = [EurocodeCategory.get_curve(c) for c in ('36', '71', '112')]
+        curve_index = np.arange(12) % 3
+        psf = np.linspace(1.0, 1.35, 12)
+        
+        damage = superposition_damage(coefficients, loads, curves,
+                                      curve_index=curve_index, partial_safety_factor=psf)
+        
+        for j in range(12):
+            cycles = rainflow_count(node_history(coefficients, loads, j))
+            assert damage[j] == pytest.approx(
+                calculate_damage(cycles, curves[curve_index[j]],
+                                 partial_safety_factor=psf[j]),
+                rel=1e-10
+            )
+    
+    def test_single_channel_and_unloaded_node(self):
+        """1D loads are one channel; a node with zero coefficients is undamaged."""
+        np.random.seed(1)
+        loads = np.random.randn(3000) * 50
+        coefficients = np.array([1.0, 0.0, 2.0])
+        curve = EurocodeCategory.get_curve('71')
+        
+        damage = superposition_damage(coefficients, loads, curve)
+        
+        assert damage[0] == pytest.approx(calculate_damage(rainflow_count(loads), curve))
+        assert damage[1] == 0.0
+        assert damage[2] > damage[0]
+    
+    def test_short_history(self):
+        """Histories shorter than two samples give zero damage."""
+        damage = superposition_damage(np.ones((3, 2)), np.ones((1, 2)),
+                                      EurocodeCategory.get_curve('71'))
+        np.testing.assert_array_equal(damage, 0.0)
+    
+    def test_invalid_input(self):
+        """Mismatched shapes and curve indices are rejected."""
+        coefficients, loads = _model(n_nodes=5)
+        curve = EurocodeCategory.get_curve('71')
+        
+        with pytest.raises(ValueError):
+            superposition_damage(coefficients[:, :2], loads, curve)
+        with pytest.raises(ValueError):
+            superposition_damage(coefficients, loads, [curve, curve])
+        with pytest.raises(ValueError):
+            superposition_damage(coefficients, loads, curve, block_size=0)
+        with pytest.raises(ValueError):
+            superposition_damage(coefficients, loads, curve,
+                                 partial_safety_factor=np.ones(3))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -239,6 +239,44 @@ class TestPlotSignalWithCycles:
         assert fig is not None
         
         plt.close(fig)
+    
+    def test_signal_plot_locates_cycles(self, sample_signal):
+        """The largest cycles are drawn between their turning points."""
+        from openrainflow import rainflow_count
+        from openrainflow.visualization import plot_signal_with_cycles
+        
+        cycles = rainflow_count(sample_signal, return_indices=True)
+        fig = plot_signal_with_cycles(sample_signal, cycles, max_cycles_to_show=3)
+        
+        # Signal, then one segment and one marker pair per cycle
+        lines = fig.axes[0].get_lines()
+        assert len(lines) == 1 + 2 * 3
+        
+        largest = cycles[np.argmax(cycles['range'])]
+        x, y = lines[1].get_data()
+        assert x[0] == largest['start'] and x[-1] == largest['end']
+        np.testing.assert_array_equal(y, sample_signal[largest['start']:largest['end'] + 1])
+        
+        plt.close(fig)
+    
+    def test_signal_plot_recounts_with_kwargs(self, sample_signal):
+        """Cycles without indices are located with the same counting options."""
+        from openrainflow import rainflow_count
+        from openrainflow.visualization import plot_signal_with_cycles
+        
+        gate = 0.5 * np.ptp(sample_signal)
+        cycles = rainflow_count(sample_signal, gate=gate, gate_mode='hysteresis')
+        fig = plot_signal_with_cycles(
+            sample_signal, cycles, max_cycles_to_show=len(cycles),
+            gate=gate, gate_mode='hysteresis'
+        )
+        
+        labels = [line.get_label() for line in fig.axes[0].get_lines()[1::2]]
+        expected = [f'Cycle {rank + 1}: {r:.1f} MPa'
+                    for rank, r in enumerate(np.sort(cycles['range'])[::-1])]
+        assert labels == expected
+        
+        plt.close(fig)
 
 
 class TestPlotIntegration: